@@ -4,3 +4,8 @@ from globals.consts.const_strings import ConstStrings
 class ConstCollections:
     LOG_NAMES_WITH_FILE = [ConstStrings.LOG_NAME_DEBUG]
     LOG_NAMES_WITH_CONSOLE = [ConstStrings.LOG_NAME_DEBUG]
+
+    # Built-in algorithm types as "module:attribute" constructors, resolved like plugin entry points
+    BUILTIN_ALGORITHMS = {
+        "motion_detection": "infrastructure.factories.algorithm_factory:AlgorithmFactory.create_motion_detection",
+    }
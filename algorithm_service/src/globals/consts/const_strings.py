@@ -24,9 +24,17 @@ class ConstStrings:
 
     # ? ZMQ Resources
     EXAMPLE_RESOURCE = "example_resource"
+    HEATMAP_RESOURCE = "heatmap"
 
     # ? ZMQ Operations
     EXAMPLE_OPERATION = "example_operation"
+    GET_HEATMAP_OPERATION = "get_heatmap"
+    RESET_HEATMAP_OPERATION = "reset_heatmap"
+
+    # ? Heatmap request fields and errors
+    VIDEO_ID_IDENTIFIER = "video_id"
+    HEATMAP_NOT_FOUND_ERROR_MESSAGE = "no heatmap for this video"
+    ERROR_HEATMAP_FUNCTION = "error_in_heatmap_function"
 
     # ? Kafka Configuration
     GLOBAL_CONFIG_PATH = "/app/config/configuration.xml"
@@ -56,9 +64,21 @@ class ConstStrings:
     ENABLE_IMSHOW_ENV = "ENABLE_IMSHOW"
     DISPLAY_ENV = "DISPLAY"
 
+    # GUI preview image per camera (1-based index), carrying the frame trace in a JPEG comment
+    PREVIEW_IMAGE_PATH = "/app/logs/stream_{}.jpg"
+    # Background model snapshot per camera, restored on the next start
+    BACKGROUND_SNAPSHOT_PATH = "/app/records/background/camera_{}.png"
+    # Activity heatmap per camera, restored on the next start and served over ZMQ
+    HEATMAP_SNAPSHOT_PATH = "/app/records/heatmap/camera_{}.npz"
+
     # Shared memory paths and pipeline templates (aligned with video manager)
     SHARED_MEMORY_CAM_PATH = "/dev/shm/cam{camera_id}"
     SHARED_MEMORY_PATH = "/dev/shm/"
+    SHARED_MEMORY_RING_PATH = "/dev/shm/cam{camera_id}.ring"
+    # ZMQ IPC endpoint on which a ring's writer wakes its readers
+    SHARED_MEMORY_RING_SIGNAL_ENDPOINT = "ipc://{ring_path}.signal"
+    # Input and output frame of a camera whose algorithm runs in an isolated process
+    ISOLATED_FRAMES_PATH = "/dev/shm/isolated_cam{camera_id}.frames"
     SHARED_MEMORY_PIPELINE = (
         "appsrc is-live=true do-timestamp=true ! "
         "video/x-raw,format=BGR,width={frame_width},height={frame_height},framerate={frame_rate}/1 ! "
@@ -74,6 +94,24 @@ class ConstStrings:
     )
 
 
+    # Execution mode and motion engine environment variables
+    EXECUTION_MODE_ENV = "EXECUTION_MODE"
+    CAMERAS_PER_PROCESS_ENV = "CAMERAS_PER_PROCESS"
+    MOTION_ENGINE_ENV = "MOTION_ENGINE"
+
+    # Algorithm plugins: entry point group of installed packages, and extra modules to import
+    ALGORITHM_ENTRY_POINT_GROUP = "algorithm_service.algorithms"
+    ALGORITHM_PLUGINS_ENV = "ALGORITHM_PLUGINS"
+
+    # Detection events: enabling environment variable and Kafka topic (must be listed in the configuration)
+    DETECTION_EVENTS_ENV = "DETECTION_EVENTS"
+    DETECTIONS_TOPIC = "motion_detections"
+    SEGMENTS_TOPIC = "motion_segments"
+
+    # Worker process stats message keys
+    WORKER_INDEX_KEY = "worker_index"
+    WORKER_PID_KEY = "pid"
+    WORKER_CAMERAS_KEY = "cameras"
 
     MOTION_STARTING = "Motion detection enabled"
     MOTION_REGION_COUNT = "Video {}: motion regions: {}"
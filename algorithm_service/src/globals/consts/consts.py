@@ -14,6 +14,150 @@ class Consts:
     MOTION_BG_HISTORY = 300
     MOTION_BG_VAR_THRESHOLD = 32
     MOTION_DETECT_SHADOWS = True
+    # Background model per camera ("background_model"): mog2, knn, running_average or median
+    MOTION_BACKGROUND_MODEL = "mog2"
+    MOTION_BG_KNN_DIST2_THRESHOLD = 400.0
+    # Foreground threshold (grey levels) of the NumPy models, and the median model's step per frame
+    MOTION_BG_DIFF_THRESHOLD = 25
+    MOTION_BG_MEDIAN_STEP = 1
+    # Warm start: re-seed the background from the median of bootstrap frames sampled every stride
+    # frames (0 = no bootstrap), and snapshot it periodically and at release so a restart can restore it.
+    # Both are off by default; cameras opt in with "bootstrap_frames" (e.g. 15) and "background_snapshots"
+    MOTION_BOOTSTRAP_FRAMES = 0
+    MOTION_BOOTSTRAP_STRIDE = 8
+    MOTION_SNAPSHOT_INTERVAL_SECONDS = 300
+    MOTION_BACKGROUND_SNAPSHOTS = False
     MOTION_MIN_AREA = 1000
     MOTION_DILATE_ITER = 2
     MOTION_KERNEL_SIZE = 3
+    # Downscaled grayscale analysis size for MotionDetectionAlgorithm ("analysis_width"/"analysis_height"; 0 = full frame).
+    # Off by default; cameras opt in from their algorithm_config, e.g. 320 x 180
+    MOTION_ANALYSIS_WIDTH = 0
+    MOTION_ANALYSIS_HEIGHT = 0
+    # Output frames rotated per camera by MotionDetectionAlgorithm / the batched engine when they have to draw on a copy
+    MOTION_OUTPUT_BUFFERS = 3
+    # Measure bytes allocated per processed frame with tracemalloc ("report_allocations"); process-wide,
+    # so only the first camera of each process that enables it reports
+    MOTION_REPORT_ALLOCATIONS = False
+    # Optional thumbnail change gate in front of MOG2 ("change_gate"); threshold is the mean absolute
+    # thumbnail difference (0-255) below which a frame skips the pipeline
+    MOTION_CHANGE_GATE = False
+    MOTION_GATE_WIDTH = 32
+    MOTION_GATE_HEIGHT = 18
+    MOTION_GATE_THRESHOLD = 1.5
+    # Let one frame through after this many consecutive skips so the background keeps adapting
+    MOTION_GATE_REFRESH_FRAMES = 30
+    # Merge overlapping regions, or regions within this many frame pixels of each other ("merge_boxes")
+    MOTION_MERGE_BOXES = False
+    MOTION_MERGE_DISTANCE = 0
+    # Track motion regions across frames ("tracking"): IoU needed to continue a track, centroid
+    # fallback distance in frame pixels (0 = IoU only), frames a track may go unseen before it ends,
+    # matches before a track is confirmed and gets an ID, and the weight of the newest velocity step
+    MOTION_TRACKING = False
+    TRACK_IOU_THRESHOLD = 0.3
+    TRACK_MAX_DISTANCE = 50.0
+    TRACK_MAX_MISSED = 10
+    TRACK_MIN_HITS = 3
+    TRACK_VELOCITY_SMOOTHING = 0.5
+
+    # Motion engine ("per_camera": one MotionDetectionAlgorithm thread per camera, "batched": one
+    # BatchedMotionDetectionEngine over all cameras of the manager)
+    MOTION_ENGINE = "per_camera"
+    # Batched engine: analysis size every frame is scaled to, and background difference threshold (0-255)
+    BATCH_ANALYSIS_WIDTH = 640
+    BATCH_ANALYSIS_HEIGHT = 360
+    BATCH_DIFF_THRESHOLD = 25
+
+    # Shared memory transport ("ring" or "gstreamer"), overridable per video via "transport"
+    SHM_TRANSPORT = "ring"
+    # Native frame ring buffer layout (must match between video manager and algorithm service)
+    SHM_RING_MAGIC = 0x474E5246  # "FRNG"
+    # Readers reject rings of any other version, so the video manager and the algorithm service must be
+    # deployed together whenever it changes. Version 3: frame tracing fields in the slot header, and the
+    # ring header's end-of-stream flags word (former padding)
+    SHM_RING_VERSION = 3
+    SHM_RING_ALIGNMENT = 64
+    # Readers hold zero-copy views, so a frame must be used before this many newer frames are written
+    SHM_RING_SLOT_COUNT = 8
+    SHM_RING_MAX_LEVELS = 4
+    # Wake ring readers over a ZMQ IPC socket next to the ring instead of having them sleep-poll it;
+    # readers still re-check the ring this often in case a wakeup was missed
+    SHM_RING_SIGNAL = True
+    SHM_RING_SIGNAL_RECHECK_SECONDS = 0.1
+    # Pyramid level a reader subscribes to (0 = full frame), overridable per video via "pyramid_level".
+    # The video manager must publish that level ("pyramid_scales"); otherwise the smallest published one is read
+    PYRAMID_LEVEL = 0
+    # Ring reader: how long read_frame waits for a new frame
+    SHM_RING_READ_TIMEOUT_SECONDS = 1.0
+
+    # Latest processed frame per camera, written as JPEG for the GUI
+    PREVIEW_JPEG_QUALITY = 85
+
+    # Upper bounds (ms) of the per-stage frame latency histogram buckets
+    LATENCY_HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    # Execution mode ("thread" or "process") and camera grouping for process mode
+    EXECUTION_MODE = "thread"
+    CAMERAS_PER_PROCESS = 1
+    PROCESS_START_METHOD = "spawn"
+    PROCESS_MONITOR_INTERVAL_SECONDS = 0.5
+    PROCESS_STATS_INTERVAL_SECONDS = 5
+    PROCESS_JOIN_TIMEOUT_SECONDS = 5
+    PROCESS_STABLE_SECONDS = 60
+    PROCESS_MAX_RESTARTS = 10
+    PROCESS_RESTART_BASE_BACKOFF_SECONDS = 1
+    PROCESS_RESTART_MAX_BACKOFF_SECONDS = 30
+
+    # Per-camera idle handling: backoff while stalled, reconnect after a long stall
+    CAMERA_IDLE_BASE_SECONDS = 0.05
+    CAMERA_IDLE_MAX_SECONDS = 1.0
+    CAMERA_STALL_RECONNECT_SECONDS = 10
+    CAMERA_RECONNECT_BASE_SECONDS = 1
+    CAMERA_RECONNECT_MAX_SECONDS = 30
+    CAMERA_RECONNECT_JITTER = 0.2
+    # 0 retries forever; otherwise the camera is marked finished after this many failed reconnects.
+    # Cameras whose ring reports end of stream (a file source ended) are marked finished regardless
+    CAMERA_MAX_RECONNECT_ATTEMPTS = 0
+
+    # Activity-adaptive analysis rate ("adaptive_rate" in algorithm_config): full rate while there is
+    # motion, idle rate after this many quiet seconds. ADAPTIVE_ACTIVE_FPS 0 analyses every frame.
+    ADAPTIVE_RATE = False
+    ADAPTIVE_ACTIVE_FPS = 0
+    ADAPTIVE_IDLE_FPS = 2.0
+    ADAPTIVE_QUIET_SECONDS = 10.0
+
+    # Per-camera processing budget ("frame_budget_ms" in algorithm_config, 0 = off). More than
+    # DEGRADE_RATIO overruns in a window degrades the camera (skip frames, then isolate the algorithm),
+    # fewer than RECOVER_RATIO steps back; an isolated algorithm process stuck this long is killed and restarted
+    FRAME_BUDGET_MS = 0
+    BUDGET_WINDOW_FRAMES = 30
+    BUDGET_DEGRADE_RATIO = 0.5
+    BUDGET_RECOVER_RATIO = 0.1
+    BUDGET_MAX_SKIP_LEVEL = 2
+    BUDGET_WATCHDOG_SECONDS = 5.0
+
+    # Decaying motion activity heatmap per camera ("heatmap"): cell size in analysis pixels, half-life of
+    # the accumulated activity, and how often it is saved to disk (the file served for worker processes).
+    # Off by default; cameras opt in with "heatmap": true
+    MOTION_HEATMAP = False
+    HEATMAP_BLOCK_SIZE = 8
+    HEATMAP_HALF_LIFE_SECONDS = 3600.0
+    HEATMAP_SNAPSHOT_INTERVAL_SECONDS = 60
+
+    # Motion segments per camera and zone ("motion_segments"): a segment starts after ON_FRAMES
+    # consecutive frames with motion once it has lasted MIN_SECONDS, ends after OFF_SECONDS without
+    # motion, and reports an update every UPDATE_SECONDS while it lasts (0 = no updates). Off by default;
+    # cameras opt in with "motion_segments": true
+    MOTION_SEGMENTS = False
+    SEGMENT_ON_FRAMES = 3
+    SEGMENT_OFF_SECONDS = 2.0
+    SEGMENT_MIN_SECONDS = 0.5
+    SEGMENT_UPDATE_SECONDS = 10.0
+
+    # Structured detection events to Kafka (DETECTION_EVENTS=1). Events wait in a bounded buffer (the
+    # oldest are dropped when full) and are sent once BATCH_SIZE are queued or the oldest has waited
+    # LINGER_MS, grouped into one keyed message per camera
+    DETECTION_EVENTS = False
+    DETECTION_BUFFER_SIZE = 10000
+    DETECTION_BATCH_SIZE = 500
+    DETECTION_LINGER_MS = 100
@@ -14,4 +14,25 @@ class LoggerMessages:
     MOTION_STARTING = "Motion detection enabled"
     MOTION_ERROR = "Motion detection error: {}"
     MOTION_REGION_COUNT = "Video {}: motion regions detected: {}"
-
+    MOTION_TRACKS_CHANGED = "Video {}: tracks started {}, ended {}"
+    MOTION_ALLOCATIONS_IN_USE = "report_allocations is already enabled for another camera in this process; tracemalloc is process-wide, so it is ignored here"
+    WORKER_PROCESS_STARTED = "{} worker {} started (pid {}) for videos {}"
+    WORKER_PROCESS_DIED = "{} worker {} exited with code {}, restarting in {}s"
+    WORKER_PROCESS_FINISHED = "{} worker {} finished"
+    WORKER_PROCESS_GAVE_UP = "{} worker {} restarted {} times, giving up"
+    WORKER_PROCESS_STATS = "{} worker {} (pid {}): {}"
+    CAMERA_STATE_CHANGED = "Video {}: state {} -> {}"
+    ANALYSIS_RATE_CHANGED = "Video {}: analysis rate {} -> {}"
+    BUDGET_MODE_CHANGED = "Video {}: frame budget {}ms, mode -> {} (level {})"
+    BUDGET_WATCHDOG_REPLACED = "Video {}: algorithm stuck for {:.1f}s, replaced with a fresh instance"
+    BUDGET_ISOLATION_UNAVAILABLE = "Video {}: cannot isolate the algorithm ({}), degrading no further than frame skipping"
+    READER_START_FAILED = "Video {}: cannot open shared memory reader: {}"
+    ALGORITHM_STATS = "Algorithm stats: {}"
+    ALGORITHM_PLUGIN_LOADED = "Algorithm plugin {} loaded from {}"
+    ALGORITHM_PLUGIN_FAILED = "Cannot load algorithm plugin {}: {}"
+    MOTION_SEGMENT_EVENT = "Video {}: motion segment {} {} (zone {}, {} ms, peak area {})"
+    HEATMAP_REQUEST_FAILED = "Heatmap request failed: {}"
+    DETECTION_PUBLISHER_UNAVAILABLE = "Detection events disabled, cannot create Kafka publisher: {}"
+    DETECTION_PUBLISH_FAILED = "Failed to publish {} detection events: {}"
+    DETECTION_PUBLISHER_STATS = "Detection events: {}"
+    BATCH_ENGINE_READY = "Batched motion engine ready: {} cameras at {}x{}"
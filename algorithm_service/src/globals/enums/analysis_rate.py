@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class AnalysisRate(str, Enum):
+    ACTIVE = "active"
+    IDLE = "idle"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BackgroundModelType(str, Enum):
+    MOG2 = "mog2"
+    KNN = "knn"
+    RUNNING_AVERAGE = "running_average"
+    MEDIAN = "median"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class BudgetMode(str, Enum):
+    NORMAL = "normal"
+    SKIP_FRAMES = "skip_frames"
+    ISOLATED = "isolated"
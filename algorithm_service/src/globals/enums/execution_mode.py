@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutionMode(str, Enum):
+    THREAD = "thread"
+    PROCESS = "process"
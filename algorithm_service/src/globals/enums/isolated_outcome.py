@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class IsolatedOutcome(str, Enum):
+    DONE = "done"
+    TIMED_OUT = "timed_out"
+    # Never sent: the child is still busy with an earlier frame or is being restarted
+    SKIPPED = "skipped"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class LatencyStage(str, Enum):
+    # capture -> ring commit (pacing + resize in the video manager)
+    CAPTURE_TO_PUBLISH = "capture_to_publish"
+    # ring commit -> read by the algorithm worker (shared memory hop + reader polling)
+    PUBLISH_TO_READ = "publish_to_read"
+    # read -> algorithm done
+    PROCESS = "process"
+    # algorithm done -> preview written
+    OUTPUT = "output"
+    CAPTURE_TO_OUTPUT = "capture_to_output"
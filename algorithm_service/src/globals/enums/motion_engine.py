@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class MotionEngine(str, Enum):
+    PER_CAMERA = "per_camera"
+    BATCHED = "batched"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class SegmentEvent(str, Enum):
+    START = "start"
+    UPDATE = "update"
+    END = "end"
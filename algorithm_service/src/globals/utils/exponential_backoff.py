@@ -0,0 +1,24 @@
+import random
+
+
+class ExponentialBackoff:
+    def __init__(self, base_seconds: float, max_seconds: float, jitter: float = 0.0) -> None:
+        self._base_seconds = base_seconds
+        self._max_seconds = max_seconds
+        self._jitter = jitter
+        self._attempts = 0
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    def next_delay(self) -> float:
+        delay = min(self._max_seconds, self._base_seconds * (2 ** self._attempts))
+        self._attempts += 1
+        # Jitter spreads retries of cameras that dropped at the same moment (e.g. a switch reboot)
+        if self._jitter > 0:
+            delay *= random.uniform(1.0 - self._jitter, 1.0 + self._jitter)
+        return delay
+
+    def reset(self) -> None:
+        self._attempts = 0
@@ -0,0 +1,58 @@
+import bisect
+from typing import Any, Dict, List, Sequence
+
+
+class LatencyHistogram:
+    # Fixed-bucket histogram: recording is O(log buckets) with no per-sample storage, and
+    # percentiles are reported as the upper bound of the bucket they fall in.
+
+    def __init__(self, bounds_ms: Sequence[float]) -> None:
+        self._bounds_ms = list(bounds_ms)
+        self._counts: List[int] = [0] * (len(self._bounds_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, latency_ms: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds_ms, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def percentile(self, fraction: float) -> float:
+        if self._count == 0:
+            return 0.0
+        target = fraction * self._count
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= target:
+                # No sample exceeds the max, so it is a tighter bound for the top occupied bucket
+                return min(self._bounds_ms[index], self._max_ms) if index < len(self._bounds_ms) else self._max_ms
+        return self._max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {}
+        for index, count in enumerate(self._counts):
+            if count:
+                label = f"<={self._bounds_ms[index]:g}" if index < len(self._bounds_ms) else f">{self._bounds_ms[-1]:g}"
+                buckets[label] = count
+        return {
+            "count": self._count,
+            "mean": round(self._total_ms / self._count, 2) if self._count else 0.0,
+            "p50": round(self.percentile(0.5), 2),
+            "p95": round(self.percentile(0.95), 2),
+            "p99": round(self.percentile(0.99), 2),
+            "max": round(self._max_ms, 2),
+            "buckets": buckets,
+        }
+
+    def reset(self) -> None:
+        self._counts = [0] * (len(self._bounds_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
@@ -0,0 +1,47 @@
+from typing import Dict, Optional
+from model.data_classes.zmq_response import Response
+from globals.enums.response_status import ResponseStatus
+from globals.consts.const_strings import ConstStrings
+
+from infrastructure.interfaces.iheatmap_controller import IHeatmapController
+from infrastructure.interfaces.managers.ialgorithm_manager import IAlgorithmManager
+from infrastructure.factories.logger_factory import LoggerFactory
+from globals.consts.logger_messages import LoggerMessages
+
+
+class HeatmapController(IHeatmapController):
+    def __init__(self, algorithm_manager: IAlgorithmManager) -> None:
+        self._algorithm_manager = algorithm_manager
+
+    def get_heatmap(self, data: Optional[Dict] = None) -> Response:
+        try:
+            heatmap = self._algorithm_manager.get_heatmap((data or {}).get(ConstStrings.VIDEO_ID_IDENTIFIER))
+            if heatmap is None:
+                return Response(
+                    status=ResponseStatus.ERROR,
+                    data={ConstStrings.ERROR_MESSAGE: ConstStrings.HEATMAP_NOT_FOUND_ERROR_MESSAGE}
+                )
+            return Response(status=ResponseStatus.SUCCESS, data=heatmap)
+        except Exception as e:
+            LoggerFactory.get_logger_manager().log(ConstStrings.LOG_NAME_ERROR,
+                                                   LoggerMessages.HEATMAP_REQUEST_FAILED.format(e))
+            return Response(
+                status=ResponseStatus.ERROR,
+                data={ConstStrings.ERROR_MESSAGE: ConstStrings.ERROR_HEATMAP_FUNCTION}
+            )
+
+    def reset_heatmap(self, data: Optional[Dict] = None) -> Response:
+        try:
+            if not self._algorithm_manager.reset_heatmap((data or {}).get(ConstStrings.VIDEO_ID_IDENTIFIER)):
+                return Response(
+                    status=ResponseStatus.ERROR,
+                    data={ConstStrings.ERROR_MESSAGE: ConstStrings.HEATMAP_NOT_FOUND_ERROR_MESSAGE}
+                )
+            return Response(status=ResponseStatus.SUCCESS)
+        except Exception as e:
+            LoggerFactory.get_logger_manager().log(ConstStrings.LOG_NAME_ERROR,
+                                                   LoggerMessages.HEATMAP_REQUEST_FAILED.format(e))
+            return Response(
+                status=ResponseStatus.ERROR,
+                data={ConstStrings.ERROR_MESSAGE: ConstStrings.ERROR_HEATMAP_FUNCTION}
+            )
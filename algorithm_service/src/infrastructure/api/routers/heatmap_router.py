@@ -0,0 +1,25 @@
+from typing import Dict, Optional
+
+from globals.consts.const_strings import ConstStrings
+from model.data_classes.zmq_response import Response
+from infrastructure.api.routers.base_router import BaseRouter
+from infrastructure.interfaces.iheatmap_controller import IHeatmapController
+
+
+class HeatmapRouter(BaseRouter):
+    def __init__(self, resource: str, heatmap_controller: IHeatmapController):
+        super().__init__(resource)
+        self._heatmap_controller = heatmap_controller
+        self._prot_setup_operations()
+
+    def _prot_setup_operations(self) -> None:
+        self._prot_operations = {
+            ConstStrings.GET_HEATMAP_OPERATION: self._get_heatmap,
+            ConstStrings.RESET_HEATMAP_OPERATION: self._reset_heatmap,
+        }
+
+    def _get_heatmap(self, data: Optional[Dict] = None) -> Response:
+        return self._heatmap_controller.get_heatmap(data)
+
+    def _reset_heatmap(self, data: Optional[Dict] = None) -> Response:
+        return self._heatmap_controller.reset_heatmap(data)
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.idetection_publisher import IDetectionPublisher
+from infrastructure.interfaces.ikafka_manager import IKafkaManager
+
+
+class DetectionPublisher(IDetectionPublisher):
+    # Decouples camera threads from the broker: publish() only appends to a bounded in-memory buffer,
+    # and a background thread sends it once batch_size events are queued or the oldest one has waited
+    # linger_ms. Each batch becomes one message per camera, keyed by video_id so a camera's events stay
+    # ordered on one partition. When the broker falls behind, the oldest buffered events are dropped.
+
+    def __init__(self, kafka_manager: IKafkaManager, topic: str = ConstStrings.DETECTIONS_TOPIC,
+                 max_buffered: int = Consts.DETECTION_BUFFER_SIZE, batch_size: int = Consts.DETECTION_BATCH_SIZE,
+                 linger_ms: float = Consts.DETECTION_LINGER_MS) -> None:
+        self._kafka_manager = kafka_manager
+        self._topic = topic
+        self._batch_size = max(1, batch_size)
+        self._linger_seconds = linger_ms / 1000
+        self._logger = LoggerFactory.get_logger_manager()
+
+        # (queued_at, topic, event), oldest first
+        self._buffer: Deque[Tuple[float, str, Dict[str, Any]]] = deque(maxlen=max(1, max_buffered))
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._queued = 0
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._messages = 0
+
+    def start(self) -> "DetectionPublisher":
+        self._running = True
+        self._thread = threading.Thread(target=self._send_loop, name="detection-publisher", daemon=True)
+        self._thread.start()
+        return self
+
+    def publish(self, event: Dict[str, Any], topic: Optional[str] = None) -> None:
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append((time.monotonic(), topic or self._topic, event))
+            self._queued += 1
+            # Wake the sender for the first event (to start its linger) and for a full batch
+            if len(self._buffer) == 1 or len(self._buffer) >= self._batch_size:
+                self._condition.notify()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            buffered = len(self._buffer)
+        return {
+            "queued": self._queued,
+            "sent": self._sent,
+            "messages": self._messages,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "buffered": buffered,
+        }
+
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=self._linger_seconds + 5)
+
+    # ===== Internal =====
+
+    def _send_loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._send(batch)
+
+    def _next_batch(self) -> Optional[List[Tuple[float, str, Dict[str, Any]]]]:
+        # Blocks until a batch is due; on stop, returns what is left (None once empty)
+        with self._condition:
+            while self._running and not self._buffer:
+                self._condition.wait()
+            while self._running and len(self._buffer) < self._batch_size:
+                remaining = self._buffer[0][0] + self._linger_seconds - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._buffer:
+                return None
+            count = min(self._batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def _send(self, batch: List[Tuple[float, str, Dict[str, Any]]]) -> None:
+        by_topic: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {}
+        for _, topic, event in batch:
+            by_topic.setdefault(topic, {}).setdefault(event.get("video_id"), []).append(event)
+        for topic, by_camera in by_topic.items():
+            messages = [(video_id, {"video_id": video_id, "events": events}) for video_id, events in by_camera.items()]
+            count = sum(len(events) for events in by_camera.values())
+            try:
+                self._kafka_manager.send_batch(topic, messages)
+                self._sent += count
+                self._messages += len(messages)
+            except Exception as e:
+                # The buffer is bounded, so a failed batch is dropped rather than retried
+                self._failed += count
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.DETECTION_PUBLISH_FAILED.format(count, e))
@@ -1,6 +1,6 @@
 import json
 import threading
-from typing import Callable
+from typing import Any, Callable, List, Tuple
 from kafka import KafkaProducer, KafkaConsumer
 from globals.consts.const_strings import ConstStrings
 from infrastructure.interfaces.ikafka_manager import IKafkaManager
@@ -25,6 +25,14 @@ class KafkaManager(IKafkaManager):
             self._producer.send(topic, value=msg)
             self._producer.flush()
 
+    def send_batch(self, topic: str, messages: List[Tuple[str, Any]]) -> None:
+        # One flush for the whole batch instead of a broker round trip per message; the key keeps
+        # each key's messages on one partition, in order
+        if self._config_manager.exists(topic):
+            for key, value in messages:
+                self._producer.send(topic, key=key, value=value)
+            self._producer.flush()
+
     def start_consuming(self, topic: str, callback: Callable) -> None:
         if topic in self._consumers:
             self._logger.log(ConstStrings.LOG_NAME_DEBUG,
@@ -49,7 +57,8 @@ class KafkaManager(IKafkaManager):
         self._producer = KafkaProducer(
             bootstrap_servers=self._bootstrap_servers,
             value_serializer=lambda v: json.dumps(
-                v).encode(ConstStrings.ENCODE_FORMAT)
+                v).encode(ConstStrings.ENCODE_FORMAT),
+            key_serializer=lambda k: None if k is None else str(k).encode(ConstStrings.ENCODE_FORMAT)
         )
 
     def _init_kafka_consumer(self, topic: str):
@@ -1,14 +1,90 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
 
+from globals.consts.consts import Consts
+from globals.consts.const_strings import ConstStrings
+from globals.enums.background_model_type import BackgroundModelType
 from ..interfaces.algorithms.ialgorithm import IAlgorithm
+from ..interfaces.algorithms.ibackground_model import IBackgroundModel
+from .algorithm_registry import AlgorithmRegistry
+from model.algorithms.algorithm_chain import AlgorithmChain
 from model.algorithms.motion_detection import MotionDetectionAlgorithm
+from model.algorithms.batched_motion_detection import BatchedMotionDetectionEngine
+from model.algorithms.background_models.median_background_model import MedianBackgroundModel
+from model.algorithms.background_models.opencv_background_model import OpenCvBackgroundModel
+from model.algorithms.background_models.running_average_background_model import RunningAverageBackgroundModel
 
 
 class AlgorithmFactory:
     @staticmethod
     def create(algorithm_type: str, config: Dict[str, Any]) -> IAlgorithm:
-        if algorithm_type == "motion_detection":
-            algo = MotionDetectionAlgorithm()
-            algo.setup(config)
-            return algo
-        raise ValueError(f"Unknown algorithm type: {algorithm_type}")
+        return AlgorithmRegistry.create(algorithm_type, config)
+
+    @staticmethod
+    def create_motion_detection(config: Dict[str, Any]) -> IAlgorithm:
+        # Registered as the built-in "motion_detection" type (ConstCollections.BUILTIN_ALGORITHMS)
+        return MotionDetectionAlgorithm(AlgorithmFactory.create_background_model(config))
+
+    @staticmethod
+    def create_chain(specs: Sequence[Dict[str, Any]]) -> IAlgorithm:
+        # specs: [{"algorithm": <registered name>, "algorithm_config": {...}}, ...], run in this order
+        names = []
+        algorithms = []
+        for index, spec in enumerate(specs):
+            algorithm_type = spec.get("algorithm", "motion_detection")
+            algorithms.append(AlgorithmFactory.create(algorithm_type, spec.get("algorithm_config", {})))
+            names.append(f"{index}_{algorithm_type}")
+        return AlgorithmChain(names, algorithms)
+
+    @staticmethod
+    def create_camera_algorithm(video: Dict[str, Any]) -> IAlgorithm:
+        # "algorithms": [{"algorithm": ..., "algorithm_config": {...}}, ...] chains several
+        # algorithms on one camera; otherwise the single "algorithm" / "algorithm_config"
+        chain = video.get("algorithms")
+        if chain:
+            return AlgorithmFactory.create_chain([
+                dict(spec, algorithm_config=AlgorithmFactory._with_snapshot_paths(
+                    video, spec.get("algorithm_config", {}), index))
+                for index, spec in enumerate(chain)
+            ])
+        return AlgorithmFactory.create(video.get("algorithm", "motion_detection"),
+                                       AlgorithmFactory._with_snapshot_paths(video, video.get("algorithm_config", {})))
+
+    @staticmethod
+    def snapshot_camera_key(video: Dict[str, Any], chain_index: Optional[int] = None) -> str:
+        return str(video.get("video_id")) if chain_index is None else f"{video.get('video_id')}_{chain_index}"
+
+    @staticmethod
+    def create_batched_motion_engine(configs: Sequence[Dict[str, Any]]) -> BatchedMotionDetectionEngine:
+        engine = BatchedMotionDetectionEngine()
+        engine.setup(configs)
+        return engine
+
+    @staticmethod
+    def create_background_model(config: Dict[str, Any]) -> IBackgroundModel:
+        model_type = BackgroundModelType(config.get("background_model", Consts.MOTION_BACKGROUND_MODEL))
+        history = int(config.get("history", Consts.MOTION_BG_HISTORY))
+        detect_shadows = bool(config.get("detect_shadows", Consts.MOTION_DETECT_SHADOWS))
+        diff_threshold = float(config.get("diff_threshold", Consts.MOTION_BG_DIFF_THRESHOLD))
+
+        if model_type == BackgroundModelType.MOG2:
+            return OpenCvBackgroundModel.mog2(history, float(config.get("threshold", Consts.MOTION_BG_VAR_THRESHOLD)),
+                                              detect_shadows)
+        if model_type == BackgroundModelType.KNN:
+            return OpenCvBackgroundModel.knn(history, float(config.get("threshold", Consts.MOTION_BG_KNN_DIST2_THRESHOLD)),
+                                             detect_shadows)
+        if model_type == BackgroundModelType.RUNNING_AVERAGE:
+            return RunningAverageBackgroundModel(history, diff_threshold)
+        return MedianBackgroundModel(diff_threshold, int(config.get("median_step", Consts.MOTION_BG_MEDIAN_STEP)))
+
+
+    # ===== Internal =====
+
+    @staticmethod
+    def _with_snapshot_paths(video: Dict[str, Any], algo_cfg: Dict[str, Any],
+                             chain_index: Optional[int] = None) -> Dict[str, Any]:
+        algo_cfg = dict(algo_cfg)
+        camera = AlgorithmFactory.snapshot_camera_key(video, chain_index)
+        if bool(algo_cfg.get("background_snapshots", Consts.MOTION_BACKGROUND_SNAPSHOTS)):
+            algo_cfg.setdefault("background_snapshot_path", ConstStrings.BACKGROUND_SNAPSHOT_PATH.format(camera))
+        algo_cfg.setdefault("heatmap_snapshot_path", ConstStrings.HEATMAP_SNAPSHOT_PATH.format(camera))
+        return algo_cfg
@@ -0,0 +1,80 @@
+import importlib
+import os
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, List, Type, Union
+
+from globals.consts.const_collections import ConstCollections
+from globals.consts.const_strings import ConstStrings
+from infrastructure.factories.logger_factory import LoggerFactory
+from globals.consts.logger_messages import LoggerMessages
+from ..interfaces.algorithms.ialgorithm import IAlgorithm
+
+# An IAlgorithm subclass (constructed without arguments) or a callable building one from its config
+AlgorithmConstructor = Union[Type[IAlgorithm], Callable[[Dict[str, Any]], IAlgorithm]]
+
+
+class AlgorithmRegistry:
+    # Algorithm types by name, discovered once, on first use, in this order: the built-ins listed in
+    # ConstCollections.BUILTIN_ALGORITHMS, the ALGORITHM_ENTRY_POINT_GROUP entry points of installed
+    # packages, and the modules listed (comma separated) in the ALGORITHM_PLUGINS environment
+    # variable, which call AlgorithmRegistry.register when imported. Discovery does not depend on
+    # what was imported before, so worker processes see the same types.
+
+    _constructors: Dict[str, AlgorithmConstructor] = {}
+    _discovered = False
+
+    @staticmethod
+    def register(name: str, constructor: AlgorithmConstructor) -> None:
+        AlgorithmRegistry._constructors[name] = constructor
+
+    @staticmethod
+    def names() -> List[str]:
+        AlgorithmRegistry._discover()
+        return sorted(AlgorithmRegistry._constructors)
+
+    @staticmethod
+    def create(name: str, config: Dict[str, Any]) -> IAlgorithm:
+        AlgorithmRegistry._discover()
+        constructor = AlgorithmRegistry._constructors.get(name)
+        if constructor is None:
+            raise ValueError(f"Unknown algorithm type: {name}")
+        algo = constructor() if isinstance(constructor, type) else constructor(config)
+        algo.setup(config)
+        return algo
+
+    # ===== Internal =====
+
+    @staticmethod
+    def _discover() -> None:
+        if AlgorithmRegistry._discovered:
+            return
+        AlgorithmRegistry._discovered = True
+        logger = LoggerFactory.get_logger_manager()
+
+        for name, target in ConstCollections.BUILTIN_ALGORITHMS.items():
+            # Explicit registrations made before discovery take precedence over the built-in
+            if name not in AlgorithmRegistry._constructors:
+                AlgorithmRegistry.register(name, AlgorithmRegistry._resolve(target))
+
+        for entry_point in entry_points(group=ConstStrings.ALGORITHM_ENTRY_POINT_GROUP):
+            try:
+                AlgorithmRegistry.register(entry_point.name, entry_point.load())
+                logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ALGORITHM_PLUGIN_LOADED.format(entry_point.name, entry_point.value))
+            except Exception as e:
+                logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.ALGORITHM_PLUGIN_FAILED.format(entry_point.value, e))
+
+        for module_name in filter(None, (name.strip() for name in os.getenv(ConstStrings.ALGORITHM_PLUGINS_ENV, "").split(","))):
+            try:
+                importlib.import_module(module_name)
+                logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ALGORITHM_PLUGIN_LOADED.format(module_name, module_name))
+            except Exception as e:
+                logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.ALGORITHM_PLUGIN_FAILED.format(module_name, e))
+
+    @staticmethod
+    def _resolve(target: str) -> AlgorithmConstructor:
+        # "package.module:Attribute.path", the entry point object reference format
+        module_name, _, attribute_path = target.partition(":")
+        resolved: Any = importlib.import_module(module_name)
+        for attribute in attribute_path.split("."):
+            resolved = getattr(resolved, attribute)
+        return resolved
@@ -1,19 +1,30 @@
-from typing import List
+from typing import List, Optional
 from globals.consts.const_strings import ConstStrings
 from infrastructure.interfaces.ikafka_manager import IKafkaManager
 from infrastructure.api.controllers.example_controller import ExampleController
 from infrastructure.api.routers.example_router import ExampleRouter
+from infrastructure.api.controllers.heatmap_controller import HeatmapController
+from infrastructure.api.routers.heatmap_router import HeatmapRouter
+from infrastructure.interfaces.managers.ialgorithm_manager import IAlgorithmManager
 from infrastructure.interfaces.iapi_router import IApiRouter
 
 
 class ApiFactory:
     @staticmethod
-    def create_routers() -> List[IApiRouter]:
-        return [
+    def create_routers(algorithm_manager: Optional[IAlgorithmManager] = None) -> List[IApiRouter]:
+        routers = [
             ApiFactory.create_example_router(),
         ]
+        if algorithm_manager is not None:
+            routers.append(ApiFactory.create_heatmap_router(algorithm_manager))
+        return routers
 
     @staticmethod
     def create_example_router() -> IApiRouter:
         example_controller = ExampleController()
         return ExampleRouter(ConstStrings.EXAMPLE_RESOURCE, example_controller)
+
+    @staticmethod
+    def create_heatmap_router(algorithm_manager: IAlgorithmManager) -> IApiRouter:
+        heatmap_controller = HeatmapController(algorithm_manager)
+        return HeatmapRouter(ConstStrings.HEATMAP_RESOURCE, heatmap_controller)
@@ -1,4 +1,6 @@
 import os
+from globals.consts.consts import Consts
+from globals.enums.shm_transport import ShmTransport
 from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from globals.consts.const_strings import ConstStrings
 from infrastructure.interfaces.handlers.ishm_reader_handler import IShmReaderHandler
@@ -10,5 +12,7 @@ class HandlerFactory:
         pass
     
     @staticmethod
-    def create_shm_reader_handler(video_id: int, width: int = 1280, height: int = 720) -> IShmReaderHandler:
-        return ShmReaderHandler(video_id, width, height)
\ No newline at end of file
+    def create_shm_reader_handler(video_id: int, width: int = 1280, height: int = 720,
+                                  transport: str = Consts.SHM_TRANSPORT,
+                                  pyramid_level: int = Consts.PYRAMID_LEVEL) -> IShmReaderHandler:
+        return ShmReaderHandler(video_id, width, height, ShmTransport(transport), int(pyramid_level))
\ No newline at end of file
@@ -1,16 +1,20 @@
 import os
-from typing import List
+from typing import List, Optional
 
 from infrastructure.interfaces.ikafka_manager import IKafkaManager
 from infrastructure.events.kafka_manager import KafkaManager
+from infrastructure.interfaces.idetection_publisher import IDetectionPublisher
+from infrastructure.events.detection_publisher import DetectionPublisher
 from infrastructure.interfaces.ievent_manager import IEventManager
 from infrastructure.events.event_manager import EventManager
 from infrastructure.config.xml_config_manager import XMLConfigManager
 from infrastructure.interfaces.iconfig_manager import IConfigManager
 from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
 from infrastructure.factories.api_factory import ApiFactory
 from infrastructure.interfaces.izmq_server_manager import IZmqServerManager
 from infrastructure.events.zmq_server_manager import ZmqServerManager
+from infrastructure.interfaces.managers.ialgorithm_manager import IAlgorithmManager
 from infrastructure.interfaces.ilogger_manager import ILoggerManager
 from infrastructure.logger.logger_manager import LoggerManager
 
@@ -26,6 +30,14 @@ class InfrastructureFactory:
     def create_kafka_manager(config_manager: IConfigManager) -> IKafkaManager:
         return KafkaManager(config_manager)
 
+    @staticmethod
+    def create_detection_publisher() -> Optional[IDetectionPublisher]:
+        # Off unless DETECTION_EVENTS=1, so the service runs without a broker
+        if os.getenv(ConstStrings.DETECTION_EVENTS_ENV, "1" if Consts.DETECTION_EVENTS else "0") != "1":
+            return None
+        config_manager = InfrastructureFactory.create_config_manager(ConstStrings.GLOBAL_CONFIG_PATH)
+        return DetectionPublisher(InfrastructureFactory.create_kafka_manager(config_manager)).start()
+
     @staticmethod
     def create_event_manager() -> IEventManager:
         if InfrastructureFactory.event_manager is None:
@@ -33,8 +45,10 @@ class InfrastructureFactory:
         return InfrastructureFactory.event_manager
 
     @staticmethod
-    def create_zmq_server_manager() -> IZmqServerManager:
+    def create_zmq_server_manager(algorithm_manager: Optional[IAlgorithmManager] = None) -> IZmqServerManager:
         host = os.getenv(ConstStrings.ZMQ_SERVER_HOST)
         port = os.getenv(ConstStrings.ZMQ_SERVER_PORT)
-        routers = ApiFactory.create_routers()
-        return ZmqServerManager(host, port, routers).start()
+        routers = ApiFactory.create_routers(algorithm_manager)
+        zmq_server_manager = ZmqServerManager(host, port, routers)
+        zmq_server_manager.start()
+        return zmq_server_manager
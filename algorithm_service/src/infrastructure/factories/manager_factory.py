@@ -1,3 +1,5 @@
+import os
+
 from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from globals.consts.const_strings import ConstStrings
 from infrastructure.interfaces.iexample_manager import IExampleManager
@@ -7,6 +9,8 @@ from infrastructure.interfaces.ilogger_manager import ILoggerManager
 from infrastructure.interfaces.managers.ialgorithm_manager import IAlgorithmManager
 from model.managers.algorithm_manager import AlgorithmManager
 from globals.consts.consts import Consts
+from globals.enums.execution_mode import ExecutionMode
+from globals.enums.motion_engine import MotionEngine
 
 class ManagerFactory:
     @staticmethod
@@ -70,9 +74,16 @@ class ManagerFactory:
             }
         ]
         
-        algorithm_manager = AlgorithmManager(videos_config)
+        execution_mode = ExecutionMode(os.getenv(ConstStrings.EXECUTION_MODE_ENV, Consts.EXECUTION_MODE))
+        cameras_per_process = int(os.getenv(ConstStrings.CAMERAS_PER_PROCESS_ENV, Consts.CAMERAS_PER_PROCESS))
+        motion_engine = MotionEngine(os.getenv(ConstStrings.MOTION_ENGINE_ENV, Consts.MOTION_ENGINE))
+        algorithm_manager = AlgorithmManager(videos_config, execution_mode, cameras_per_process, motion_engine)
         return algorithm_manager
 
     @staticmethod
     def create_all():
-        ManagerFactory.create_algorithm_manager().start()
+        algorithm_manager = ManagerFactory.create_algorithm_manager()
+        # The ZMQ API (heatmaps) is served only when an address is configured
+        if os.getenv(ConstStrings.ZMQ_SERVER_PORT):
+            InfrastructureFactory.create_zmq_server_manager(algorithm_manager)
+        algorithm_manager.start()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class IAlgorithm(ABC):
@@ -8,9 +8,36 @@ class IAlgorithm(ABC):
         pass
 
     @abstractmethod
-    def process(self, frame: Any) -> Any:
+    def process(self, frame: Any, cache: Optional[Any] = None) -> Any:
+        # frame may already carry earlier algorithms' drawings; analyse cache.frame / cache images
+        # (a FrameCache) instead, which chained algorithms share so preprocessing runs once per frame
         pass
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        # Optional per-algorithm counters, merged into the manager's periodic camera stats
+        return {}
+
+    @property
+    def motion_detected(self) -> Optional[bool]:
+        # Whether the last processed frame had activity; None if the algorithm cannot tell
+        return None
+
+    @property
+    def result(self) -> Optional[Any]:
+        # Structured detections (a DetectionResult) of the last analysed frame; a new object per
+        # analysed frame, so the manager publishes each one once. None if the algorithm has none
+        return None
+
+    @property
+    def heatmap(self) -> Optional[Dict[str, Any]]:
+        # Accumulated activity per cell, if the algorithm keeps one
+        return None
+
+    def reset_heatmap(self) -> bool:
+        # Clears the accumulated activity; False if the algorithm keeps none
+        return False
+
     @abstractmethod
     def release(self) -> None:
         pass
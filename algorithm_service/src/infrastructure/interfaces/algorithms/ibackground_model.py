@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+from globals.enums.background_model_type import BackgroundModelType
+
+
+class IBackgroundModel(ABC):
+    @property
+    @abstractmethod
+    def model_type(self) -> BackgroundModelType:
+        pass
+
+    @abstractmethod
+    def apply(self, image: np.ndarray, fgmask: np.ndarray) -> None:
+        # Update the model with image and write its binary (0 / 255) foreground mask into fgmask
+        pass
+
+    @abstractmethod
+    def background_image(self) -> Optional[np.ndarray]:
+        # Current background estimate (uint8, same layout as the modelled images), None before the first frame
+        pass
+
+    @abstractmethod
+    def seed(self, background: np.ndarray) -> None:
+        # Start from a known background (a restored snapshot or a bootstrap median) instead of learning it
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        # Forget the learned background, e.g. when the modelled image size changes
+        pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from numpy import ndarray
+from model.data_classes.frame_trace import FrameTrace
 
 
 class IShmReaderHandler(ABC):
@@ -7,6 +9,10 @@ class IShmReaderHandler(ABC):
     def read_frame(self) -> ndarray:
         pass
     
+    @abstractmethod
+    def poll_frame(self) -> ndarray:
+        pass
+
     @abstractmethod
     def start(self) -> None:
         pass
@@ -14,3 +20,18 @@ class IShmReaderHandler(ABC):
     @abstractmethod
     def release(self) -> None:
         pass
+
+    @property
+    @abstractmethod
+    def last_frame_trace(self) -> Optional[FrameTrace]:
+        pass
+
+    @property
+    @abstractmethod
+    def finished(self) -> bool:
+        pass
+
+    @property
+    @abstractmethod
+    def frame_is_current(self) -> bool:
+        pass
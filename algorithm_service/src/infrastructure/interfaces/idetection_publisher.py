@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class IDetectionPublisher(ABC):
+    @abstractmethod
+    def start(self) -> "IDetectionPublisher":
+        pass
+
+    @abstractmethod
+    def publish(self, event: Dict[str, Any], topic: Optional[str] = None) -> None:
+        # Never blocks the caller; the event is sent later with others (to the default topic if None)
+        pass
+
+    @property
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from model.data_classes.zmq_response import Response
+
+
+class IHeatmapController(ABC):
+    @abstractmethod
+    def get_heatmap(self, data: Optional[Dict] = None) -> Response:
+        pass
+
+    @abstractmethod
+    def reset_heatmap(self, data: Optional[Dict] = None) -> Response:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Any, Callable, List, Tuple
 
 
 class IKafkaManager(ABC):
@@ -7,6 +7,11 @@ class IKafkaManager(ABC):
     def send_message(self, topic: str, msg: str) -> None:
         pass
 
+    @abstractmethod
+    def send_batch(self, topic: str, messages: List[Tuple[str, Any]]) -> None:
+        # Keyed (key, value) messages, flushed to the broker together
+        pass
+
     @abstractmethod
     def start_consuming(self, topic: str, callback: Callable) -> None:
         pass
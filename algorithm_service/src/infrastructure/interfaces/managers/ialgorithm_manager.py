@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
 
 
 class IAlgorithmManager(ABC):
@@ -9,3 +10,11 @@ class IAlgorithmManager(ABC):
     @abstractmethod
     def stop(self) -> None:
         pass
+
+    @abstractmethod
+    def get_heatmap(self, video_id: Any) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def reset_heatmap(self, video_id: Any) -> bool:
+        pass
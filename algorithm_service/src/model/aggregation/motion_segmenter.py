@@ -0,0 +1,111 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.enums.segment_event import SegmentEvent
+from model.data_classes.detection_result import DetectionResult
+from model.data_classes.motion_segment import MotionSegment
+
+
+class MotionSegmenter:
+    # Collapses one camera's per-frame detections into motion segments, for the whole camera and for
+    # each zone. A segment starts once motion was seen on on_frames consecutive analysed frames and has
+    # lasted min_seconds, and ends after off_seconds without motion; motion that ends before it
+    # started is discarded. Long segments also emit an update every update_seconds. Times come from
+    # the frames' capture timestamps, so a camera analysed at a reduced rate segments the same way.
+
+    def __init__(self, video_id: Any, on_frames: int = Consts.SEGMENT_ON_FRAMES,
+                 off_seconds: float = Consts.SEGMENT_OFF_SECONDS, min_seconds: float = Consts.SEGMENT_MIN_SECONDS,
+                 update_seconds: float = Consts.SEGMENT_UPDATE_SECONDS) -> None:
+        self._video_id = video_id
+        self._on_frames = max(1, on_frames)
+        self._off_ns = int(off_seconds * 1e9)
+        self._min_ns = int(min_seconds * 1e9)
+        self._update_ns = int(update_seconds * 1e9)  # 0 = no updates
+
+        # Open segments by zone name, None being the whole camera
+        self._open: Dict[Optional[str], MotionSegment] = {}
+        self._next_id = 1
+
+        self._started = 0
+        self._ended = 0
+        self._discarded = 0
+
+    @staticmethod
+    def from_config(video_id: Any, config: Dict[str, Any]) -> Optional["MotionSegmenter"]:
+        if not bool(config.get("motion_segments", Consts.MOTION_SEGMENTS)):
+            return None
+        return MotionSegmenter(video_id, int(config.get("segment_on_frames", Consts.SEGMENT_ON_FRAMES)),
+                               float(config.get("segment_off_seconds", Consts.SEGMENT_OFF_SECONDS)),
+                               float(config.get("segment_min_seconds", Consts.SEGMENT_MIN_SECONDS)),
+                               float(config.get("segment_update_seconds", Consts.SEGMENT_UPDATE_SECONDS)))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": sum(1 for segment in self._open.values() if segment.started),
+            "started": self._started,
+            "ended": self._ended,
+            "discarded": self._discarded,
+        }
+
+    def update(self, result: DetectionResult, sequence: int, timestamp_ns: int) -> List[Dict[str, Any]]:
+        # Feed one analysed frame; returns the segment events it caused
+        events: List[Dict[str, Any]] = []
+        boxes_by_zone: Dict[Optional[str], np.ndarray] = {}
+        if len(result.boxes):
+            boxes_by_zone[None] = np.arange(len(result.boxes))
+            if result.zones is not None:
+                zones = np.array(result.zones, dtype=object)
+                for zone in set(result.zones) - {None}:
+                    boxes_by_zone[zone] = np.flatnonzero(zones == zone)
+
+        for zone in set(boxes_by_zone) | set(self._open):
+            rows = boxes_by_zone.get(zone)
+            if rows is not None:
+                track_ids = result.track_ids[rows] if result.track_ids is not None else None
+                self._on_motion(zone, result.boxes[rows], track_ids, sequence, timestamp_ns, events)
+            else:
+                self._on_quiet(zone, timestamp_ns, events)
+        return events
+
+    def close(self) -> List[Dict[str, Any]]:
+        # End every started segment, e.g. when the camera stops
+        events = [segment.to_event(SegmentEvent.END) for segment in self._open.values() if segment.started]
+        self._ended += len(events)
+        self._open = {}
+        return events
+
+    # ===== Internal =====
+
+    def _on_motion(self, zone: Optional[str], boxes: np.ndarray, track_ids: Optional[np.ndarray],
+                   sequence: int, timestamp_ns: int, events: List[Dict[str, Any]]) -> None:
+        segment = self._open.get(zone)
+        if segment is None:
+            segment = MotionSegment(self._video_id, zone, self._next_id, sequence, timestamp_ns)
+            self._next_id += 1
+            self._open[zone] = segment
+        segment.add(boxes, track_ids, sequence, timestamp_ns)
+
+        if not segment.started:
+            if segment.consecutive_frames >= self._on_frames and timestamp_ns - segment.start_ns >= self._min_ns:
+                segment.started = True
+                segment.last_event_ns = timestamp_ns
+                self._started += 1
+                events.append(segment.to_event(SegmentEvent.START))
+        elif self._update_ns > 0 and timestamp_ns - segment.last_event_ns >= self._update_ns:
+            segment.last_event_ns = timestamp_ns
+            events.append(segment.to_event(SegmentEvent.UPDATE))
+
+    def _on_quiet(self, zone: Optional[str], timestamp_ns: int, events: List[Dict[str, Any]]) -> None:
+        segment = self._open[zone]
+        segment.consecutive_frames = 0
+        if timestamp_ns - segment.last_ns < self._off_ns:
+            return
+        del self._open[zone]
+        if segment.started:
+            self._ended += 1
+            events.append(segment.to_event(SegmentEvent.END))
+        else:
+            self._discarded += 1
@@ -0,0 +1,156 @@
+import math
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+
+
+class ActivityHeatmap:
+    # Where motion happens over hours or days, as a by-product of the foreground mask the algorithm
+    # already computes. The mask is reduced to one value per block_size x block_size cell (an
+    # INTER_AREA resize into a preallocated buffer) and folded into a float32 grid with
+    # accumulateWeighted, so each cell holds the exponentially decaying fraction of time it was
+    # foreground, with the given half-life. The weight follows wall-clock time between updates, so
+    # cameras analysed at a reduced rate or skipped by the change gate decay the same way.
+    # The grid is saved periodically and at release, restored (decayed for the downtime) on start,
+    # and the snapshot file is also what is served for cameras running in worker processes.
+
+    def __init__(self, block_size: int = Consts.HEATMAP_BLOCK_SIZE,
+                 half_life_seconds: float = Consts.HEATMAP_HALF_LIFE_SECONDS,
+                 snapshot_path: Optional[str] = None,
+                 snapshot_interval_seconds: float = Consts.HEATMAP_SNAPSHOT_INTERVAL_SECONDS) -> None:
+        self._block_size = max(1, block_size)
+        self._half_life = max(half_life_seconds, 1e-3)
+        self._snapshot_path = snapshot_path
+        self._snapshot_interval = snapshot_interval_seconds
+
+        self._values: Optional[np.ndarray] = None  # 0-255 activity per cell
+        self._blocks: Optional[np.ndarray] = None
+        # Cell grid geometry in frame pixels
+        self._origin: Tuple[float, float] = (0.0, 0.0)
+        self._cell: Tuple[float, float] = (0.0, 0.0)
+        self._frames = 0
+        self._last_update: Optional[float] = None
+        self._last_saved = time.monotonic()
+        self._restored = False
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["ActivityHeatmap"]:
+        if not bool(config.get("heatmap", Consts.MOTION_HEATMAP)):
+            return None
+        return ActivityHeatmap(int(config.get("heatmap_block_size", Consts.HEATMAP_BLOCK_SIZE)),
+                               float(config.get("heatmap_half_life_seconds", Consts.HEATMAP_HALF_LIFE_SECONDS)),
+                               config.get("heatmap_snapshot_path") or None,
+                               float(config.get("heatmap_snapshot_interval_seconds",
+                                                Consts.HEATMAP_SNAPSHOT_INTERVAL_SECONDS)))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"frames": self._frames, "restored": self._restored}
+
+    def begin(self, mask_shape: Tuple[int, int], offset: Tuple[int, int], scale: Tuple[float, float]) -> None:
+        # Called whenever the mask size changes: mask_shape (h, w) in analysis pixels, offset of the
+        # mask (ROI crop) in the analysis image, and frame pixels per analysis pixel
+        grid_height = math.ceil(mask_shape[0] / self._block_size)
+        grid_width = math.ceil(mask_shape[1] / self._block_size)
+        self._blocks = np.empty((grid_height, grid_width), dtype=np.uint8)
+        self._origin = (offset[0] * scale[0], offset[1] * scale[1])
+        self._cell = (mask_shape[1] / grid_width * scale[0], mask_shape[0] / grid_height * scale[1])
+        self._last_update = None
+
+        snapshot = self.load_snapshot(self._snapshot_path) if self._values is None else None
+        if snapshot is not None and snapshot["values"].shape == (grid_height, grid_width):
+            self._values = snapshot["values"]
+            self._frames = snapshot["frames"]
+            self._restored = True
+        elif self._values is None or self._values.shape != (grid_height, grid_width):
+            self._values = np.zeros((grid_height, grid_width), dtype=np.float32)
+            self._frames = 0
+
+    def update(self, mask: np.ndarray) -> None:
+        # mask: the 0/255 foreground mask the heatmap was begun for
+        now = time.monotonic()
+        cv2.resize(mask, (self._blocks.shape[1], self._blocks.shape[0]), dst=self._blocks,
+                   interpolation=cv2.INTER_AREA)
+        if self._last_update is None:
+            # Nothing to weigh the first frame against; start from a one-frame step
+            elapsed = 1.0 / max(1, Consts.ALGO_FRAME_RATE)
+        else:
+            elapsed = now - self._last_update
+        self._last_update = now
+        weight = 1.0 - 0.5 ** (elapsed / self._half_life)
+        cv2.accumulateWeighted(self._blocks, self._values, weight)
+        self._frames += 1
+
+        if self._snapshot_interval > 0 and now - self._last_saved >= self._snapshot_interval:
+            self.save()
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        if self._values is None:
+            return None
+        return self._describe(self._values, self._origin, self._cell, self._half_life, self._frames, time.time())
+
+    def reset(self) -> None:
+        if self._values is not None:
+            self._values[:] = 0
+        self._frames = 0
+
+    def save(self) -> None:
+        self._last_saved = time.monotonic()
+        if self._snapshot_path is None or self._values is None:
+            return
+        os.makedirs(os.path.dirname(self._snapshot_path) or ".", exist_ok=True)
+        # Write next to the target and swap it in, so readers never see a torn snapshot
+        root, extension = os.path.splitext(self._snapshot_path)
+        temp_path = f"{root}.tmp{extension}"
+        with open(temp_path, "wb") as snapshot_file:
+            np.savez(snapshot_file, values=self._values, origin=np.array(self._origin), cell=np.array(self._cell),
+                     half_life=self._half_life, frames=self._frames, saved_at=time.time())
+        os.replace(temp_path, self._snapshot_path)
+
+    @staticmethod
+    def load_snapshot(snapshot_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        # Snapshot decayed to now, as it would look had the camera been quiet since it was saved
+        if snapshot_path is None or not os.path.exists(snapshot_path):
+            return None
+        with np.load(snapshot_path) as snapshot:
+            half_life = float(snapshot["half_life"])
+            idle = max(0.0, time.time() - float(snapshot["saved_at"]))
+            return {
+                "values": (snapshot["values"] * 0.5 ** (idle / half_life)).astype(np.float32),
+                "origin": tuple(snapshot["origin"].tolist()),
+                "cell": tuple(snapshot["cell"].tolist()),
+                "half_life": half_life,
+                "frames": int(snapshot["frames"]),
+                "saved_at": float(snapshot["saved_at"]),
+            }
+
+    @staticmethod
+    def describe_snapshot(snapshot_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        snapshot = ActivityHeatmap.load_snapshot(snapshot_path)
+        if snapshot is None:
+            return None
+        return ActivityHeatmap._describe(snapshot["values"], snapshot["origin"], snapshot["cell"],
+                                         snapshot["half_life"], snapshot["frames"], snapshot["saved_at"])
+
+    # ===== Internal =====
+
+    @staticmethod
+    def _describe(values: np.ndarray, origin: Tuple[float, float], cell: Tuple[float, float], half_life: float,
+                  frames: int, updated_at: float) -> Dict[str, Any]:
+        # values are fractions of time (0-1) each cell was foreground; origin / cell in frame pixels
+        activity = values / 255.0
+        return {
+            "grid": [values.shape[1], values.shape[0]],
+            "origin": [round(v, 1) for v in origin],
+            "cell": [round(v, 2) for v in cell],
+            "half_life_seconds": half_life,
+            "frames": frames,
+            "updated_at": updated_at,
+            "max": round(float(activity.max()), 4) if activity.size else 0.0,
+            "values": np.round(activity, 4).tolist(),
+        }
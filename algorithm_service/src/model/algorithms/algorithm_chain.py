@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Optional
+
+from infrastructure.interfaces.algorithms.ialgorithm import IAlgorithm
+from model.algorithms.frame_cache import FrameCache
+from model.data_classes.detection_result import DetectionResult
+
+
+class AlgorithmChain(IAlgorithm):
+    # Several algorithms on one camera, run in order on every frame. They share one FrameCache, so a
+    # grayscale or downscaled image one of them needs is computed once for all of them, and each
+    # draws onto the frame returned by the previous one.
+
+    def __init__(self, names: List[str], algorithms: List[IAlgorithm]) -> None:
+        self._names = names
+        self._algorithms = algorithms
+        self._cache = FrameCache()
+
+    def setup(self, config: Dict[str, Any]) -> None:
+        # Members are set up individually by AlgorithmFactory.create_chain
+        pass
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {name: algo.stats for name, algo in zip(self._names, self._algorithms) if algo.stats}
+        stats["cache"] = self._cache.stats
+        return stats
+
+    @property
+    def motion_detected(self) -> Optional[bool]:
+        answers = [algo.motion_detected for algo in self._algorithms]
+        if any(answer is None for answer in answers):
+            return None
+        return any(answers)
+
+    @property
+    def result(self) -> Optional[DetectionResult]:
+        # Detections of the first member that produces them
+        for algo in self._algorithms:
+            if algo.result is not None:
+                return algo.result
+        return None
+
+    @property
+    def heatmap(self) -> Optional[Dict[str, Any]]:
+        for algo in self._algorithms:
+            heatmap = algo.heatmap
+            if heatmap is not None:
+                return heatmap
+        return None
+
+    def reset_heatmap(self) -> bool:
+        return any([algo.reset_heatmap() for algo in self._algorithms])
+
+    def process(self, frame: Any, cache: Optional[FrameCache] = None) -> Any:
+        if cache is None:
+            cache = self._cache
+            cache.begin(frame)
+        for algo in self._algorithms:
+            frame = algo.process(frame, cache)
+        return frame
+
+    def release(self) -> None:
+        for algo in self._algorithms:
+            algo.release()
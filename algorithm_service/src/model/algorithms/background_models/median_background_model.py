@@ -0,0 +1,71 @@
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from globals.enums.background_model_type import BackgroundModelType
+from infrastructure.interfaces.algorithms.ibackground_model import IBackgroundModel
+
+
+class MedianBackgroundModel(IBackgroundModel):
+    # Approximate running median: every frame each background pixel moves step grey levels towards
+    # the current pixel, which converges on the temporal median. Everything stays in uint8 and is
+    # updated in place with masked saturating adds, so it is the cheapest model available.
+
+    def __init__(self, diff_threshold: float, step: int) -> None:
+        self._diff_threshold = diff_threshold
+        self._step = float(max(1, step))
+        self._background: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._diff: Optional[np.ndarray] = None
+        self._above: Optional[np.ndarray] = None
+        self._below: Optional[np.ndarray] = None
+
+    @property
+    def model_type(self) -> BackgroundModelType:
+        return BackgroundModelType.MEDIAN
+
+    def apply(self, image: np.ndarray, fgmask: np.ndarray) -> None:
+        image = self._to_gray(image)
+        if self._background is None or self._background.shape != image.shape:
+            # The first frame seeds the model instead of being reported as all motion
+            self.seed(image)
+            fgmask[:] = 0
+            return
+
+        cv2.absdiff(image, self._background, dst=self._diff)
+        cv2.threshold(self._diff, self._diff_threshold, 255, cv2.THRESH_BINARY, dst=fgmask)
+
+        # Step towards the current frame; masks are 255 where the pixel is above / below the model
+        cv2.compare(image, self._background, cv2.CMP_GT, dst=self._above)
+        cv2.compare(image, self._background, cv2.CMP_LT, dst=self._below)
+        cv2.add(self._background, self._step, dst=self._background, mask=self._above)
+        cv2.subtract(self._background, self._step, dst=self._background, mask=self._below)
+
+    def background_image(self) -> Optional[np.ndarray]:
+        return self._background
+
+    def seed(self, background: np.ndarray) -> None:
+        background = self._to_gray(background)
+        self._background = background.copy()
+        self._diff = np.empty(background.shape, dtype=np.uint8)
+        self._above = np.empty(background.shape, dtype=np.uint8)
+        self._below = np.empty(background.shape, dtype=np.uint8)
+
+    def reset(self) -> None:
+        self._gray = None
+        self._background = None
+        self._diff = None
+        self._above = None
+        self._below = None
+
+    # ===== Internal =====
+
+    def _to_gray(self, image: np.ndarray) -> np.ndarray:
+        if image.ndim == 2:
+            return image
+        # Colour frames are modelled in grayscale
+        if self._gray is None or self._gray.shape != image.shape[:2]:
+            self._gray = np.empty(image.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
@@ -0,0 +1,46 @@
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from globals.enums.background_model_type import BackgroundModelType
+from infrastructure.interfaces.algorithms.ibackground_model import IBackgroundModel
+
+
+class OpenCvBackgroundModel(IBackgroundModel):
+    # cv2.BackgroundSubtractor (MOG2 / KNN) behind IBackgroundModel. Shadow pixels (127) are dropped
+    # by thresholding, so only confident foreground (255) is reported.
+
+    def __init__(self, model_type: BackgroundModelType, create: Callable[[], cv2.BackgroundSubtractor]) -> None:
+        self._model_type = model_type
+        self._create = create
+        self._subtractor = create()
+
+    @staticmethod
+    def mog2(history: int, var_threshold: float, detect_shadows: bool) -> "OpenCvBackgroundModel":
+        return OpenCvBackgroundModel(BackgroundModelType.MOG2, lambda: cv2.createBackgroundSubtractorMOG2(
+            history=history, varThreshold=var_threshold, detectShadows=detect_shadows))
+
+    @staticmethod
+    def knn(history: int, dist2_threshold: float, detect_shadows: bool) -> "OpenCvBackgroundModel":
+        return OpenCvBackgroundModel(BackgroundModelType.KNN, lambda: cv2.createBackgroundSubtractorKNN(
+            history=history, dist2Threshold=dist2_threshold, detectShadows=detect_shadows))
+
+    @property
+    def model_type(self) -> BackgroundModelType:
+        return self._model_type
+
+    def apply(self, image: np.ndarray, fgmask: np.ndarray) -> None:
+        self._subtractor.apply(image, fgmask)
+        cv2.threshold(fgmask, 244, 255, cv2.THRESH_BINARY, dst=fgmask)
+
+    def background_image(self) -> Optional[np.ndarray]:
+        return self._subtractor.getBackgroundImage()
+
+    def seed(self, background: np.ndarray) -> None:
+        # The subtractors cannot be given a model directly; a learning rate of 1 re-initialises every
+        # pixel's model from this one image
+        self._subtractor.apply(background, np.empty(background.shape[:2], dtype=np.uint8), 1.0)
+
+    def reset(self) -> None:
+        self._subtractor = self._create()
@@ -0,0 +1,108 @@
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from infrastructure.interfaces.algorithms.ibackground_model import IBackgroundModel
+
+
+class BackgroundWarmStart:
+    # Gets a background model usable right away instead of after `history` frames. A snapshot saved
+    # by the previous run (at release and periodically, so crashes keep a recent one) is restored
+    # when it matches the modelled image size. Otherwise bootstrap_frames images, taken every
+    # bootstrap_stride frames so slow objects move out of the way, are collected while the model
+    # runs normally, and their per-pixel median then re-seeds it, wiping out ghosts of anything
+    # that was in view at start-up.
+
+    def __init__(self, snapshot_path: Optional[str] = None, bootstrap_frames: int = Consts.MOTION_BOOTSTRAP_FRAMES,
+                 bootstrap_stride: int = Consts.MOTION_BOOTSTRAP_STRIDE,
+                 snapshot_interval_seconds: float = Consts.MOTION_SNAPSHOT_INTERVAL_SECONDS) -> None:
+        self._snapshot_path = snapshot_path
+        self._bootstrap_frames = bootstrap_frames
+        self._bootstrap_stride = max(1, bootstrap_stride)
+        self._snapshot_interval = snapshot_interval_seconds
+        self._snapshot: Optional[np.ndarray] = self._load(snapshot_path)
+        self._stack: Optional[np.ndarray] = None
+        self._collected = 0
+        self._seen = 0
+        self._last_saved = time.monotonic()
+        self._restored = False
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["BackgroundWarmStart"]:
+        snapshot_path = config.get("background_snapshot_path") or None
+        bootstrap_frames = int(config.get("bootstrap_frames", Consts.MOTION_BOOTSTRAP_FRAMES))
+        if snapshot_path is None and bootstrap_frames <= 0:
+            return None
+        return BackgroundWarmStart(snapshot_path, bootstrap_frames,
+                                   int(config.get("bootstrap_stride", Consts.MOTION_BOOTSTRAP_STRIDE)),
+                                   float(config.get("snapshot_interval_seconds", Consts.MOTION_SNAPSHOT_INTERVAL_SECONDS)))
+
+    @property
+    def bootstrapping(self) -> bool:
+        return self._stack is not None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"restored": self._restored, "bootstrapping": self.bootstrapping}
+
+    def begin(self, model: IBackgroundModel, image_shape: Tuple[int, ...]) -> None:
+        # Called whenever the model is reset for a new image size
+        snapshot = self._snapshot
+        self._snapshot = None
+        if snapshot is not None and snapshot.shape[:2] == image_shape[:2]:
+            model.seed(self._match_channels(snapshot, image_shape))
+            self._restored = True
+            self._stack = None
+            return
+        if self._bootstrap_frames > 0:
+            self._stack = np.empty((self._bootstrap_frames, *image_shape), dtype=np.uint8)
+            self._collected = 0
+            self._seen = 0
+
+    def add(self, model: IBackgroundModel, image: np.ndarray) -> None:
+        # Feed every modelled image while bootstrapping; seeds the model once enough are collected
+        self._seen += 1
+        if (self._seen - 1) % self._bootstrap_stride:
+            return
+        self._stack[self._collected] = image
+        self._collected += 1
+        if self._collected < len(self._stack):
+            return
+        model.seed(np.median(self._stack, axis=0).astype(np.uint8))
+        self._stack = None
+
+    def save_if_due(self, model: IBackgroundModel) -> None:
+        if self._snapshot_interval > 0 and time.monotonic() - self._last_saved >= self._snapshot_interval:
+            self.save(model)
+
+    def save(self, model: IBackgroundModel) -> None:
+        self._last_saved = time.monotonic()
+        background = model.background_image()
+        if self._snapshot_path is None or background is None or self.bootstrapping:
+            return
+        os.makedirs(os.path.dirname(self._snapshot_path) or ".", exist_ok=True)
+        # Write next to the target and swap it in, so a crash mid-write never leaves a torn snapshot
+        root, extension = os.path.splitext(self._snapshot_path)
+        temp_path = f"{root}.tmp{extension}"
+        if cv2.imwrite(temp_path, background):
+            os.replace(temp_path, self._snapshot_path)
+
+    # ===== Internal =====
+
+    @staticmethod
+    def _load(snapshot_path: Optional[str]) -> Optional[np.ndarray]:
+        if snapshot_path is None or not os.path.exists(snapshot_path):
+            return None
+        return cv2.imread(snapshot_path, cv2.IMREAD_UNCHANGED)
+
+    @staticmethod
+    def _match_channels(snapshot: np.ndarray, image_shape: Tuple[int, ...]) -> np.ndarray:
+        if snapshot.ndim == 2 and len(image_shape) == 3:
+            return cv2.cvtColor(snapshot, cv2.COLOR_GRAY2BGR)
+        if snapshot.ndim == 3 and len(image_shape) == 2:
+            return cv2.cvtColor(snapshot, cv2.COLOR_BGR2GRAY)
+        return snapshot
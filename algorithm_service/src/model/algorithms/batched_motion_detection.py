@@ -0,0 +1,210 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from infrastructure.factories.logger_factory import LoggerFactory
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+
+
+class BatchedMotionDetectionEngine:
+    # Motion detection for N cameras at once. Frames are packed into one (N, H, W) batch at a fixed
+    # analysis size and every stage runs as a single call over the whole batch: one cvtColor, one
+    # vectorized running-average background update and threshold, one erode/dilate and one
+    # connected-components pass. Camera images are stacked vertically with zero rows in between,
+    # wide enough that erode + dilate from two neighbouring cameras cannot meet; the gap is cleared
+    # again after morphology, so a region never joins one of the next camera or extends past its frame.
+    #
+    # MOG2 keeps an opaque model per instance and cannot be batched, so this engine models the
+    # background as a per-pixel running average (learning rate 1 / history).
+
+    def __init__(self) -> None:
+        self._logger = LoggerFactory.get_logger_manager()
+        self._num_cameras = 0
+        self._width = Consts.BATCH_ANALYSIS_WIDTH
+        self._height = Consts.BATCH_ANALYSIS_HEIGHT
+        self._stride = 0
+        self._kernel: Optional[np.ndarray] = None
+        self._erode_iterations = 0
+        self._dilate_iterations = Consts.MOTION_DILATE_ITER
+
+        # Per-camera settings, shaped for broadcasting over the batch
+        self._thresholds: Optional[np.ndarray] = None
+        self._learning_rates: Optional[np.ndarray] = None
+        self._min_areas: Optional[np.ndarray] = None
+        self._draw_bbox: List[bool] = []
+        self._frame_idx: List[int] = []
+
+        # Preallocated batch buffers
+        self._bgr: Optional[np.ndarray] = None
+        self._gray: Optional[np.ndarray] = None
+        self._background: Optional[np.ndarray] = None
+        self._diff: Optional[np.ndarray] = None
+        self._abs_diff: Optional[np.ndarray] = None
+        self._rates: Optional[np.ndarray] = None
+        self._foreground: Optional[np.ndarray] = None
+        self._morph: Optional[np.ndarray] = None
+        self._initialized: Optional[np.ndarray] = None
+        # Per camera, frames handed back when we must draw on a copy; rotated so a frame still
+        # queued for display is not overwritten by the next one
+        self._output_buffers: List[List[np.ndarray]] = []
+        self._output_index: List[int] = []
+
+    def setup(self, configs: Sequence[Dict[str, Any]]) -> None:
+        self._num_cameras = len(configs)
+        n, h, w = self._num_cameras, self._height, self._width
+
+        self._thresholds = np.array([float(c.get("diff_threshold", Consts.BATCH_DIFF_THRESHOLD)) for c in configs],
+                                    dtype=np.float32).reshape(n, 1, 1)
+        self._learning_rates = np.array([1.0 / max(1, int(c.get("history", Consts.MOTION_BG_HISTORY))) for c in configs],
+                                        dtype=np.float32).reshape(n, 1, 1)
+        self._min_areas = np.array([float(c.get("min_contour_area", Consts.MOTION_MIN_AREA)) for c in configs],
+                                   dtype=np.float32)
+        self._draw_bbox = [bool(c.get("draw_bbox", True)) for c in configs]
+        self._frame_idx = [0] * n
+
+        # Morphology runs once over the whole batch, so its settings are shared by all cameras
+        self._erode_iterations = max((int(c.get("erode_iterations", 0)) for c in configs), default=0)
+        self._dilate_iterations = max((int(c.get("dilate_iterations", Consts.MOTION_DILATE_ITER)) for c in configs),
+                                      default=Consts.MOTION_DILATE_ITER)
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (Consts.MOTION_KERNEL_SIZE, Consts.MOTION_KERNEL_SIZE))
+        # Morphology grows a region by kernel // 2 rows per iteration, from both cameras around the gap
+        reach = (Consts.MOTION_KERNEL_SIZE // 2) * (self._dilate_iterations + self._erode_iterations)
+        separator = 2 * reach + 1
+        self._stride = h + separator
+
+        self._bgr = np.zeros((n, h, w, 3), dtype=np.uint8)
+        self._gray = np.zeros((n, h, w), dtype=np.uint8)
+        self._background = np.zeros((n, h, w), dtype=np.float32)
+        self._diff = np.zeros((n, h, w), dtype=np.float32)
+        self._abs_diff = np.zeros((n, h, w), dtype=np.float32)
+        self._rates = np.zeros((n, 1, 1), dtype=np.float32)
+        # Separator rows below each camera stay zero forever; morphology writes to its own buffer
+        self._foreground = np.zeros((n, self._stride, w), dtype=np.uint8)
+        self._morph = np.zeros((n * self._stride, w), dtype=np.uint8)
+        self._initialized = np.zeros(n, dtype=bool)
+        self._output_buffers = [[] for _ in range(n)]
+        self._output_index = [0] * n
+
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.BATCH_ENGINE_READY.format(n, w, h))
+
+    def process(self, frames: Sequence[Optional[np.ndarray]]) -> List[Optional[np.ndarray]]:
+        # frames[i] is camera i's new frame, or None if it has none this tick. Returns, for each camera
+        # with a frame, an int32 array of boxes (x, y, w, h, area) in that frame's own coordinates.
+        n, h, w = self._num_cameras, self._height, self._width
+        fresh = np.array([frame is not None for frame in frames], dtype=bool)
+        if not fresh.any():
+            return [None] * n
+
+        for i, frame in enumerate(frames):
+            if frame is None:
+                continue
+            if frame.shape[:2] == (h, w):
+                self._bgr[i] = frame
+            else:
+                cv2.resize(frame, (w, h), dst=self._bgr[i], interpolation=cv2.INTER_AREA)
+
+        cv2.cvtColor(self._bgr.reshape(n * h, w, 3), cv2.COLOR_BGR2GRAY, dst=self._gray.reshape(n * h, w))
+
+        # A camera's first frame seeds its background instead of being reported as all motion
+        seed = fresh & ~self._initialized
+        if seed.any():
+            self._background[seed] = self._gray[seed]
+            self._initialized |= seed
+
+        np.subtract(self._gray, self._background, out=self._diff)
+        np.abs(self._diff, out=self._abs_diff)
+        np.greater(self._abs_diff, self._thresholds, out=self._foreground[:, :h].view(np.bool_))
+
+        # Running-average update; cameras without a new frame get a zero rate so their model is untouched
+        np.multiply(self._learning_rates, fresh.reshape(n, 1, 1), out=self._rates)
+        self._diff *= self._rates
+        self._background += self._diff
+
+        tall = self._foreground.reshape(n * self._stride, w)
+        if self._erode_iterations > 0:
+            cv2.erode(tall, self._kernel, dst=self._morph, iterations=self._erode_iterations)
+            cv2.dilate(self._morph, self._kernel, dst=self._morph, iterations=self._dilate_iterations)
+        else:
+            cv2.dilate(tall, self._kernel, dst=self._morph, iterations=self._dilate_iterations)
+        # Drop what dilation spread into the gaps, as it would have been clipped at a lone frame's edge
+        self._morph.reshape(n, self._stride, w)[:, h:] = 0
+
+        _, _, stats, _ = cv2.connectedComponentsWithStats(self._morph, connectivity=8)
+        return self._split_detections(stats[1:], frames, fresh)
+
+    def draw(self, camera_index: int, frame: np.ndarray, boxes: Optional[np.ndarray]) -> np.ndarray:
+        if boxes is None or not len(boxes) or not self._draw_bbox[camera_index]:
+            return frame
+        # Frames from the shared memory ring are read-only views; copy only when we draw on them
+        if not frame.flags.writeable:
+            frame = self._output_copy(camera_index, frame)
+        for x, y, bw, bh, _ in boxes:
+            cv2.rectangle(frame, (int(x), int(y)), (int(x + bw), int(y + bh)), (0, 255, 0), 2)
+        return frame
+
+    def release(self) -> None:
+        self._bgr = None
+        self._gray = None
+        self._background = None
+        self._diff = None
+        self._abs_diff = None
+        self._foreground = None
+        self._morph = None
+        self._output_buffers = [[] for _ in range(self._num_cameras)]
+
+    # ===== Internal =====
+
+    def _output_copy(self, camera_index: int, frame: np.ndarray) -> np.ndarray:
+        # Buffers follow the camera's frame size, so they are only reallocated when it changes
+        buffers = self._output_buffers[camera_index]
+        if not buffers or buffers[0].shape != frame.shape or buffers[0].dtype != frame.dtype:
+            buffers[:] = [np.empty_like(frame) for _ in range(Consts.MOTION_OUTPUT_BUFFERS)]
+            self._output_index[camera_index] = 0
+        output = buffers[self._output_index[camera_index]]
+        self._output_index[camera_index] = (self._output_index[camera_index] + 1) % len(buffers)
+        np.copyto(output, frame)
+        return output
+
+    def _split_detections(self, stats: np.ndarray, frames: Sequence[Optional[np.ndarray]],
+                          fresh: np.ndarray) -> List[Optional[np.ndarray]]:
+        n = self._num_cameras
+        cameras = stats[:, cv2.CC_STAT_TOP] // self._stride
+        order = np.argsort(cameras, kind="stable")
+        stats, cameras = stats[order], cameras[order]
+
+        # Scale factors from analysis size back to each camera's frame size
+        scale_x = np.ones(n, dtype=np.float32)
+        scale_y = np.ones(n, dtype=np.float32)
+        for i, frame in enumerate(frames):
+            if frame is not None:
+                scale_x[i] = frame.shape[1] / self._width
+                scale_y[i] = frame.shape[0] / self._height
+
+        areas = stats[:, cv2.CC_STAT_AREA] * scale_x[cameras] * scale_y[cameras]
+        keep = fresh[cameras] & (areas >= self._min_areas[cameras])
+        stats, cameras, areas = stats[keep], cameras[keep], areas[keep]
+
+        boxes = np.empty((len(stats), 5), dtype=np.int32)
+        boxes[:, 0] = stats[:, cv2.CC_STAT_LEFT] * scale_x[cameras]
+        boxes[:, 1] = (stats[:, cv2.CC_STAT_TOP] - cameras * self._stride) * scale_y[cameras]
+        boxes[:, 2] = stats[:, cv2.CC_STAT_WIDTH] * scale_x[cameras]
+        boxes[:, 3] = stats[:, cv2.CC_STAT_HEIGHT] * scale_y[cameras]
+        boxes[:, 4] = areas
+
+        # Boxes are sorted by camera, so each camera's boxes are one contiguous slice
+        bounds = np.searchsorted(cameras, np.arange(n + 1))
+        results: List[Optional[np.ndarray]] = []
+        for i in range(n):
+            if not fresh[i]:
+                results.append(None)
+                continue
+            camera_boxes = boxes[bounds[i]:bounds[i + 1]]
+            results.append(camera_boxes)
+            self._frame_idx[i] += 1
+            if len(camera_boxes) and self._frame_idx[i] % max(1, Consts.ALGO_FRAME_RATE) == 0:
+                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                                 LoggerMessages.MOTION_REGION_COUNT.format(i, len(camera_boxes)))
+        return results
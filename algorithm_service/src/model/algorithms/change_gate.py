@@ -0,0 +1,74 @@
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from model.algorithms.frame_cache import FrameCache
+
+
+class ChangeGate:
+    # Cheap pre-check in front of the background model: each frame is reduced to a tiny grayscale
+    # thumbnail and compared with the thumbnail of the last frame that went through the full pipeline.
+    # Below the threshold (mean absolute difference, 0-255) the frame is skipped. Every
+    # refresh_frames consecutive skips one frame is let through anyway, so the background model keeps
+    # learning slow changes such as daylight.
+
+    def __init__(self, size: Tuple[int, int] = (Consts.MOTION_GATE_WIDTH, Consts.MOTION_GATE_HEIGHT),
+                 threshold: float = Consts.MOTION_GATE_THRESHOLD,
+                 refresh_frames: int = Consts.MOTION_GATE_REFRESH_FRAMES) -> None:
+        self._size = size  # width, height
+        self._threshold = threshold
+        self._refresh_frames = max(1, refresh_frames)
+
+        self._reference = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._diff = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._has_reference = False
+        self._consecutive_skips = 0
+
+        self._processed = 0
+        self._skipped = 0
+        self._forced = 0
+        self._last_difference: Optional[float] = None
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["ChangeGate"]:
+        if not bool(config.get("change_gate", Consts.MOTION_CHANGE_GATE)):
+            return None
+        size = (int(config.get("gate_width", Consts.MOTION_GATE_WIDTH)),
+                int(config.get("gate_height", Consts.MOTION_GATE_HEIGHT)))
+        return ChangeGate(size, float(config.get("gate_threshold", Consts.MOTION_GATE_THRESHOLD)),
+                          int(config.get("gate_refresh_frames", Consts.MOTION_GATE_REFRESH_FRAMES)))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self._processed + self._skipped
+        return {
+            "processed": self._processed,
+            "skipped": self._skipped,
+            "forced": self._forced,
+            "skip_ratio": round(self._skipped / total, 3) if total else 0.0,
+            "last_difference": None if self._last_difference is None else round(self._last_difference, 2),
+        }
+
+    def should_process(self, cache: FrameCache) -> bool:
+        thumbnail = cache.gray(self._size)
+        if self._has_reference:
+            cv2.absdiff(thumbnail, self._reference, dst=self._diff)
+            self._last_difference = cv2.mean(self._diff)[0]
+            if self._last_difference < self._threshold:
+                self._consecutive_skips += 1
+                if self._consecutive_skips < self._refresh_frames:
+                    self._skipped += 1
+                    return False
+                self._forced += 1
+
+        self._consecutive_skips = 0
+        self._processed += 1
+        np.copyto(self._reference, thumbnail)
+        self._has_reference = True
+        return True
+
+    def reset(self) -> None:
+        self._has_reference = False
+        self._consecutive_skips = 0
@@ -0,0 +1,76 @@
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameCache:
+    # Preprocessing shared by every algorithm running on one camera. Each derived image (downscaled
+    # copy, grayscale, blurred grayscale) is computed at most once per frame, the first time any
+    # algorithm asks for it, into a buffer that is reused from frame to frame. Callers must treat
+    # the returned images as read-only.
+
+    def __init__(self) -> None:
+        self._frame: Optional[np.ndarray] = None
+        self._buffers: Dict[Hashable, np.ndarray] = {}
+        self._valid: Set[Hashable] = set()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def frame(self) -> np.ndarray:
+        # The original frame of this round, never annotated by earlier algorithms
+        return self._frame
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self._hits, "misses": self._misses, "buffers": len(self._buffers)}
+
+    def begin(self, frame: np.ndarray) -> None:
+        self._frame = frame
+        self._valid.clear()
+
+    def resized(self, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        # The frame at size (w, h); None or the frame's own size returns the frame itself
+        if size is None or size == (self._frame.shape[1], self._frame.shape[0]):
+            return self._frame
+        key = ("resized", size)
+        buffer = self._lookup(key, (size[1], size[0], *self._frame.shape[2:]))
+        if key not in self._valid:
+            cv2.resize(self._frame, size, dst=buffer, interpolation=cv2.INTER_AREA)
+            self._valid.add(key)
+        return buffer
+
+    def gray(self, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        source = self.resized(size)
+        if source.ndim == 2:
+            return source
+        key = ("gray", size)
+        buffer = self._lookup(key, source.shape[:2])
+        if key not in self._valid:
+            cv2.cvtColor(source, cv2.COLOR_BGR2GRAY, dst=buffer)
+            self._valid.add(key)
+        return buffer
+
+    def blurred(self, kernel_size: int, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        # Gaussian-blurred grayscale at size; kernel_size must be odd
+        source = self.gray(size)
+        key = ("blurred", kernel_size, size)
+        buffer = self._lookup(key, source.shape)
+        if key not in self._valid:
+            cv2.GaussianBlur(source, (kernel_size, kernel_size), 0, dst=buffer)
+            self._valid.add(key)
+        return buffer
+
+    # ===== Internal =====
+
+    def _lookup(self, key: Hashable, shape: Tuple[int, ...]) -> np.ndarray:
+        if key in self._valid:
+            self._hits += 1
+            return self._buffers[key]
+        self._misses += 1
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._buffers[key] = buffer
+        return buffer
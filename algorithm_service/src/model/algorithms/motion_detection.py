@@ -1,4 +1,7 @@
-from typing import Any, Dict, Optional, Tuple
+import logging
+import threading
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -7,12 +10,32 @@ from globals.consts.consts import Consts
 from infrastructure.factories.logger_factory import LoggerFactory
 from globals.consts.const_strings import ConstStrings
 from globals.consts.logger_messages import LoggerMessages
+from infrastructure.interfaces.algorithms.ialgorithm import IAlgorithm
+from infrastructure.interfaces.algorithms.ibackground_model import IBackgroundModel
+from model.algorithms.background_models.opencv_background_model import OpenCvBackgroundModel
+from model.algorithms.activity_heatmap import ActivityHeatmap
+from model.algorithms.background_warm_start import BackgroundWarmStart
+from model.algorithms.change_gate import ChangeGate
+from model.algorithms.frame_cache import FrameCache
+from model.algorithms.object_tracker import ObjectTracker
+from model.algorithms.region_extractor import RegionExtractor
+from model.algorithms.roi_mask import RoiMask
+from model.algorithms.zone_map import ZoneMap
+from model.data_classes.detection_result import DetectionResult
 
 
-class MotionDetectionAlgorithm:
-    def __init__(self) -> None:
+class MotionDetectionAlgorithm(IAlgorithm):
+    # tracemalloc traces the whole process, so only one instance per process reports allocations
+    _allocation_reporter: Optional["MotionDetectionAlgorithm"] = None
+    _allocation_reporter_lock = threading.Lock()
+
+    def __init__(self, background_model: Optional[IBackgroundModel] = None) -> None:
         self._logger = LoggerFactory.get_logger_manager()
-        self._bg_subtractor: Optional[cv2.BackgroundSubtractor] = None
+        # Chosen per camera by AlgorithmFactory; MOG2 from this algorithm's config when none is given
+        self._bg_model: Optional[IBackgroundModel] = background_model
+        self._ready = False
+        # Snapshot restore / median bootstrap so detections are usable right after a restart
+        self._warm_start: Optional[BackgroundWarmStart] = None
         self._kernel: Optional[np.ndarray] = None
         self._min_contour_area: int = Consts.MOTION_MIN_AREA
         self._threshold: int = Consts.MOTION_BG_VAR_THRESHOLD
@@ -22,9 +45,49 @@ class MotionDetectionAlgorithm:
         self._detect_shadows: bool = Consts.MOTION_DETECT_SHADOWS
         self._draw_bbox: bool = True
         self._draw_mask: bool = False
-        self._mask_rect: Optional[Tuple[int, int, int, int]] = None  # x, y, w, h
+        # Include polygons minus exclusion zones (legacy "mask_rect" becomes one include rectangle)
+        self._roi: Optional[RoiMask] = None
+        # Named zones; each detection is assigned to the zone under its centre
+        self._zones: Optional[ZoneMap] = None
+        self._detection_zones: np.ndarray = np.empty(0, dtype=np.int32)
+        self._zone_counts: np.ndarray = np.empty(0, dtype=np.int64)
+        # Analysis mode: model a downscaled grayscale image and map boxes back to frame coordinates
+        self._analysis_size: Optional[Tuple[int, int]] = None  # width, height
+        # Optional cheap pre-check that skips the pipeline on static frames
+        self._change_gate: Optional[ChangeGate] = None
+        # Last detections as an int32 (x, y, w, h, area) array in frame coordinates; redrawn on frames the gate skips
+        self._last_boxes: np.ndarray = RegionExtractor.empty()
+        self._result: Optional[DetectionResult] = None
+        # Optional merging of overlapping / nearby regions (distance in frame pixels)
+        self._merge_boxes: bool = Consts.MOTION_MERGE_BOXES
+        self._merge_distance: int = Consts.MOTION_MERGE_DISTANCE
+        # Optional tracking stage giving each region a stable track ID (0 while tentative)
+        self._tracker: Optional[ObjectTracker] = None
+        self._track_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        # Decaying per-cell activity accumulated from the foreground mask
+        self._heatmap: Optional[ActivityHeatmap] = None
         self._frame_idx: int = 0
 
+        # Hot-loop buffers, (re)allocated only when the frame size changes; every OpenCV call writes
+        # into them through dst= instead of returning a fresh array
+        self._buffers_key: Optional[Tuple[Any, ...]] = None
+        # Preprocessing used when running alone; chained algorithms pass a shared one to process()
+        self._cache = FrameCache()
+        self._fgmask: Optional[np.ndarray] = None
+        self._morph: Optional[np.ndarray] = None
+        self._labels: Optional[np.ndarray] = None
+        # Frames handed back to the caller when we must draw on a copy; rotated so a frame still
+        # queued for display is not overwritten by the next one
+        self._output_buffers: List[np.ndarray] = []
+        self._output_index: int = 0
+
+        # Optional allocation accounting (tracemalloc), reported through stats. The numbers are
+        # process-wide: they include whatever other threads allocate while this one processes a frame
+        self._report_allocations: bool = Consts.MOTION_REPORT_ALLOCATIONS
+        self._measured_frames: int = 0
+        self._allocated_bytes: int = 0
+        self._max_allocated_bytes: int = 0
+
     def setup(self, config: Dict[str, Any]) -> None:
         self._min_contour_area = int(config.get("min_contour_area", self._min_contour_area))
         self._threshold = int(config.get("threshold", self._threshold))
@@ -34,52 +97,218 @@ class MotionDetectionAlgorithm:
         self._detect_shadows = bool(config.get("detect_shadows", self._detect_shadows))
         self._draw_bbox = bool(config.get("draw_bbox", self._draw_bbox))
         self._draw_mask = bool(config.get("draw_mask", self._draw_mask))
-        mask_rect = config.get("mask_rect")
-        if isinstance(mask_rect, (list, tuple)) and len(mask_rect) == 4:
-            self._mask_rect = (int(mask_rect[0]), int(mask_rect[1]), int(mask_rect[2]), int(mask_rect[3]))
+        self._roi = RoiMask.from_config(config)
+        self._zones = ZoneMap.from_config(config)
+        if self._zones is not None:
+            self._zone_counts = np.zeros(len(self._zones.names), dtype=np.int64)
+        self._change_gate = ChangeGate.from_config(config)
+        self._warm_start = BackgroundWarmStart.from_config(config)
+        self._merge_boxes = bool(config.get("merge_boxes", self._merge_boxes))
+        self._merge_distance = int(config.get("merge_distance", self._merge_distance))
+        self._tracker = ObjectTracker.from_config(config)
+        self._heatmap = ActivityHeatmap.from_config(config)
+        analysis_width = int(config.get("analysis_width", Consts.MOTION_ANALYSIS_WIDTH))
+        analysis_height = int(config.get("analysis_height", Consts.MOTION_ANALYSIS_HEIGHT))
+        if analysis_width > 0 and analysis_height > 0:
+            self._analysis_size = (analysis_width, analysis_height)
+        self._report_allocations = bool(config.get("report_allocations", self._report_allocations))
+        if self._report_allocations:
+            self._report_allocations = self._claim_allocation_reporting()
+        if self._report_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
 
-        self._bg_subtractor = cv2.createBackgroundSubtractorMOG2(history=self._history, varThreshold=self._threshold, detectShadows=self._detect_shadows)
-        self._kernel = np.ones((3, 3), np.uint8)
+        if self._bg_model is None:
+            self._bg_model = OpenCvBackgroundModel.mog2(self._history, self._threshold, self._detect_shadows)
+        self._ready = True
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (Consts.MOTION_KERNEL_SIZE, Consts.MOTION_KERNEL_SIZE))
         try:
-            self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"MotionDetectionAlgorithm initialized: min_area={self._min_contour_area} threshold={self._threshold} history={self._history} shadows={self._detect_shadows}")
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"MotionDetectionAlgorithm initialized: min_area={self._min_contour_area} background_model={self._bg_model.model_type.value} analysis_size={self._analysis_size} roi={self._roi is not None} tracking={self._tracker is not None} zones={self._zones.names if self._zones else []}")
         except Exception:
             pass
 
-    def process(self, frame: Any) -> Any:
-        if self._bg_subtractor is None:
+    @property
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {}
+        if self._change_gate is not None:
+            stats["gate"] = self._change_gate.stats
+        if self._zones is not None:
+            stats["zones"] = self._zones.totals
+        if self._tracker is not None:
+            stats["tracking"] = self._tracker.stats
+        if self._heatmap is not None:
+            stats["heatmap"] = self._heatmap.stats
+        if self._warm_start is not None:
+            stats["warm_start"] = self._warm_start.stats
+        if self._measured_frames:
+            stats["allocated_bytes_per_frame"] = self._allocated_bytes // self._measured_frames
+            stats["max_allocated_bytes"] = self._max_allocated_bytes
+        return stats
+
+    @property
+    def motion_detected(self) -> bool:
+        # Whether the last analysed frame had motion regions (frames skipped by the gate keep the previous answer)
+        return len(self._last_boxes) > 0
+
+    @property
+    def detections(self) -> np.ndarray:
+        # int32 array of (x, y, w, h, area) rows in frame coordinates
+        return self._last_boxes
+
+    @property
+    def result(self) -> Optional[DetectionResult]:
+        return self._result
+
+    @property
+    def heatmap(self) -> Optional[Dict[str, Any]]:
+        if self._heatmap is None:
+            return None
+        return self._heatmap.to_dict()
+
+    def reset_heatmap(self) -> bool:
+        if self._heatmap is None:
+            return False
+        self._heatmap.reset()
+        return True
+
+    @property
+    def detection_zones(self) -> np.ndarray:
+        # Zone index of each row of detections (ZoneMap.NO_ZONE outside every zone)
+        return self._detection_zones
+
+    @property
+    def track_ids(self) -> np.ndarray:
+        # Track ID of each row of detections (0 while the track is tentative); empty without tracking
+        return self._track_ids
+
+    @property
+    def tracks(self) -> List[Dict[str, Any]]:
+        # Confirmed tracks with their last box, velocity (pixels per analysed frame) and age
+        if self._tracker is None:
+            return []
+        return self._tracker.tracks
+
+    @property
+    def zone_counts(self) -> Dict[str, int]:
+        # Detections per named zone in the last analysed frame
+        if self._zones is None:
+            return {}
+        return dict(zip(self._zones.names, self._zone_counts.tolist()))
+
+    def process(self, frame: Any, cache: Optional[FrameCache] = None) -> Any:
+        if cache is None:
+            cache = self._cache
+            cache.begin(frame)
+        if not self._report_allocations or not tracemalloc.is_tracing():
+            return self._process(frame, cache)
+
+        # Peak traced memory above the starting point = bytes allocated while processing this frame
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        buffers_key = self._buffers_key
+        frame = self._process(frame, cache)
+        _, peak = tracemalloc.get_traced_memory()
+        if self._buffers_key != buffers_key:
+            # Frames that (re)allocate the buffers are set-up cost, not steady-state allocation
             return frame
+        allocated = max(peak - current, 0)
+        self._measured_frames += 1
+        self._allocated_bytes += allocated
+        self._max_allocated_bytes = max(self._max_allocated_bytes, allocated)
+        return frame
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    def release(self) -> None:
+        if self._ready and self._warm_start is not None:
+            try:
+                self._warm_start.save(self._bg_model)
+            except Exception as e:
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+        if self._ready and self._heatmap is not None:
+            try:
+                self._heatmap.save()
+            except Exception as e:
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+        self._ready = False
+        with MotionDetectionAlgorithm._allocation_reporter_lock:
+            if MotionDetectionAlgorithm._allocation_reporter is self:
+                MotionDetectionAlgorithm._allocation_reporter = None
+        self._kernel = None
+        self._buffers_key = None
+        self._cache = FrameCache()
+        self._fgmask = None
+        self._morph = None
+        self._labels = None
+        self._output_buffers = []
+        self._last_boxes = RegionExtractor.empty()
+        self._result = None
+        self._track_ids = np.empty(0, dtype=np.int64)
+        if self._tracker is not None:
+            self._tracker.reset()
 
-        if self._mask_rect is not None:
-            x, y, w, h = self._mask_rect
-            mask = np.zeros_like(gray)
-            cv2.rectangle(mask, (x, y), (x + w, y + h), 255, thickness=-1)
-            gray = cv2.bitwise_and(gray, mask)
-            if self._draw_mask:
-                overlay = frame.copy()
-                cv2.rectangle(overlay, (x, y), (x + w, y + h), (255, 0, 0), 2)
-                frame = overlay
+    # ===== Internal =====
 
-        fgmask = self._bg_subtractor.apply(frame)
-        _, fgmask = cv2.threshold(fgmask, 244, 255, cv2.THRESH_BINARY)
+    def _process(self, frame: Any, cache: FrameCache) -> Any:
+        if not self._ready:
+            return frame
+
+        frame_height, frame_width = frame.shape[:2]
+        width, height = self._analysis_size if self._analysis_size is not None else (frame_width, frame_height)
+        self._ensure_buffers(frame, width, height)
+        scale_x = frame_width / width
+        scale_y = frame_height / height
+
+        if self._change_gate is not None and not self._change_gate.should_process(cache):
+            # Nothing changed since the last modelled frame: keep showing its detections
+            return self._draw(frame, cache)
+
+        if self._analysis_size is not None:
+            # MOG2 cost grows with pixels and channels, so model a small single-channel image and
+            # only map the resulting boxes back up to the frame
+            image = cache.gray((width, height))
+        else:
+            image = cache.frame
+
+        offset = (0, 0)
+        if self._roi is not None:
+            # Pixels outside the ROI bounding box are never modelled
+            image = self._roi.crop(image)
+            offset = self._roi.bounds[:2]
+
+        if self._warm_start is not None:
+            if self._warm_start.bootstrapping:
+                self._warm_start.add(self._bg_model, image)
+            else:
+                self._warm_start.save_if_due(self._bg_model)
+
+        fgmask = self._fgmask
+        self._bg_model.apply(image, fgmask)
+        if self._roi is not None:
+            cv2.bitwise_and(fgmask, self._roi.mask, dst=fgmask)
         if self._erode_iterations > 0:
-            fgmask = cv2.erode(fgmask, self._kernel, iterations=self._erode_iterations)
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (Consts.MOTION_KERNEL_SIZE, Consts.MOTION_KERNEL_SIZE))
-        fgmask = cv2.dilate(fgmask, kernel, iterations=self._dilate_iterations)
-
-        contours, _ = cv2.findContours(fgmask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-        regions = 0
-        for cnt in contours:
-            area = cv2.contourArea(cnt)
-            if area < self._min_contour_area:
-                continue
-            x, y, w, h = cv2.boundingRect(cnt)
-            if self._draw_bbox:
-                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-            regions += 1
+            cv2.erode(fgmask, self._kernel, dst=self._morph, iterations=self._erode_iterations)
+            cv2.dilate(self._morph, self._kernel, dst=fgmask, iterations=self._dilate_iterations)
+            motion = fgmask
+        else:
+            cv2.dilate(fgmask, self._kernel, dst=self._morph, iterations=self._dilate_iterations)
+            motion = self._morph
+        if self._heatmap is not None:
+            self._heatmap.update(motion)
 
+        # min_contour_area is configured in frame pixels, like the returned boxes and areas
+        self._last_boxes = RegionExtractor.extract(motion, self._min_contour_area, offset, (scale_x, scale_y),
+                                                   self._labels)
+        if self._merge_boxes:
+            self._last_boxes = RegionExtractor.merge(self._last_boxes, self._merge_distance)
+        if self._zones is not None:
+            self._detection_zones, self._zone_counts = self._zones.assign(self._last_boxes)
+        if self._tracker is not None:
+            self._track_ids = self._tracker.update(self._last_boxes)
+            if self._tracker.started or self._tracker.ended:
+                self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.MOTION_TRACKS_CHANGED.format(
+                    "motion", self._tracker.started, self._tracker.ended))
+        self._result = self._make_result()
+        frame = self._draw(frame, cache)
+
+        regions = len(self._last_boxes)
         self._frame_idx += 1
         if regions > 0 and (self._frame_idx % max(1, Consts.ALGO_FRAME_RATE) == 0):
             try:
@@ -89,6 +318,85 @@ class MotionDetectionAlgorithm:
 
         return frame
 
-    def release(self) -> None:
-        self._bg_subtractor = None
-        self._kernel = None
\ No newline at end of file
+    def _claim_allocation_reporting(self) -> bool:
+        # A second reporter would reset the peak the first one is measuring and count its allocations
+        with MotionDetectionAlgorithm._allocation_reporter_lock:
+            reporter = MotionDetectionAlgorithm._allocation_reporter
+            if reporter is None or reporter is self:
+                MotionDetectionAlgorithm._allocation_reporter = self
+                return True
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.MOTION_ALLOCATIONS_IN_USE, level=logging.WARNING)
+        return False
+
+    def _make_result(self) -> DetectionResult:
+        zones = None
+        if self._zones is not None:
+            names = self._zones.names
+            zones = [names[i] if i != ZoneMap.NO_ZONE else None for i in self._detection_zones.tolist()]
+        track_ids = self._track_ids if self._tracker is not None else None
+        return DetectionResult(self._last_boxes, track_ids, zones)
+
+    def _draw(self, frame: np.ndarray, cache: FrameCache) -> np.ndarray:
+        draw_mask = self._draw_mask and (self._roi is not None or self._zones is not None)
+        draw_boxes = self._draw_bbox and len(self._last_boxes) > 0
+        if not draw_mask and not draw_boxes:
+            return frame
+        # Frames from the shared memory ring are read-only views, and the original frame of a shared
+        # cache must stay clean for the algorithms after us; draw on a copy only in those cases
+        if not frame.flags.writeable or (cache is not self._cache and frame is cache.frame):
+            frame = self._output_copy(frame)
+        if draw_mask and self._roi is not None:
+            self._roi.draw(frame)
+        if draw_mask and self._zones is not None:
+            self._zones.draw(frame)
+        if draw_boxes:
+            for x, y, w, h, _ in self._last_boxes.tolist():
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+            if len(self._track_ids) == len(self._last_boxes):
+                for (x, y), track_id in zip(self._last_boxes[:, :2].tolist(), self._track_ids.tolist()):
+                    if track_id:
+                        cv2.putText(frame, str(track_id), (x, max(y - 4, 12)), cv2.FONT_HERSHEY_SIMPLEX,
+                                    0.5, (0, 255, 0), 1)
+        return frame
+
+    def _ensure_buffers(self, frame: np.ndarray, width: int, height: int) -> None:
+        key = (frame.shape, width, height)
+        if key == self._buffers_key:
+            return
+        self._buffers_key = key
+
+        mask_height, mask_width = height, width
+        if self._zones is not None:
+            # Zone labels are looked up in frame coordinates, rendered once per frame size
+            self._zones.rasterize((frame.shape[1], frame.shape[0]))
+        if self._roi is not None:
+            # The ROI mask is rendered once per frame size and cached
+            self._roi.rasterize((frame.shape[1], frame.shape[0]), (width, height))
+            _, _, mask_width, mask_height = self._roi.bounds
+        self._fgmask = np.empty((mask_height, mask_width), dtype=np.uint8)
+        self._morph = np.empty((mask_height, mask_width), dtype=np.uint8)
+        self._labels = np.empty((mask_height, mask_width), dtype=np.int32)
+        self._output_buffers = [np.empty(frame.shape, dtype=np.uint8) for _ in range(Consts.MOTION_OUTPUT_BUFFERS)]
+        self._output_index = 0
+        self._last_boxes = RegionExtractor.empty()
+        self._track_ids = np.empty(0, dtype=np.int64)
+        if self._tracker is not None:
+            self._tracker.reset()
+        if self._change_gate is not None:
+            self._change_gate.reset()
+        # The background model is tied to the modelled image size
+        self._bg_model.reset()
+        if self._heatmap is not None:
+            offset = self._roi.bounds[:2] if self._roi is not None else (0, 0)
+            self._heatmap.begin((mask_height, mask_width), offset, (frame.shape[1] / width, frame.shape[0] / height))
+        if self._warm_start is not None:
+            image_shape = (mask_height, mask_width) if self._analysis_size is not None else (mask_height, mask_width, *frame.shape[2:])
+            self._warm_start.begin(self._bg_model, image_shape)
+
+    def _output_copy(self, frame: np.ndarray) -> np.ndarray:
+        if any(frame is buffer for buffer in self._output_buffers):
+            return frame
+        output = self._output_buffers[self._output_index]
+        self._output_index = (self._output_index + 1) % len(self._output_buffers)
+        np.copyto(output, frame)
+        return output
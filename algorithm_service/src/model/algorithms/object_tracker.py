@@ -0,0 +1,215 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from globals.consts.consts import Consts
+
+
+class ObjectTracker:
+    # Associates motion regions across analysed frames so one object keeps one track ID. Tracks are
+    # predicted forward by their velocity, then matched to the new boxes greedily by IoU; boxes left
+    # over are matched by centroid distance, which keeps small or fast objects whose boxes no longer
+    # overlap. Unmatched boxes start tentative tracks, which are confirmed after min_hits matches, and
+    # tracks unmatched for more than max_missed frames end. All state lives in parallel arrays, one row
+    # per track, and the cost matrices are computed with NumPy broadcasting.
+
+    def __init__(self, iou_threshold: float = Consts.TRACK_IOU_THRESHOLD,
+                 max_distance: float = Consts.TRACK_MAX_DISTANCE,
+                 max_missed: int = Consts.TRACK_MAX_MISSED,
+                 min_hits: int = Consts.TRACK_MIN_HITS,
+                 velocity_smoothing: float = Consts.TRACK_VELOCITY_SMOOTHING) -> None:
+        self._iou_threshold = iou_threshold
+        self._max_distance = max_distance  # frame pixels, 0 disables centroid matching
+        self._max_missed = max(0, max_missed)
+        self._min_hits = max(1, min_hits)
+        self._velocity_smoothing = min(max(velocity_smoothing, 0.0), 1.0)  # weight of the newest step
+
+        self._ids = np.empty(0, dtype=np.int64)
+        self._boxes = np.empty((0, 4), dtype=np.float32)  # x, y, w, h of the last match
+        self._velocities = np.empty((0, 2), dtype=np.float32)  # centre pixels per analysed frame
+        self._ages = np.empty(0, dtype=np.int64)  # analysed frames since the track started
+        self._hits = np.empty(0, dtype=np.int64)
+        self._missed = np.empty(0, dtype=np.int64)
+
+        self._next_id = 1
+        self._detection_ids = np.empty(0, dtype=np.int64)
+        self._started: List[int] = []
+        self._ended: List[int] = []
+
+        self._confirmed_total = 0
+        self._ended_total = 0
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["ObjectTracker"]:
+        if not bool(config.get("tracking", Consts.MOTION_TRACKING)):
+            return None
+        return ObjectTracker(float(config.get("track_iou_threshold", Consts.TRACK_IOU_THRESHOLD)),
+                             float(config.get("track_max_distance", Consts.TRACK_MAX_DISTANCE)),
+                             int(config.get("track_max_missed", Consts.TRACK_MAX_MISSED)),
+                             int(config.get("track_min_hits", Consts.TRACK_MIN_HITS)),
+                             float(config.get("track_velocity_smoothing", Consts.TRACK_VELOCITY_SMOOTHING)))
+
+    @property
+    def detection_ids(self) -> np.ndarray:
+        # Track ID of each row of the last update's boxes; 0 while the track is still tentative
+        return self._detection_ids
+
+    @property
+    def started(self) -> List[int]:
+        # Tracks confirmed by the last update, i.e. objects to act on once
+        return self._started
+
+    @property
+    def ended(self) -> List[int]:
+        # Confirmed tracks dropped by the last update
+        return self._ended
+
+    @property
+    def tracks(self) -> List[Dict[str, Any]]:
+        confirmed = self._hits >= self._min_hits
+        return [{
+            "id": int(track_id),
+            "box": [int(round(v)) for v in box],
+            "velocity": [round(float(v), 2) for v in velocity],
+            "age": int(age),
+            "missed": int(missed),
+        } for track_id, box, velocity, age, missed in zip(
+            self._ids[confirmed], self._boxes[confirmed], self._velocities[confirmed],
+            self._ages[confirmed], self._missed[confirmed])]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": int(np.count_nonzero(self._hits >= self._min_hits)),
+            "tentative": int(np.count_nonzero(self._hits < self._min_hits)),
+            "confirmed_total": self._confirmed_total,
+            "ended_total": self._ended_total,
+        }
+
+    def update(self, detections: np.ndarray) -> np.ndarray:
+        # detections: int32 (x, y, w, h, area) rows in frame coordinates. Returns detection_ids.
+        boxes = detections[:, :4].astype(np.float32)
+        track_count, detection_count = len(self._ids), len(boxes)
+        self._started = []
+        self._ended = []
+
+        # Where each track should be now, assuming it kept moving for every frame it was not seen
+        predicted = self._boxes.copy()
+        predicted[:, :2] += self._velocities * (self._missed + 1)[:, None]
+
+        track_for = np.full(detection_count, -1, dtype=np.int64)
+        if track_count and detection_count:
+            iou = self._iou(predicted, boxes)
+            self._greedy_match(iou, iou >= self._iou_threshold, track_for)
+            if self._max_distance > 0:
+                distance = self._centre_distance(predicted, boxes)
+                free = (track_for < 0)[None, :] & ~np.isin(np.arange(track_count), track_for)[:, None]
+                self._greedy_match(-distance, free & (distance <= self._max_distance), track_for)
+
+        matched_detections = np.flatnonzero(track_for >= 0)
+        matched_tracks = track_for[matched_detections]
+        self._ages += 1
+        self._missed += 1
+        if len(matched_tracks):
+            self._update_matched(matched_tracks, boxes[matched_detections])
+
+        newly_confirmed = matched_tracks[self._hits[matched_tracks] == self._min_hits]
+        self._started = self._ids[newly_confirmed].tolist()
+        self._confirmed_total += len(self._started)
+
+        self._drop_lost_tracks(track_for)
+        self._detection_ids = self._add_tracks(boxes, track_for)
+        return self._detection_ids
+
+    def reset(self) -> None:
+        self._ids = self._ids[:0]
+        self._boxes = self._boxes[:0]
+        self._velocities = self._velocities[:0]
+        self._ages = self._ages[:0]
+        self._hits = self._hits[:0]
+        self._missed = self._missed[:0]
+        self._detection_ids = np.empty(0, dtype=np.int64)
+        self._started = []
+        self._ended = []
+
+    # ===== Internal =====
+
+    def _update_matched(self, tracks: np.ndarray, boxes: np.ndarray) -> None:
+        # Velocity is the smoothed centre displacement per analysed frame, spread over the frames the
+        # track went unseen
+        old_centres = self._boxes[tracks, :2] + self._boxes[tracks, 2:] / 2
+        new_centres = boxes[:, :2] + boxes[:, 2:] / 2
+        step = (new_centres - old_centres) / self._missed[tracks][:, None]
+        smoothing = self._velocity_smoothing
+        self._velocities[tracks] = smoothing * step + (1 - smoothing) * self._velocities[tracks]
+        self._boxes[tracks] = boxes
+        self._hits[tracks] += 1
+        self._missed[tracks] = 0
+
+    def _drop_lost_tracks(self, track_for: np.ndarray) -> None:
+        keep = self._missed <= self._max_missed
+        if keep.all():
+            return
+        lost = ~keep
+        self._ended = self._ids[lost & (self._hits >= self._min_hits)].tolist()
+        self._ended_total += len(self._ended)
+        # Matched tracks always have missed == 0, so dropping rows only shifts their indices
+        remap = np.cumsum(keep) - 1
+        matched = track_for >= 0
+        track_for[matched] = remap[track_for[matched]]
+        self._ids = self._ids[keep]
+        self._boxes = self._boxes[keep]
+        self._velocities = self._velocities[keep]
+        self._ages = self._ages[keep]
+        self._hits = self._hits[keep]
+        self._missed = self._missed[keep]
+
+    def _add_tracks(self, boxes: np.ndarray, track_for: np.ndarray) -> np.ndarray:
+        new = np.flatnonzero(track_for < 0)
+        if len(new):
+            first = len(self._ids)
+            self._ids = np.concatenate([self._ids, np.arange(self._next_id, self._next_id + len(new))])
+            self._next_id += len(new)
+            self._boxes = np.concatenate([self._boxes, boxes[new]])
+            self._velocities = np.concatenate([self._velocities, np.zeros((len(new), 2), dtype=np.float32)])
+            self._ages = np.concatenate([self._ages, np.zeros(len(new), dtype=np.int64)])
+            self._hits = np.concatenate([self._hits, np.ones(len(new), dtype=np.int64)])
+            self._missed = np.concatenate([self._missed, np.zeros(len(new), dtype=np.int64)])
+            track_for[new] = np.arange(first, first + len(new))
+            if self._min_hits == 1:
+                self._started += self._ids[first:].tolist()
+                self._confirmed_total += len(new)
+
+        confirmed = self._hits[track_for] >= self._min_hits
+        return np.where(confirmed, self._ids[track_for], 0)
+
+    @staticmethod
+    def _greedy_match(score: np.ndarray, valid: np.ndarray, track_for: np.ndarray) -> None:
+        # Take (track, detection) pairs from the best score down, skipping rows/columns already used
+        tracks, detections = np.nonzero(valid)
+        if not len(tracks):
+            return
+        order = np.argsort(-score[tracks, detections], kind="stable")
+        used_tracks = set(track_for[track_for >= 0].tolist())
+        for track, detection in zip(tracks[order].tolist(), detections[order].tolist()):
+            if track_for[detection] >= 0 or track in used_tracks:
+                continue
+            track_for[detection] = track
+            used_tracks.add(track)
+
+    @staticmethod
+    def _iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # (len(a), len(b)) IoU matrix of (x, y, w, h) boxes
+        left = np.maximum(a[:, None, 0], b[None, :, 0])
+        top = np.maximum(a[:, None, 1], b[None, :, 1])
+        right = np.minimum(a[:, None, 0] + a[:, None, 2], b[None, :, 0] + b[None, :, 2])
+        bottom = np.minimum(a[:, None, 1] + a[:, None, 3], b[None, :, 1] + b[None, :, 3])
+        intersection = np.clip(right - left, 0, None) * np.clip(bottom - top, 0, None)
+        union = (a[:, 2] * a[:, 3])[:, None] + (b[:, 2] * b[:, 3])[None, :] - intersection
+        return intersection / np.maximum(union, 1e-6)
+
+    @staticmethod
+    def _centre_distance(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        centres_a = a[:, :2] + a[:, 2:] / 2
+        centres_b = b[:, :2] + b[:, 2:] / 2
+        return np.linalg.norm(centres_a[:, None, :] - centres_b[None, :, :], axis=2)
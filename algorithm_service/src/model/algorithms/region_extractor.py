@@ -0,0 +1,74 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class RegionExtractor:
+    # Motion regions as one compact int32 array of (x, y, w, h, area) rows, built with a single
+    # connectedComponentsWithStats pass and NumPy filtering instead of a Python loop over contours.
+
+    BOX_COLUMNS = 5
+
+    @staticmethod
+    def empty() -> np.ndarray:
+        return np.empty((0, RegionExtractor.BOX_COLUMNS), dtype=np.int32)
+
+    @staticmethod
+    def extract(mask: np.ndarray, min_area: float, offset: Tuple[int, int] = (0, 0),
+                scale: Tuple[float, float] = (1.0, 1.0), labels: Optional[np.ndarray] = None) -> np.ndarray:
+        # Components of a binary mask whose area, after scaling, is at least min_area. offset is added in
+        # mask pixels (e.g. an ROI crop origin), then boxes and areas are scaled by scale (x, y).
+        # labels is an optional preallocated int32 image of the mask's size, so no label image is allocated.
+        _, _, stats, _ = cv2.connectedComponentsWithStats(mask, labels, connectivity=8, ltype=cv2.CV_32S)
+        stats = stats[1:]  # label 0 is the background
+        scale_x, scale_y = scale
+        areas = stats[:, cv2.CC_STAT_AREA] * (scale_x * scale_y)
+        keep = areas >= min_area
+        stats, areas = stats[keep], areas[keep]
+
+        boxes = np.empty((len(stats), RegionExtractor.BOX_COLUMNS), dtype=np.int32)
+        boxes[:, 0] = (stats[:, cv2.CC_STAT_LEFT] + offset[0]) * scale_x
+        boxes[:, 1] = (stats[:, cv2.CC_STAT_TOP] + offset[1]) * scale_y
+        boxes[:, 2] = stats[:, cv2.CC_STAT_WIDTH] * scale_x
+        boxes[:, 3] = stats[:, cv2.CC_STAT_HEIGHT] * scale_y
+        boxes[:, 4] = areas
+        return boxes
+
+    @staticmethod
+    def merge(boxes: np.ndarray, distance: int = 0) -> np.ndarray:
+        # Merge boxes that overlap or lie within distance pixels of each other into their union box
+        # (areas are summed). Groups are found by min-label propagation over the pairwise proximity
+        # matrix with pointer jumping, and the pass is repeated because a union box can reach boxes
+        # none of its parts reached.
+        while len(boxes) > 1:
+            x1 = boxes[:, 0] - distance
+            y1 = boxes[:, 1] - distance
+            x2 = boxes[:, 0] + boxes[:, 2] + distance
+            y2 = boxes[:, 1] + boxes[:, 3] + distance
+            near = ((x1[:, None] <= x2[None, :]) & (x1[None, :] <= x2[:, None]) &
+                    (y1[:, None] <= y2[None, :]) & (y1[None, :] <= y2[:, None]))
+
+            labels = np.arange(len(boxes))
+            while True:
+                propagated = np.where(near, labels[None, :], len(boxes)).min(axis=1)
+                propagated = propagated[propagated]
+                if np.array_equal(propagated, labels):
+                    break
+                labels = propagated
+
+            groups, labels = np.unique(labels, return_inverse=True)
+            if len(groups) == len(boxes):
+                break
+            left = np.full(len(groups), np.iinfo(np.int32).max, dtype=np.int32)
+            top = left.copy()
+            right = np.full(len(groups), np.iinfo(np.int32).min, dtype=np.int32)
+            bottom = right.copy()
+            area = np.zeros(len(groups), dtype=np.int32)
+            np.minimum.at(left, labels, boxes[:, 0])
+            np.minimum.at(top, labels, boxes[:, 1])
+            np.maximum.at(right, labels, boxes[:, 0] + boxes[:, 2])
+            np.maximum.at(bottom, labels, boxes[:, 1] + boxes[:, 3])
+            np.add.at(area, labels, boxes[:, 4])
+            boxes = np.stack([left, top, right - left, bottom - top, area], axis=1).astype(np.int32)
+        return boxes
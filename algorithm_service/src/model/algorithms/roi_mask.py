@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class RoiMask:
+    # Per-camera region of interest: the union of the include polygons minus the exclusion polygons,
+    # given in frame coordinates. rasterize() renders it once for a given frame/analysis size and
+    # keeps only the mask inside the ROI bounding box, so callers can crop to it.
+
+    def __init__(self, include: Sequence[np.ndarray], exclude: Sequence[np.ndarray]) -> None:
+        self._include = list(include)
+        self._exclude = list(exclude)
+        self._key: Optional[Tuple[int, int, int, int]] = None
+        self._mask: Optional[np.ndarray] = None
+        self._bounds: Tuple[int, int, int, int] = (0, 0, 0, 0)  # x, y, w, h in analysis pixels
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["RoiMask"]:
+        # "roi": {"include": [[[x, y], ...], ...], "exclude": [...]}; the legacy "mask_rect": [x, y, w, h]
+        # becomes one include rectangle
+        roi = config.get("roi") or {}
+        include = [RoiMask._to_polygon(points) for points in roi.get("include", [])]
+        exclude = [RoiMask._to_polygon(points) for points in roi.get("exclude", [])]
+        mask_rect = config.get("mask_rect")
+        if isinstance(mask_rect, (list, tuple)) and len(mask_rect) == 4:
+            x, y, w, h = (int(v) for v in mask_rect)
+            include.append(RoiMask._to_polygon([[x, y], [x + w, y], [x + w, y + h], [x, y + h]]))
+        if not include and not exclude:
+            return None
+        return RoiMask(include, exclude)
+
+    @property
+    def mask(self) -> Optional[np.ndarray]:
+        return self._mask
+
+    @property
+    def bounds(self) -> Tuple[int, int, int, int]:
+        return self._bounds
+
+    def rasterize(self, frame_size: Tuple[int, int], image_size: Tuple[int, int]) -> bool:
+        # Render for frames of frame_size (w, h) analysed at image_size (w, h). Returns True when the
+        # mask changed, so callers can reset state tied to the crop size.
+        key = (*frame_size, *image_size)
+        if key == self._key:
+            return False
+        self._key = key
+
+        image_width, image_height = image_size
+        scale = np.array([image_width / frame_size[0], image_height / frame_size[1]], dtype=np.float32)
+        full = np.zeros((image_height, image_width), dtype=np.uint8)
+        if self._include:
+            cv2.fillPoly(full, self._scale_polygons(self._include, scale), 255)
+        else:
+            # Only exclusion zones: everything else is of interest
+            full[:] = 255
+        if self._exclude:
+            cv2.fillPoly(full, self._scale_polygons(self._exclude, scale), 0)
+
+        x, y, w, h = cv2.boundingRect(full)
+        if w == 0 or h == 0:
+            # Nothing left to watch; keep a single masked-out pixel so the pipeline still runs
+            x, y, w, h = 0, 0, 1, 1
+        self._bounds = (x, y, w, h)
+        self._mask = np.ascontiguousarray(full[y:y + h, x:x + w])
+        return True
+
+    def crop(self, image: np.ndarray) -> np.ndarray:
+        x, y, w, h = self._bounds
+        return image[y:y + h, x:x + w]
+
+    def draw(self, frame: np.ndarray) -> None:
+        cv2.polylines(frame, self._include, True, (255, 0, 0), 2)
+        cv2.polylines(frame, self._exclude, True, (0, 0, 255), 2)
+
+    # ===== Internal =====
+
+    @staticmethod
+    def _to_polygon(points: Sequence[Sequence[float]]) -> np.ndarray:
+        polygon = np.asarray(points, dtype=np.int32).reshape(-1, 1, 2)
+        if len(polygon) < 3:
+            raise ValueError(f"ROI polygon needs at least 3 points, got {len(polygon)}")
+        return polygon
+
+    @staticmethod
+    def _scale_polygons(polygons: List[np.ndarray], scale: np.ndarray) -> List[np.ndarray]:
+        return [np.round(polygon * scale).astype(np.int32) for polygon in polygons]
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class ZoneMap:
+    # Named zones rasterized into one label image in frame coordinates (0 = no zone, i = zones[i - 1]),
+    # so assigning detections to zones is an array lookup at each box centre instead of a polygon
+    # test per detection. Where zones overlap, the later one in the config wins.
+
+    NO_ZONE = -1
+
+    def __init__(self, names: List[str], polygons: List[np.ndarray]) -> None:
+        self._names = names
+        self._polygons = polygons
+        self._frame_size: Optional[Tuple[int, int]] = None
+        self._labels: Optional[np.ndarray] = None
+        self._totals = np.zeros(len(names), dtype=np.int64)
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["ZoneMap"]:
+        # "zones": [{"name": "door", "polygon": [[x, y], ...]}, ...] in frame coordinates
+        zones = config.get("zones") or []
+        if not zones:
+            return None
+        if len(zones) > np.iinfo(np.uint8).max:
+            raise ValueError(f"At most {np.iinfo(np.uint8).max} zones are supported, got {len(zones)}")
+        names = [str(zone.get("name", f"zone_{i}")) for i, zone in enumerate(zones)]
+        polygons = []
+        for name, zone in zip(names, zones):
+            polygon = np.asarray(zone.get("polygon", []), dtype=np.int32).reshape(-1, 1, 2)
+            if len(polygon) < 3:
+                raise ValueError(f"Zone '{name}' needs at least 3 points, got {len(polygon)}")
+            polygons.append(polygon)
+        return ZoneMap(names, polygons)
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        # Detections assigned to each zone since setup
+        return dict(zip(self._names, self._totals.tolist()))
+
+    def rasterize(self, frame_size: Tuple[int, int]) -> None:
+        # Render the label image for frames of frame_size (w, h); a no-op while the size is unchanged
+        if frame_size == self._frame_size:
+            return
+        self._frame_size = frame_size
+        self._labels = np.zeros((frame_size[1], frame_size[0]), dtype=np.uint8)
+        for label, polygon in enumerate(self._polygons, start=1):
+            cv2.fillPoly(self._labels, [polygon], label)
+
+    def assign(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # For (x, y, w, h, area) boxes in frame coordinates, return each box's zone index (NO_ZONE if
+        # its centre is outside every zone) and the number of boxes per zone
+        height, width = self._labels.shape
+        centre_x = np.clip(boxes[:, 0] + boxes[:, 2] // 2, 0, width - 1)
+        centre_y = np.clip(boxes[:, 1] + boxes[:, 3] // 2, 0, height - 1)
+        zone_ids = self._labels[centre_y, centre_x].astype(np.int32) - 1
+        counts = np.bincount(zone_ids + 1, minlength=len(self._names) + 1)[1:]
+        self._totals += counts
+        return zone_ids, counts
+
+    def draw(self, frame: np.ndarray) -> None:
+        cv2.polylines(frame, self._polygons, True, (0, 255, 255), 2)
+        for name, polygon in zip(self._names, self._polygons):
+            x, y = polygon[0, 0]
+            cv2.putText(frame, name, (int(x), int(y) - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
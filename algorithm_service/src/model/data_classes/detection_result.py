@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class DetectionResult:
+    # Detections of one analysed frame in frame coordinates: int32 (x, y, w, h, area) rows, plus the
+    # track ID (0 = tentative) and zone name of each row when tracking / zones are configured
+    boxes: np.ndarray
+    track_ids: Optional[np.ndarray] = None
+    zones: Optional[List[Optional[str]]] = None
+
+    def to_event(self, video_id: Any, sequence: int, timestamp_ns: int) -> Dict[str, Any]:
+        event: Dict[str, Any] = {
+            "video_id": video_id,
+            "sequence": sequence,
+            "timestamp_ns": timestamp_ns,
+            "boxes": self.boxes[:, :4].tolist(),
+            "areas": self.boxes[:, 4].tolist(),
+        }
+        if self.track_ids is not None:
+            event["track_ids"] = self.track_ids.tolist()
+        if self.zones is not None:
+            event["zones"] = self.zones
+        return event
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from globals.enums.pixel_format import PixelFormat
+
+
+@dataclass
+class FrameHeader:
+    sequence: int
+    timestamp_ns: int
+    height: int
+    width: int
+    channels: int
+    pixel_format: PixelFormat
+    level: int = 0
+    frame_id: int = 0
+    publish_ns: int = 0
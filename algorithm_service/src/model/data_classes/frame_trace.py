@@ -0,0 +1,18 @@
+from dataclasses import asdict, dataclass
+from typing import Dict
+
+
+@dataclass
+class FrameTrace:
+    # Wall-clock (time.time_ns) stamps of one frame on its way through both services; 0 means unknown
+    video_id: int
+    frame_id: int
+    sequence: int
+    capture_ns: int = 0
+    publish_ns: int = 0
+    read_ns: int = 0
+    processed_ns: int = 0
+    output_ns: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+
+from globals.enums.segment_event import SegmentEvent
+
+
+@dataclass
+class MotionSegment:
+    # One stretch of motion on a camera (zone None) or in one of its zones. The summary is updated in
+    # place from each frame with motion, so emitting an event never looks back at earlier frames.
+    video_id: Any
+    zone: Optional[str]
+    segment_id: int
+    start_sequence: int
+    start_ns: int
+    last_sequence: int = 0
+    last_ns: int = 0
+    motion_frames: int = 0
+    consecutive_frames: int = 0
+    peak_area: int = 0
+    peak_regions: int = 0
+    # Union of every box, as x1, y1, x2, y2 in frame coordinates
+    union: Optional[np.ndarray] = None
+    track_ids: Set[int] = field(default_factory=set)
+    started: bool = False
+    last_event_ns: int = 0
+
+    def add(self, boxes: np.ndarray, track_ids: Optional[np.ndarray], sequence: int, timestamp_ns: int) -> None:
+        # boxes: int32 (x, y, w, h, area) rows of this frame inside the segment's camera / zone
+        self.last_sequence = sequence
+        self.last_ns = timestamp_ns
+        self.motion_frames += 1
+        self.consecutive_frames += 1
+        self.peak_area = max(self.peak_area, int(boxes[:, 4].max()))
+        self.peak_regions = max(self.peak_regions, len(boxes))
+        frame_union = np.array([boxes[:, 0].min(), boxes[:, 1].min(),
+                                (boxes[:, 0] + boxes[:, 2]).max(), (boxes[:, 1] + boxes[:, 3]).max()])
+        if self.union is None:
+            self.union = frame_union
+        else:
+            self.union[:2] = np.minimum(self.union[:2], frame_union[:2])
+            self.union[2:] = np.maximum(self.union[2:], frame_union[2:])
+        if track_ids is not None:
+            self.track_ids.update(track_ids[track_ids > 0].tolist())
+
+    def to_event(self, event: SegmentEvent) -> Dict[str, Any]:
+        x1, y1, x2, y2 = self.union.tolist()
+        return {
+            "video_id": self.video_id,
+            "zone": self.zone,
+            "segment_id": self.segment_id,
+            "event": event.value,
+            "start_sequence": self.start_sequence,
+            "last_sequence": self.last_sequence,
+            "start_ns": self.start_ns,
+            "last_ns": self.last_ns,
+            "duration_ms": round((self.last_ns - self.start_ns) / 1e6, 1),
+            "motion_frames": self.motion_frames,
+            "peak_area": self.peak_area,
+            "peak_regions": self.peak_regions,
+            "union_box": [x1, y1, x2 - x1, y2 - y1],
+            "track_ids": sorted(self.track_ids),
+        }
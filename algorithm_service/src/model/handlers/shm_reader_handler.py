@@ -3,22 +3,41 @@ import os
 import logging
 import cv2
 import numpy as np
+from typing import Optional
 from infrastructure.interfaces.handlers.ishm_reader_handler import IShmReaderHandler
 from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.shared_memory.frame_ring_buffer import FrameRingBuffer
 from globals.consts.const_strings import ConstStrings
 from globals.consts.consts import Consts
+from globals.enums.shm_transport import ShmTransport
+from model.data_classes.frame_header import FrameHeader
+from model.data_classes.frame_trace import FrameTrace
 
 
 class ShmReaderHandler(IShmReaderHandler):
-    def __init__(self, video_id: int, width: int = Consts.ALGO_FRAME_WIDTH, height: int = Consts.ALGO_FRAME_HEIGHT):
+    def __init__(self, video_id: int, width: int = Consts.ALGO_FRAME_WIDTH, height: int = Consts.ALGO_FRAME_HEIGHT,
+                 transport: ShmTransport = ShmTransport(Consts.SHM_TRANSPORT),
+                 pyramid_level: int = Consts.PYRAMID_LEVEL):
         self._video_id = video_id
         self._width = width
         self._height = height
+        self._transport = ShmTransport(transport)
+        # Ring slots carry every pyramid level of a frame; this reader only maps the one it needs
+        self._pyramid_level = pyramid_level
         self._shm_path = ConstStrings.SHARED_MEMORY_CAM_PATH.format(camera_id=video_id)
+        self._ring_path = ConstStrings.SHARED_MEMORY_RING_PATH.format(camera_id=video_id)
         self._cap = None
+        self._ring = None
+        self._last_seq = 0
+        self._last_trace: Optional[FrameTrace] = None
+        self._frames_read = 0
         self._logger = LoggerFactory.get_logger_manager()
 
     def start(self) -> None:
+        if self._transport == ShmTransport.RING:
+            self._start_ring()
+            return
+
         pipeline = ConstStrings.SHARED_MEMORY_READER_PIPELINE.format(
             shared_memory_path=self._shm_path,
             frame_width=self._width,
@@ -69,10 +88,48 @@ class ShmReaderHandler(IShmReaderHandler):
         raise TimeoutError(f"Cannot open shm stream or file after waiting: {self._shm_path}")
 
     def read_frame(self) -> np.ndarray:
+        ring = self._ring
+        if ring is not None:
+            return self._read_frame_from_ring(ring)
         if not self._cap or not self._cap.isOpened():
             return None
         ret, frame = self._cap.read()
-        return frame if ret else None
+        if not ret:
+            return None
+        # GStreamer shm and the .avi fallback carry no capture metadata; only the read time is known
+        self._frames_read += 1
+        self._last_trace = FrameTrace(self._video_id, self._frames_read, self._frames_read, read_ns=time.time_ns())
+        return frame
+
+    def poll_frame(self) -> np.ndarray:
+        # Non-blocking read for callers that service many cameras from one thread: the newest
+        # unseen ring frame, or None right away. GStreamer captures cannot poll and still block.
+        ring = self._ring
+        if ring is None:
+            return self.read_frame()
+        latest = ring.read_latest(self._last_seq, self._pyramid_level)
+        if latest is None:
+            return None
+        return self._accept_ring_frame(*latest)
+
+    @property
+    def last_frame_trace(self) -> Optional[FrameTrace]:
+        # Trace of the frame last returned by read_frame
+        return self._last_trace
+
+    @property
+    def frame_is_current(self) -> bool:
+        # Ring frames are zero-copy views that the writer reuses after SHM_RING_SLOT_COUNT frames; False
+        # once the slot of the frame last returned was reused, i.e. whatever was computed from it may
+        # mix two frames. Captured frames are private copies and always current.
+        ring = self._ring
+        return ring is None or ring.is_current(self._last_seq)
+
+    @property
+    def finished(self) -> bool:
+        # The writer marked the stream ended and every frame before that was read
+        ring = self._ring
+        return ring is not None and ring.end_of_stream and ring.latest_seq <= self._last_seq
 
     def release(self) -> None:
         if self._cap:
@@ -80,3 +137,64 @@ class ShmReaderHandler(IShmReaderHandler):
                 self._cap.release()
             except Exception:
                 pass
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def _start_ring(self) -> None:
+        max_wait_seconds = Consts.SHM_OPEN_AVI_WAIT_SECONDS
+        for i in range(max_wait_seconds):
+            if os.path.exists(self._ring_path):
+                try:
+                    self._ring = FrameRingBuffer.attach(self._ring_path)
+                    # Only hand out frames published after attaching, never a stale one left in the ring
+                    self._last_seq = self._ring.latest_seq
+                    self._logger.log(
+                        ConstStrings.LOG_NAME_DEBUG,
+                        f"Opened shared memory reader for video {self._video_id} (ring buffer)"
+                    )
+                    return
+                except ValueError:
+                    pass
+            time.sleep(1)
+
+        self._logger.log(
+            ConstStrings.LOG_NAME_ERROR,
+            f"Cannot open shm ring buffer after waiting: {self._ring_path}",
+            level=logging.ERROR,
+        )
+        raise TimeoutError(f"Cannot open shm ring buffer after waiting: {self._ring_path}")
+
+    def _accept_ring_frame(self, frame: np.ndarray, header: FrameHeader) -> np.ndarray:
+        self._last_seq = header.sequence
+        self._last_trace = FrameTrace(self._video_id, header.frame_id, header.sequence,
+                                      capture_ns=header.timestamp_ns, publish_ns=header.publish_ns,
+                                      read_ns=time.time_ns())
+        return frame
+
+    def _read_frame_from_ring(self, ring: FrameRingBuffer) -> np.ndarray:
+        # Block like a capture read would, but hand back a read-only view into shared memory.
+        # The writer's signal wakes the wait as soon as a frame is committed
+        deadline = time.monotonic() + Consts.SHM_RING_READ_TIMEOUT_SECONDS
+        while True:
+            latest = ring.read_latest(self._last_seq, self._pyramid_level)
+            if latest is not None:
+                return self._accept_ring_frame(*latest)
+            if self.finished:
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not ring.wait(self._last_seq, remaining):
+                break
+
+        # The video manager recreates the ring on restart; follow it to the new file
+        if ring.is_replaced() and os.path.exists(self._ring_path):
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                             f"Shared memory ring for video {self._video_id} was recreated, reattaching")
+            try:
+                new_ring = FrameRingBuffer.attach(self._ring_path)
+            except ValueError:
+                return None
+            ring.close()
+            self._ring = new_ring
+            self._last_seq = 0
+        return None
@@ -1,28 +1,89 @@
 import os
+import json
 import cv2
 import threading
 import time
+from functools import partial
 from queue import Queue, Empty
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 
 from globals.consts.consts import Consts
+from globals.enums.budget_mode import BudgetMode
+from globals.enums.camera_state import CameraState
+from globals.enums.execution_mode import ExecutionMode
+from globals.enums.isolated_outcome import IsolatedOutcome
+from globals.enums.motion_engine import MotionEngine
+from globals.utils.exponential_backoff import ExponentialBackoff
 from infrastructure.interfaces.managers.ialgorithm_manager import IAlgorithmManager
 from infrastructure.factories.handler_factory import HandlerFactory
 from infrastructure.factories.algorithm_factory import AlgorithmFactory
+from infrastructure.factories.infrastructure_factory import InfrastructureFactory
+from infrastructure.interfaces.idetection_publisher import IDetectionPublisher
 from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.processes.process_supervisor import ProcessSupervisor
+from model.aggregation.motion_segmenter import MotionSegmenter
+from model.algorithms.activity_heatmap import ActivityHeatmap
+from model.data_classes.detection_result import DetectionResult
+from model.data_classes.frame_trace import FrameTrace
+from model.scheduling.adaptive_rate_scheduler import AdaptiveRateScheduler
+from model.scheduling.frame_budget import FrameBudget
+from model.scheduling.isolated_algorithm_runner import IsolatedAlgorithmRunner
+from model.tracing.frame_latency_tracker import FrameLatencyTracker
 from globals.consts.const_strings import ConstStrings
 from globals.consts.logger_messages import LoggerMessages
 
 class AlgorithmManager(IAlgorithmManager):
-    def __init__(self, videos_config: List[Dict]) -> None:
+    def __init__(self, videos_config: List[Dict],
+                 execution_mode: ExecutionMode = ExecutionMode(Consts.EXECUTION_MODE),
+                 cameras_per_process: int = Consts.CAMERAS_PER_PROCESS,
+                 motion_engine: MotionEngine = MotionEngine(Consts.MOTION_ENGINE)) -> None:
         self._videos_config = videos_config
         self._num_videos = len(videos_config)
 
         self._readers = []
         self._algorithms = []
+        # Batched engine: one thread runs motion detection for every camera of this manager
+        self._motion_engine = MotionEngine(motion_engine)
+        self._batch_engine = None
 
         self._process_threads: List[threading.Thread] = []
+        self._frame_counts = [0] * self._num_videos
+        # Ring frames the writer overwrote before we were done with them; dropped
+        self._lapped_frames = [0] * self._num_videos
+        self._camera_states = [CameraState.STALLED] * self._num_videos
+        self._latency_trackers = [FrameLatencyTracker() for _ in range(self._num_videos)]
+        # Optional per-camera analysis rate that drops while the scene is quiet
+        self._rate_schedulers: List[Optional[AdaptiveRateScheduler]] = [
+            AdaptiveRateScheduler.from_config(video.get("algorithm_config", {})) for video in videos_config
+        ]
+        # Optional per-camera processing budget; cameras that keep overrunning it degrade, and at the
+        # last level their algorithm runs in an isolated process
+        self._frame_budgets: List[Optional[FrameBudget]] = [
+            FrameBudget.from_config(video.get("algorithm_config", {})) for video in videos_config
+        ]
+        self._isolated_runners: List[Optional[IsolatedAlgorithmRunner]] = [None] * self._num_videos
+        # Structured detections to Kafka; created by the managers that run the cameras
+        self._detection_publisher: Optional[IDetectionPublisher] = None
+        self._last_results: List[Optional[DetectionResult]] = [None] * self._num_videos
+        self._last_result_had_boxes = [False] * self._num_videos
+        # Per-camera motion segments (start / update / end) built from every analysed frame
+        self._segmenters: List[Optional[MotionSegmenter]] = [
+            MotionSegmenter.from_config(video.get("video_id"), video.get("algorithm_config", {})) for video in videos_config
+        ]
         self._running = True
+        # Wakes workers sleeping out a reconnect backoff when the manager stops
+        self._shutdown = threading.Event()
+
+        # Process mode: the parent only supervises, every camera group runs in its own process
+        self._execution_mode = ExecutionMode(execution_mode)
+        self._cameras_per_process = cameras_per_process
+        self._supervisor: Optional[ProcessSupervisor] = None
+
+        # Set when this manager runs inside a supervised worker process
+        self._stop_event: Optional[Any] = None
+        self._stats_queue: Optional[Any] = None
+        self._worker_index: Optional[int] = None
+        self._last_stats_time = time.monotonic()
 
         self._logger = LoggerFactory.get_logger_manager()
         self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.MOTION_STARTING)
@@ -41,22 +102,29 @@ class AlgorithmManager(IAlgorithmManager):
         self._frame_queues: List[Queue] = [Queue(maxsize=2) for _ in range(self._num_videos)]
 
         # Initialize readers + algorithms
-        self._init_readers()
-        self._init_algorithms()
+        if self._execution_mode == ExecutionMode.THREAD:
+            self._init_readers()
+            self._init_algorithms()
+            self._init_detection_publisher()
+        else:
+            # Windows are rendered by the worker processes
+            self._enable_imshow = False
 
-    def start(self) -> None:
-        # Start worker threads
-        for i in range(self._num_videos):
-            thread = threading.Thread(
-                target=self._process_frames_worker, args=(i,), daemon=True
-            )
-            self._process_threads.append(thread)
-            thread.start()
+    @staticmethod
+    def run_worker(videos_config: List[Dict], stop_event: Any, stats_queue: Any, worker_index: int,
+                   motion_engine: MotionEngine = MotionEngine(Consts.MOTION_ENGINE)) -> None:
+        # Entry point of a worker process started by ProcessSupervisor
+        manager = AlgorithmManager(videos_config, ExecutionMode.THREAD, motion_engine=motion_engine)
+        manager._stop_event = stop_event
+        manager._stats_queue = stats_queue
+        manager._worker_index = worker_index
+        manager.start()
 
-        self._logger.log(
-            ConstStrings.LOG_NAME_DEBUG,
-            f"Started {self._num_videos} shared memory readers"
-        )
+    def start(self) -> None:
+        if self._execution_mode == ExecutionMode.PROCESS:
+            self._start_worker_processes()
+        else:
+            self._start_worker_threads()
 
         # Main loop (render from main thread)
         try:
@@ -66,6 +134,7 @@ class AlgorithmManager(IAlgorithmManager):
                     self._render_frames_main_thread()
                 else:
                     time.sleep(0.1)
+                self._on_main_loop_tick()
 
         except KeyboardInterrupt:
             self.stop()
@@ -75,6 +144,10 @@ class AlgorithmManager(IAlgorithmManager):
 
     def stop(self) -> None:
         self._running = False
+        self._shutdown.set()
+
+        if self._supervisor is not None:
+            self._supervisor.stop()
 
         # Release readers
         for reader in self._readers:
@@ -84,12 +157,23 @@ class AlgorithmManager(IAlgorithmManager):
                 pass
 
         # Release algos
+        for runner in self._isolated_runners:
+            if runner is not None:
+                runner.stop()
         for algo in getattr(self, "_algorithms", []):
             try:
                 if algo:
                     algo.release()
             except Exception:
                 pass
+        if self._batch_engine is not None:
+            self._batch_engine.release()
+        for video_index, segmenter in enumerate(self._segmenters):
+            if segmenter is not None:
+                self._emit_segment_events(video_index, segmenter.close())
+        if self._detection_publisher is not None:
+            # Flushes what is still buffered
+            self._detection_publisher.stop()
 
         # Join threads
         for thread in self._process_threads:
@@ -97,64 +181,240 @@ class AlgorithmManager(IAlgorithmManager):
 
         self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ALGORITHM_MANAGER_STOPPED)
 
+    def get_heatmap(self, video_id: Any) -> Optional[Dict[str, Any]]:
+        video_index = self._video_index(video_id)
+        if video_index is None:
+            return None
+        if self._execution_mode == ExecutionMode.THREAD:
+            algo = self._algorithms[video_index] if video_index < len(self._algorithms) else None
+            return algo.heatmap if algo is not None else None
+        # Cameras run in worker processes: serve the snapshot they save periodically
+        video = self._videos_config[video_index]
+        indexes = range(len(video["algorithms"])) if video.get("algorithms") else [None]
+        for chain_index in indexes:
+            heatmap = ActivityHeatmap.describe_snapshot(
+                ConstStrings.HEATMAP_SNAPSHOT_PATH.format(AlgorithmFactory.snapshot_camera_key(video, chain_index)))
+            if heatmap is not None:
+                return heatmap
+        return None
+
+    def reset_heatmap(self, video_id: Any) -> bool:
+        # Only cameras running in this process can be reset
+        video_index = self._video_index(video_id)
+        if video_index is None or self._execution_mode != ExecutionMode.THREAD:
+            return False
+        algo = self._algorithms[video_index] if video_index < len(self._algorithms) else None
+        return algo is not None and algo.reset_heatmap()
+
     # ===== Internal =====
 
+    def _video_index(self, video_id: Any) -> Optional[int]:
+        for i, video in enumerate(self._videos_config):
+            if str(video.get("video_id")) == str(video_id):
+                return i
+        return None
+
+
+    def _start_worker_threads(self) -> None:
+        if self._batch_engine is not None:
+            thread = threading.Thread(target=self._process_batch_worker, daemon=True)
+            self._process_threads.append(thread)
+            thread.start()
+            return
+
+        for i in range(self._num_videos):
+            thread = threading.Thread(
+                target=self._process_frames_worker, args=(i,), daemon=True
+            )
+            self._process_threads.append(thread)
+            thread.start()
+
+        self._logger.log(
+            ConstStrings.LOG_NAME_DEBUG,
+            f"Started {self._num_videos} shared memory readers"
+        )
+
+    def _start_worker_processes(self) -> None:
+        video_groups = ProcessSupervisor.group_videos(self._videos_config, self._cameras_per_process)
+        run_worker = partial(AlgorithmManager.run_worker, motion_engine=self._motion_engine)
+        self._supervisor = ProcessSupervisor("algorithm_manager", run_worker, video_groups)
+        self._supervisor.start()
+
+    def _on_main_loop_tick(self) -> None:
+        if self._stop_event is not None and self._stop_event.is_set():
+            self.stop()
+            return
+        if self._supervisor is not None and self._supervisor.all_finished:
+            # Every worker exited after its cameras finished
+            self.stop()
+            return
+
+        now = time.monotonic()
+        if now - self._last_stats_time < Consts.PROCESS_STATS_INTERVAL_SECONDS:
+            return
+        elapsed = now - self._last_stats_time
+        self._last_stats_time = now
+
+        if self._supervisor is not None:
+            self._supervisor.log_stats()
+            return
+
+        cameras = self._collect_camera_stats(elapsed)
+        if self._detection_publisher is not None:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                             LoggerMessages.DETECTION_PUBLISHER_STATS.format(self._detection_publisher.stats))
+        if self._stats_queue is not None:
+            ProcessSupervisor.report_stats(self._stats_queue, self._worker_index, cameras)
+        else:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ALGORITHM_STATS.format(cameras))
+
+    def _collect_camera_stats(self, elapsed: float) -> Dict[Any, Dict[str, Any]]:
+        cameras = {}
+        for i, video in enumerate(self._videos_config):
+            frames = self._frame_counts[i]
+            self._frame_counts[i] = 0
+            lapped = self._lapped_frames[i]
+            self._lapped_frames[i] = 0
+            cameras[video.get("video_id")] = {
+                "frames": frames, "fps": round(frames / elapsed, 1), "state": self._camera_states[i].value,
+                "lapped": lapped,
+                # Latency histograms cover this stats interval only
+                "latency_ms": self._latency_trackers[i].snapshot(reset=True),
+            }
+            algo = self._algorithms[i] if i < len(self._algorithms) else None
+            runner = self._isolated_runners[i]
+            # An isolated camera's algorithm runs in the runner's process
+            algo_stats = runner.stats if runner is not None else getattr(algo, "stats", None)
+            if algo_stats:
+                cameras[video.get("video_id")]["algorithm"] = algo_stats
+            if self._rate_schedulers[i] is not None:
+                cameras[video.get("video_id")]["analysis_rate"] = self._rate_schedulers[i].stats
+            if self._segmenters[i] is not None:
+                cameras[video.get("video_id")]["segments"] = self._segmenters[i].stats
+            if self._frame_budgets[i] is not None:
+                cameras[video.get("video_id")]["budget"] = self._frame_budgets[i].snapshot(reset=True)
+        return cameras
+
     def _init_readers(self) -> None:
         for video in self._videos_config:
             video_id = video.get("video_id")
             width = video.get("width", 1280)
             height = video.get("height", 720)
+            transport = video.get("transport", Consts.SHM_TRANSPORT)
+            pyramid_level = video.get("pyramid_level", Consts.PYRAMID_LEVEL)
 
-            reader = HandlerFactory.create_shm_reader_handler(video_id, width, height)
+            reader = HandlerFactory.create_shm_reader_handler(video_id, width, height, transport, pyramid_level)
             self._readers.append(reader)
-            reader.start()
+            try:
+                reader.start()
+            except (TimeoutError, ValueError) as e:
+                # The worker keeps retrying this camera in the background; the others start normally
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.READER_START_FAILED.format(video_id, e))
+                self._camera_states[len(self._readers) - 1] = CameraState.RECONNECTING
 
     def _init_algorithms(self) -> None:
-        for video in self._videos_config:
-            algo_type = video.get("algorithm", "motion_detection")
-            algo_cfg = video.get("algorithm_config", {})
+        if self._motion_engine == MotionEngine.BATCHED:
+            try:
+                self._batch_engine = AlgorithmFactory.create_batched_motion_engine(
+                    [video.get("algorithm_config", {}) for video in self._videos_config])
+            except Exception as e:
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+            self._algorithms = [None] * self._num_videos
+            if self._batch_engine is not None:
+                return
 
+        for video in self._videos_config:
             try:
-                algo = AlgorithmFactory.create(algo_type, algo_cfg)
-                self._algorithms.append(algo)
+                self._algorithms.append(AlgorithmFactory.create_camera_algorithm(video))
             except Exception as e:
                 self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
                 self._algorithms.append(None)
 
+    def _init_detection_publisher(self) -> None:
+        try:
+            self._detection_publisher = InfrastructureFactory.create_detection_publisher()
+        except Exception as e:
+            # No broker must not stop motion detection
+            self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.DETECTION_PUBLISHER_UNAVAILABLE.format(e))
+            self._detection_publisher = None
+
     def _process_frames_worker(self, video_index: int) -> None:
         reader = self._readers[video_index]
-        algo = self._algorithms[video_index]
-        q = self._frame_queues[video_index]
+        scheduler = self._rate_schedulers[video_index]
+        budget = self._frame_budgets[video_index]
 
         frame_count = 0
-        consecutive_none_count = 0
-        max_none_count = 10
+        stalled_since = None
+        idle_backoff = ExponentialBackoff(Consts.CAMERA_IDLE_BASE_SECONDS, Consts.CAMERA_IDLE_MAX_SECONDS)
+        reconnect_backoff = ExponentialBackoff(Consts.CAMERA_RECONNECT_BASE_SECONDS,
+                                               Consts.CAMERA_RECONNECT_MAX_SECONDS,
+                                               Consts.CAMERA_RECONNECT_JITTER)
 
         while self._running:
+            if self._camera_states[video_index] == CameraState.RECONNECTING:
+                if not self._reconnect_reader(video_index, reconnect_backoff):
+                    if self._camera_states[video_index] == CameraState.FINISHED:
+                        break
+                    continue
+                stalled_since = None
+
+            if scheduler is not None:
+                # Quiet cameras sleep between analyses instead of reading every frame; the ring
+                # always hands back the latest one when they wake up
+                delay = scheduler.seconds_until_due(time.monotonic())
+                if delay > 0:
+                    self._shutdown.wait(delay)
+                    continue
+
             frame = reader.read_frame()
 
             if frame is None:
-                consecutive_none_count += 1
-                if consecutive_none_count >= max_none_count:
-                    self._logger.log(
-                        ConstStrings.LOG_NAME_DEBUG,
-                        f"Video {video_index}: No more frames available. Total frames read: {frame_count}"
-                    )
-                    self._running = False
+                if reader.finished:
+                    # The video manager marked the stream ended (a file source ran out)
+                    self._set_camera_state(video_index, CameraState.FINISHED)
                     break
-
-                time.sleep(0.1)
+                # Readers already block for a while before returning None; back off further while idle
+                now = time.monotonic()
+                if stalled_since is None:
+                    stalled_since = now
+                if now - stalled_since >= Consts.CAMERA_STALL_RECONNECT_SECONDS:
+                    self._set_camera_state(video_index, CameraState.RECONNECTING)
+                else:
+                    self._set_camera_state(video_index, CameraState.STALLED)
+                    self._shutdown.wait(idle_backoff.next_delay())
                 continue
 
-            consecutive_none_count = 0
+            stalled_since = None
+            idle_backoff.reset()
+            reconnect_backoff.reset()
+            self._set_camera_state(video_index, CameraState.ACTIVE)
             frame_count += 1
+            self._frame_counts[video_index] += 1
+            trace = reader.last_frame_trace
+            if budget is not None and not budget.should_process():
+                # Degraded: this camera only analyses every n-th frame, the others are shown as they are
+                if self._frame_is_current(video_index):
+                    self._publish_frame(video_index, frame, trace)
+                continue
 
             # Algorithm processing
-            try:
-                if algo:
-                    frame = algo.process(frame)
-            except Exception as e:
-                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+            algo = self._algorithms[video_index]
+            if algo is None:
+                analysed = None
+            elif budget is not None:
+                analysed = self._process_with_budget(video_index, frame)
+            else:
+                analysed = self._run_algorithm(algo, frame)
+            if not self._frame_is_current(video_index):
+                continue
+            if analysed is not None:
+                frame, result, motion = analysed
+                if trace is not None:
+                    trace.processed_ns = time.time_ns()
+                self._handle_result(video_index, result, trace, frame_count)
+                if scheduler is not None:
+                    # Algorithms that cannot tell whether they saw motion keep the camera at full rate
+                    self._record_activity(video_index, motion is None or motion)
 
             if frame_count % 30 == 0:
                 try:
@@ -165,23 +425,267 @@ class AlgorithmManager(IAlgorithmManager):
                 except Exception:
                     pass
 
-            # Save latest frame as JPEG for GUI display
+            self._publish_frame(video_index, frame, trace)
+
+    def _run_algorithm(self, algo: Any, frame: Any) -> Tuple[Any, Optional[DetectionResult], Optional[bool]]:
+        # (frame, result, motion) of one analysed frame
+        try:
+            frame = algo.process(frame)
+        except Exception as e:
+            self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+            return frame, None, None
+        return frame, algo.result, getattr(algo, "motion_detected", None)
+
+    def _process_with_budget(self, video_index: int,
+                             frame: Any) -> Optional[Tuple[Any, Optional[DetectionResult], Optional[bool]]]:
+        # Like _run_algorithm, or None when the frame was not analysed within the budget
+        budget = self._frame_budgets[video_index]
+        runner = self._isolated_runners[video_index]
+        analysed = None
+
+        # Once isolated, stay on the runner while it still works on an earlier frame
+        if budget.mode == BudgetMode.ISOLATED or (runner is not None and runner.busy):
+            runner = self._isolated_runner(video_index, frame)
+        if runner is not None and (budget.mode == BudgetMode.ISOLATED or runner.busy):
+            processed, outcome = runner.process(frame, budget.budget_seconds)
+            if outcome == IsolatedOutcome.DONE:
+                # The result comes with the reply to this frame; the camera's own instance is idle
+                analysed = (processed, runner.result, runner.motion_detected)
+                changed = budget.record(runner.elapsed_ms)
+            elif outcome == IsolatedOutcome.TIMED_OUT:
+                # Not done within the budget: publish the frame unprocessed rather than wait
+                changed = budget.record(budget.budget_seconds * 1000, timed_out=True)
+                self._check_watchdog(video_index, runner)
+            else:
+                # Never sent, so it says nothing about processing time; only count it as skipped
+                budget.record_skipped()
+                changed = False
+                self._check_watchdog(video_index, runner)
+        else:
+            if runner is not None:
+                # Back within budget: the camera's own instance takes over again
+                runner.stop()
+                self._isolated_runners[video_index] = None
+            started = time.perf_counter()
+            analysed = self._run_algorithm(self._algorithms[video_index], frame)
+            changed = budget.record((time.perf_counter() - started) * 1000)
+
+        if changed:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.BUDGET_MODE_CHANGED.format(
+                self._videos_config[video_index].get("video_id"), budget.budget_seconds * 1000,
+                budget.mode.value, budget.level))
+        return analysed
+
+    def _isolated_runner(self, video_index: int, frame: Any) -> Optional[IsolatedAlgorithmRunner]:
+        # The camera's runner for frames like this one, started on first use; None when this camera
+        # cannot run its algorithm in a child process (e.g. it already runs in a daemonic worker process),
+        # in which case its budget stops at the last skip level
+        runner = self._isolated_runners[video_index]
+        if runner is not None and not runner.accepts(frame):
+            # The stream changed resolution; the shared frames are sized for the old one
+            runner.stop()
+            runner = None
+        if runner is None:
             try:
-                output_path = f"/app/logs/stream_{video_index + 1}.jpg"
-                cv2.imwrite(output_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                runner = IsolatedAlgorithmRunner(self._videos_config[video_index], frame.shape, frame.dtype)
             except Exception as e:
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Failed to save frame: {e}")
+                self._frame_budgets[video_index].disable_isolation()
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.BUDGET_ISOLATION_UNAVAILABLE.format(
+                    self._videos_config[video_index].get("video_id"), e))
+        self._isolated_runners[video_index] = runner
+        return runner
+
+    def _check_watchdog(self, video_index: int, runner: IsolatedAlgorithmRunner) -> None:
+        stuck_seconds = runner.stuck_seconds
+        if stuck_seconds < Consts.BUDGET_WATCHDOG_SECONDS:
+            return
+        # Kill and reap the process stuck inside the algorithm, taking its instance and buffers with it;
+        # the runner's supervisor restarts it with a fresh instance
+        runner.restart()
+        self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.BUDGET_WATCHDOG_REPLACED.format(
+            self._videos_config[video_index].get("video_id"), stuck_seconds))
+
+    def _process_batch_worker(self) -> None:
+        # One thread for all cameras: each tick gathers whatever new frame every camera has, runs them
+        # through the batched engine in one pass and fans the detections back out per camera
+        tick_seconds = 1.0 / max(1, Consts.ALGO_FRAME_RATE)
+        last_frame_at = [time.monotonic()] * self._num_videos
+        for i, state in enumerate(self._camera_states):
+            if state == CameraState.RECONNECTING:
+                self._start_background_reconnect(i)
 
-            # Keep only latest in queue
-            if q.full():
+        while self._running:
+            tick_started = time.monotonic()
+            frames: List[Optional[Any]] = [None] * self._num_videos
+            traces: List[Optional[FrameTrace]] = [None] * self._num_videos
+
+            for i, reader in enumerate(self._readers):
+                if self._camera_states[i] in (CameraState.RECONNECTING, CameraState.FINISHED):
+                    last_frame_at[i] = tick_started
+                    continue
+                scheduler = self._rate_schedulers[i]
+                if scheduler is not None and scheduler.seconds_until_due(tick_started) > 0:
+                    continue
+                frame = reader.poll_frame()
+                if frame is None:
+                    idle = tick_started - last_frame_at[i]
+                    if reader.finished:
+                        self._set_camera_state(i, CameraState.FINISHED)
+                    elif idle >= Consts.CAMERA_STALL_RECONNECT_SECONDS:
+                        self._set_camera_state(i, CameraState.RECONNECTING)
+                        self._start_background_reconnect(i)
+                    elif idle >= Consts.SHM_RING_READ_TIMEOUT_SECONDS:
+                        self._set_camera_state(i, CameraState.STALLED)
+                    continue
+                last_frame_at[i] = tick_started
+                self._set_camera_state(i, CameraState.ACTIVE)
+                self._frame_counts[i] += 1
+                frames[i] = frame
+                traces[i] = reader.last_frame_trace
+
+            if any(frame is not None for frame in frames):
+                results: List[Optional[Any]] = [None] * self._num_videos
                 try:
-                    q.get_nowait()
-                except Empty:
-                    pass
+                    results = self._batch_engine.process(frames)
+                except Exception as e:
+                    self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.MOTION_ERROR.format(e))
+                processed_ns = time.time_ns()
+
+                for i, frame in enumerate(frames):
+                    if frame is None or not self._frame_is_current(i):
+                        continue
+                    if traces[i] is not None:
+                        traces[i].processed_ns = processed_ns
+                    if results[i] is not None:
+                        self._handle_result(i, DetectionResult(results[i]), traces[i], self._frame_counts[i])
+                    if self._rate_schedulers[i] is not None:
+                        self._record_activity(i, results[i] is not None and len(results[i]) > 0)
+                    self._publish_frame(i, self._batch_engine.draw(i, frame, results[i]), traces[i])
+
+            self._shutdown.wait(max(0.0, tick_seconds - (time.monotonic() - tick_started)))
+
+    def _frame_is_current(self, video_index: int) -> bool:
+        # A ring frame overwritten while it was being analysed or published is dropped with its result
+        if self._readers[video_index].frame_is_current:
+            return True
+        self._lapped_frames[video_index] += 1
+        return False
+
+    def _publish_frame(self, video_index: int, frame: Any, trace: Optional[FrameTrace]) -> None:
+        # Save latest frame as JPEG for GUI display
+        try:
+            self._write_preview(video_index, frame, trace)
+        except Exception as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Failed to save frame: {e}")
+        if trace is not None:
+            trace.output_ns = time.time_ns()
+            self._latency_trackers[video_index].record(trace)
+
+        # Keep only latest in queue
+        q = self._frame_queues[video_index]
+        if q.full():
             try:
-                q.put_nowait(frame)
-            except Exception:
+                q.get_nowait()
+            except Empty:
                 pass
+        try:
+            q.put_nowait(frame)
+        except Exception:
+            pass
+
+    def _handle_result(self, video_index: int, result: Optional[DetectionResult], trace: Optional[FrameTrace],
+                       sequence: int) -> None:
+        # Frames the algorithm skipped keep the same result object and are not counted again
+        if result is None or result is self._last_results[video_index]:
+            return
+        self._last_results[video_index] = result
+        if trace is not None:
+            sequence = trace.sequence
+        timestamp_ns = trace.capture_ns if trace is not None and trace.capture_ns else time.time_ns()
+
+        segmenter = self._segmenters[video_index]
+        if segmenter is not None:
+            self._emit_segment_events(video_index, segmenter.update(result, sequence, timestamp_ns))
+
+        # Every analysed frame with detections, plus the first empty one after them so consumers see
+        # the motion stop
+        has_boxes = len(result.boxes) > 0
+        if self._detection_publisher is None or (not has_boxes and not self._last_result_had_boxes[video_index]):
+            return
+        self._last_result_had_boxes[video_index] = has_boxes
+        self._detection_publisher.publish(result.to_event(
+            self._videos_config[video_index].get("video_id"), sequence, timestamp_ns))
+
+    def _emit_segment_events(self, video_index: int, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.MOTION_SEGMENT_EVENT.format(
+                event["video_id"], event["segment_id"], event["event"], event["zone"], event["duration_ms"],
+                event["peak_area"]))
+            if self._detection_publisher is not None:
+                self._detection_publisher.publish(event, ConstStrings.SEGMENTS_TOPIC)
+
+    def _write_preview(self, video_index: int, frame: Any, trace: Optional[FrameTrace]) -> None:
+        ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, Consts.PREVIEW_JPEG_QUALITY])
+        if not ok:
+            raise ValueError(f"JPEG encoding failed for video {video_index + 1}")
+        jpeg = encoded.tobytes()
+        if trace is not None:
+            # Embed the frame trace as a JPEG comment (COM) segment right after the SOI marker,
+            # so the GUI can tell which frame it shows and how old it is
+            comment = json.dumps(trace.to_dict()).encode(ConstStrings.ENCODE_FORMAT)
+            jpeg = jpeg[:2] + b"\xff\xfe" + (len(comment) + 2).to_bytes(2, "big") + comment + jpeg[2:]
+        with open(ConstStrings.PREVIEW_IMAGE_PATH.format(video_index + 1), "wb") as preview_file:
+            preview_file.write(jpeg)
+
+    def _record_activity(self, video_index: int, motion: bool) -> None:
+        scheduler = self._rate_schedulers[video_index]
+        previous = scheduler.rate
+        scheduler.record(motion, time.monotonic())
+        if scheduler.rate != previous:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANALYSIS_RATE_CHANGED.format(
+                self._videos_config[video_index].get("video_id"), previous.value, scheduler.rate.value))
+
+    def _set_camera_state(self, video_index: int, state: CameraState) -> None:
+        previous = self._camera_states[video_index]
+        if previous == state:
+            return
+        self._camera_states[video_index] = state
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CAMERA_STATE_CHANGED.format(
+            self._videos_config[video_index].get("video_id"), previous.value, state.value))
+
+        # One ended stream must not tear down the others; stop only once every camera is done
+        if state == CameraState.FINISHED and all(s == CameraState.FINISHED for s in self._camera_states):
+            self._running = False
+
+    def _start_background_reconnect(self, video_index: int) -> None:
+        # Reopening a reader can block for seconds; keep that off the shared batch thread
+        thread = threading.Thread(target=self._reconnect_until_ready, args=(video_index,), daemon=True)
+        thread.start()
+
+    def _reconnect_until_ready(self, video_index: int) -> None:
+        backoff = ExponentialBackoff(Consts.CAMERA_RECONNECT_BASE_SECONDS,
+                                     Consts.CAMERA_RECONNECT_MAX_SECONDS,
+                                     Consts.CAMERA_RECONNECT_JITTER)
+        while self._running and self._camera_states[video_index] == CameraState.RECONNECTING:
+            self._reconnect_reader(video_index, backoff)
+
+    def _reconnect_reader(self, video_index: int, backoff: ExponentialBackoff) -> bool:
+        if Consts.CAMERA_MAX_RECONNECT_ATTEMPTS and backoff.attempts >= Consts.CAMERA_MAX_RECONNECT_ATTEMPTS:
+            self._set_camera_state(video_index, CameraState.FINISHED)
+            return False
+        if self._shutdown.wait(backoff.next_delay()):
+            return False
+
+        reader = self._readers[video_index]
+        try:
+            reader.release()
+            reader.start()
+        except (TimeoutError, ValueError) as e:
+            self._logger.log(ConstStrings.LOG_NAME_ERROR, LoggerMessages.READER_START_FAILED.format(
+                self._videos_config[video_index].get("video_id"), e))
+            return False
+        self._set_camera_state(video_index, CameraState.STALLED)
+        return True
 
     def _render_frames_main_thread(self) -> None:
         for i in range(self._num_videos):
@@ -0,0 +1,55 @@
+import time
+from typing import Any, Dict, Optional
+
+from globals.consts.consts import Consts
+from globals.enums.analysis_rate import AnalysisRate
+
+
+class AdaptiveRateScheduler:
+    # Per-camera analysis rate that follows scene activity: a camera runs at active_fps while there is
+    # motion, drops to idle_fps once it has been quiet for quiet_seconds, and jumps back to active_fps
+    # on the first frame with motion regions. active_fps <= 0 means every frame is analysed.
+
+    def __init__(self, active_fps: float = Consts.ADAPTIVE_ACTIVE_FPS, idle_fps: float = Consts.ADAPTIVE_IDLE_FPS,
+                 quiet_seconds: float = Consts.ADAPTIVE_QUIET_SECONDS) -> None:
+        self._active_period = 1.0 / active_fps if active_fps > 0 else 0.0
+        self._idle_period = 1.0 / idle_fps if idle_fps > 0 else 0.0
+        self._quiet_seconds = quiet_seconds
+        self._rate = AnalysisRate.ACTIVE
+        self._last_motion = time.monotonic()
+        self._next_due = 0.0
+
+        self._analysed = 0
+        self._idle_transitions = 0
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["AdaptiveRateScheduler"]:
+        if not bool(config.get("adaptive_rate", Consts.ADAPTIVE_RATE)):
+            return None
+        return AdaptiveRateScheduler(float(config.get("active_fps", Consts.ADAPTIVE_ACTIVE_FPS)),
+                                     float(config.get("idle_fps", Consts.ADAPTIVE_IDLE_FPS)),
+                                     float(config.get("quiet_seconds", Consts.ADAPTIVE_QUIET_SECONDS)))
+
+    @property
+    def rate(self) -> AnalysisRate:
+        return self._rate
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {"rate": self._rate.value, "analysed": self._analysed, "idle_transitions": self._idle_transitions}
+
+    def seconds_until_due(self, now: float) -> float:
+        # How long the caller should wait before analysing the next frame (0 = analyse now)
+        return max(0.0, self._next_due - now)
+
+    def record(self, motion: bool, now: float) -> None:
+        # Called after each analysed frame with whether it had motion regions
+        self._analysed += 1
+        if motion:
+            self._last_motion = now
+            self._rate = AnalysisRate.ACTIVE
+        elif self._rate == AnalysisRate.ACTIVE and now - self._last_motion >= self._quiet_seconds:
+            self._rate = AnalysisRate.IDLE
+            self._idle_transitions += 1
+        period = self._idle_period if self._rate == AnalysisRate.IDLE else self._active_period
+        self._next_due = now + period
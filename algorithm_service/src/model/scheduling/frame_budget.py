@@ -0,0 +1,111 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from globals.consts.consts import Consts
+from globals.enums.budget_mode import BudgetMode
+from globals.utils.latency_histogram import LatencyHistogram
+
+
+class FrameBudget:
+    # Per-camera processing budget. Every processing time is histogrammed and compared with budget_ms.
+    # When more than degrade_ratio of the last window_frames frames overran, the camera degrades one
+    # level: first it analyses every 2nd frame, then every 4th, ... and finally the algorithm is moved
+    # to an isolated process that the worker never waits on for longer than the budget (a camera that
+    # cannot start one stays at the last skip level). Once fewer than recover_ratio overrun, it steps
+    # back up one level.
+
+    def __init__(self, budget_ms: float, window_frames: int = Consts.BUDGET_WINDOW_FRAMES,
+                 degrade_ratio: float = Consts.BUDGET_DEGRADE_RATIO, recover_ratio: float = Consts.BUDGET_RECOVER_RATIO,
+                 max_skip_level: int = Consts.BUDGET_MAX_SKIP_LEVEL, auto_degrade: bool = True) -> None:
+        self._budget_ms = budget_ms
+        self._degrade_ratio = degrade_ratio
+        self._recover_ratio = recover_ratio
+        self._max_skip_level = max_skip_level
+        self._auto_degrade = auto_degrade
+        # The isolated level sits above the skip levels until isolation turns out to be unavailable
+        self._max_level = max_skip_level + 1
+        self._window: Deque[bool] = deque(maxlen=max(1, window_frames))
+        self._level = 0
+        self._frame_counter = 0
+
+        self._histogram = LatencyHistogram(Consts.LATENCY_HISTOGRAM_BOUNDS_MS)
+        self._overruns = 0
+        self._skipped = 0
+        self._timed_out = 0
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> Optional["FrameBudget"]:
+        budget_ms = float(config.get("frame_budget_ms", Consts.FRAME_BUDGET_MS))
+        if budget_ms <= 0:
+            return None
+        return FrameBudget(budget_ms,
+                           window_frames=int(config.get("budget_window_frames", Consts.BUDGET_WINDOW_FRAMES)),
+                           max_skip_level=int(config.get("budget_max_skip_level", Consts.BUDGET_MAX_SKIP_LEVEL)),
+                           auto_degrade=bool(config.get("budget_auto_degrade", True)))
+
+    @property
+    def budget_seconds(self) -> float:
+        return self._budget_ms / 1000
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @property
+    def mode(self) -> BudgetMode:
+        if self._level == 0:
+            return BudgetMode.NORMAL
+        if self._level <= self._max_skip_level:
+            return BudgetMode.SKIP_FRAMES
+        return BudgetMode.ISOLATED
+
+    def disable_isolation(self) -> None:
+        # Cap degradation at the last skip level, e.g. when this camera cannot start a child process
+        self._max_level = self._max_skip_level
+        self._level = min(self._level, self._max_level)
+        self._window.clear()
+
+    def should_process(self) -> bool:
+        # In skip mode only every (2 ** level)-th frame is analysed
+        self._frame_counter += 1
+        if self.mode != BudgetMode.SKIP_FRAMES or self._frame_counter % (2 ** self._level) == 0:
+            return True
+        self._skipped += 1
+        return False
+
+    def record_skipped(self) -> None:
+        # Account a frame that was never processed, e.g. while an isolated algorithm was still busy;
+        # it is left out of the histogram and the overrun window
+        self._skipped += 1
+
+    def record(self, elapsed_ms: float, timed_out: bool = False) -> bool:
+        # Account one processed frame; returns True when the degradation level changed
+        overrun = timed_out or elapsed_ms > self._budget_ms
+        self._histogram.record(elapsed_ms)
+        self._overruns += overrun
+        self._timed_out += timed_out
+        self._window.append(overrun)
+        if not self._auto_degrade or len(self._window) < self._window.maxlen:
+            return False
+
+        ratio = sum(self._window) / len(self._window)
+        if ratio > self._degrade_ratio and self._level < self._max_level:
+            self._level += 1
+        elif ratio < self._recover_ratio and self._level > 0:
+            self._level -= 1
+        else:
+            return False
+        # Judge the new level on its own frames
+        self._window.clear()
+        return True
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        stats = {
+            "budget_ms": self._budget_ms, "mode": self.mode.value, "level": self._level,
+            "overruns": self._overruns, "skipped": self._skipped, "timed_out": self._timed_out,
+            "processing_ms": self._histogram.snapshot(),
+        }
+        if reset:
+            self._histogram.reset()
+            self._overruns = self._skipped = self._timed_out = 0
+        return stats
@@ -0,0 +1,180 @@
+import mmap
+import multiprocessing
+import os
+import time
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.consts.const_strings import ConstStrings
+from globals.enums.isolated_outcome import IsolatedOutcome
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+from infrastructure.processes.process_supervisor import ProcessSupervisor
+
+
+class IsolatedAlgorithmRunner:
+    # Runs one camera's algorithm in a child process under a ProcessSupervisor, so the camera worker
+    # never blocks on it for longer than a timeout and a stuck algorithm can be killed. The child builds
+    # its own instance from the camera config. Frames go through a shared memory file (input frame, then
+    # output frame); only the request sequence and the (sequence, ms, result, motion) reply cross the
+    # pipe, and replies to older requests are ignored. A frame that does not finish in time is handed
+    # back unprocessed, and new frames are skipped (never sent) until the child answers or is restarted.
+
+    def __init__(self, video: Dict[str, Any], frame_shape: Tuple[int, ...], frame_dtype: Any) -> None:
+        self._video_id = video.get("video_id")
+        self._shape = tuple(frame_shape)
+        self._dtype = np.dtype(frame_dtype)
+        self._path = ConstStrings.ISOLATED_FRAMES_PATH.format(camera_id=self._video_id)
+        self._mmap, self._input, self._output = self._map_frames(self._path, self._shape, self._dtype, create=True)
+
+        context = multiprocessing.get_context(Consts.PROCESS_START_METHOD)
+        self._connection, child_connection = context.Pipe()
+        target = partial(IsolatedAlgorithmRunner.run_worker, connection=child_connection, frames_path=self._path,
+                         frame_shape=self._shape, frame_dtype=self._dtype.str)
+        self._supervisor = ProcessSupervisor(f"isolated_algorithm_{self._video_id}", target, [[video]])
+        try:
+            self._supervisor.start()
+        except Exception:
+            # E.g. a daemonic process may not have children; leave nothing behind for the caller
+            self._supervisor.stop()
+            child_connection.close()
+            self._release_frames()
+            raise
+
+        self._sequence = 0
+        self._started_at: Optional[float] = None
+        self._elapsed_ms = 0.0
+        self._result: Any = None
+        self._motion: Optional[bool] = None
+
+    @staticmethod
+    def run_worker(videos_config: List[Dict], stop_event: Any, stats_queue: Any, worker_index: int,
+                   connection: Any, frames_path: str, frame_shape: Tuple[int, ...], frame_dtype: str) -> None:
+        # Entry point of the child process started by ProcessSupervisor
+        video = videos_config[0]
+        algo = AlgorithmFactory.create_camera_algorithm(video)
+        _, frame_input, frame_output = IsolatedAlgorithmRunner._map_frames(
+            frames_path, frame_shape, np.dtype(frame_dtype))
+        last_stats_time = time.monotonic()
+        last_result = None
+        try:
+            while not stop_event.is_set():
+                if connection.poll(Consts.PROCESS_MONITOR_INTERVAL_SECONDS):
+                    sequence = connection.recv()
+                    started = time.perf_counter()
+                    try:
+                        processed = algo.process(frame_input)
+                    except Exception:
+                        processed = frame_input
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    frame_output[...] = processed if processed.shape == frame_output.shape else frame_input
+                    # A frame the algorithm skipped keeps the previous result; send it once only
+                    result = algo.result if algo.result is not last_result else None
+                    last_result = algo.result
+                    connection.send((sequence, elapsed_ms, result, getattr(algo, "motion_detected", None)))
+
+                now = time.monotonic()
+                if now - last_stats_time >= Consts.PROCESS_STATS_INTERVAL_SECONDS:
+                    last_stats_time = now
+                    ProcessSupervisor.report_stats(stats_queue, worker_index,
+                                                   {video.get("video_id"): getattr(algo, "stats", None)})
+        finally:
+            algo.release()
+
+    @property
+    def busy(self) -> bool:
+        return self._started_at is not None
+
+    @property
+    def stuck_seconds(self) -> float:
+        started_at = self._started_at
+        return 0.0 if started_at is None else time.monotonic() - started_at
+
+    @property
+    def elapsed_ms(self) -> float:
+        # Processing time of the frame the last successful process() returned
+        return self._elapsed_ms
+
+    @property
+    def result(self) -> Any:
+        # Result of the frame the last successful process() returned
+        return self._result
+
+    @property
+    def motion_detected(self) -> Optional[bool]:
+        return self._motion
+
+    @property
+    def stats(self) -> Optional[Dict[str, Any]]:
+        # Algorithm stats last reported by the child
+        cameras = self._supervisor.get_stats().get(0, {}).get(ConstStrings.WORKER_CAMERAS_KEY, {})
+        return cameras.get(self._video_id)
+
+    def accepts(self, frame: Any) -> bool:
+        return frame.shape == self._shape and frame.dtype == self._dtype
+
+    def process(self, frame: Any, timeout: float) -> Tuple[Any, IsolatedOutcome]:
+        # Returns (processed frame, DONE) when the algorithm finished in time, else the frame unprocessed
+        # with TIMED_OUT, or SKIPPED when it was not sent because the child is busy or not running
+        self._receive_replies(0)
+        if self.busy or not self._supervisor.worker_alive(0):
+            return frame, IsolatedOutcome.SKIPPED
+        self._input[...] = frame
+        self._sequence += 1
+        self._result = self._motion = None
+        self._started_at = time.monotonic()
+        self._connection.send(self._sequence)
+        if not self._receive_replies(timeout):
+            return frame, IsolatedOutcome.TIMED_OUT
+        return self._output.copy(), IsolatedOutcome.DONE
+
+    def restart(self) -> None:
+        # Kills the child stuck on the current frame; the supervisor starts a fresh one with a new instance
+        self._supervisor.terminate_worker(0)
+        self._started_at = None
+
+    def stop(self) -> None:
+        self._supervisor.stop()
+        self._release_frames()
+
+    # ===== Internal =====
+
+    def _release_frames(self) -> None:
+        self._connection.close()
+        del self._input, self._output
+        self._mmap.close()
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+    def _receive_replies(self, timeout: float) -> bool:
+        # Reads replies until the current request is answered (True) or timeout passes
+        deadline = time.monotonic() + timeout
+        while self.busy:
+            if not self._connection.poll(max(0.0, deadline - time.monotonic())):
+                return False
+            sequence, elapsed_ms, result, motion = self._connection.recv()
+            if sequence == self._sequence:
+                self._elapsed_ms = elapsed_ms
+                self._result = result
+                self._motion = motion
+                self._started_at = None
+        return True
+
+    @staticmethod
+    def _map_frames(path: str, frame_shape: Tuple[int, ...], frame_dtype: np.dtype,
+                    create: bool = False) -> Tuple[mmap.mmap, np.ndarray, np.ndarray]:
+        frame_bytes = int(np.prod(frame_shape)) * frame_dtype.itemsize
+        fd = os.open(path, os.O_CREAT | os.O_TRUNC | os.O_RDWR if create else os.O_RDWR, 0o666)
+        try:
+            if create:
+                os.ftruncate(fd, 2 * frame_bytes)
+            mm = mmap.mmap(fd, 2 * frame_bytes, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        frame_input = np.ndarray(frame_shape, dtype=frame_dtype, buffer=mm, offset=0)
+        frame_output = np.ndarray(frame_shape, dtype=frame_dtype, buffer=mm, offset=frame_bytes)
+        return mm, frame_input, frame_output
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Sequence
+
+from globals.consts.consts import Consts
+from globals.enums.latency_stage import LatencyStage
+from globals.utils.latency_histogram import LatencyHistogram
+from model.data_classes.frame_trace import FrameTrace
+
+
+class FrameLatencyTracker:
+    # Per-camera latency histograms, one per pipeline stage, fed from completed frame traces
+
+    def __init__(self, bounds_ms: Sequence[float] = Consts.LATENCY_HISTOGRAM_BOUNDS_MS) -> None:
+        self._histograms: Dict[LatencyStage, LatencyHistogram] = {
+            stage: LatencyHistogram(bounds_ms) for stage in LatencyStage
+        }
+
+    def record(self, trace: FrameTrace) -> None:
+        # Stages whose start or end was not stamped (e.g. the GStreamer transport has no capture time) are skipped
+        self._record_stage(LatencyStage.CAPTURE_TO_PUBLISH, trace.capture_ns, trace.publish_ns)
+        self._record_stage(LatencyStage.PUBLISH_TO_READ, trace.publish_ns, trace.read_ns)
+        self._record_stage(LatencyStage.PROCESS, trace.read_ns, trace.processed_ns)
+        self._record_stage(LatencyStage.OUTPUT, trace.processed_ns, trace.output_ns)
+        self._record_stage(LatencyStage.CAPTURE_TO_OUTPUT, trace.capture_ns, trace.output_ns)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        stats = {stage.value: histogram.snapshot() for stage, histogram in self._histograms.items() if histogram.count}
+        if reset:
+            for histogram in self._histograms.values():
+                histogram.reset()
+        return stats
+
+    # ===== Internal =====
+
+    def _record_stage(self, stage: LatencyStage, start_ns: int, end_ns: int) -> None:
+        if not start_ns or not end_ns:
+            return
+        self._histograms[stage].record(max(end_ns - start_ns, 0) / 1e6)
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from model.algorithms.activity_heatmap import ActivityHeatmap
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+class TestActivityHeatmap(unittest.TestCase):
+    HALF_LIFE = 10.0
+
+    def setUp(self) -> None:
+        self._clock = FakeClock()
+        patcher = mock.patch("model.algorithms.activity_heatmap.time", self._clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self._path = os.path.join(self._dir.name, "heatmap.npz")
+
+    def _heatmap(self, **kwargs) -> ActivityHeatmap:
+        heatmap = ActivityHeatmap(block_size=4, half_life_seconds=self.HALF_LIFE, snapshot_interval_seconds=0,
+                                  **kwargs)
+        heatmap.begin((8, 8), offset=(0, 0), scale=(1.0, 1.0))
+        return heatmap
+
+    def _mask(self, active: bool) -> np.ndarray:
+        # Left column of cells foreground, right column background
+        mask = np.zeros((8, 8), dtype=np.uint8)
+        if active:
+            mask[:, :4] = 255
+        return mask
+
+    def _values(self, heatmap: ActivityHeatmap) -> np.ndarray:
+        return np.array(heatmap.to_dict()["values"])
+
+    def test_disabled_by_default(self) -> None:
+        self.assertIsNone(ActivityHeatmap.from_config({}))
+        self.assertIsNotNone(ActivityHeatmap.from_config({"heatmap": True}))
+
+    def test_grid_geometry_is_in_frame_pixels(self) -> None:
+        heatmap = ActivityHeatmap(block_size=16)
+        heatmap.begin((36, 64), offset=(8, 4), scale=(4.0, 4.0))
+        description = heatmap.to_dict()
+        self.assertEqual(description["grid"], [4, 3])
+        self.assertEqual(description["origin"], [32.0, 16.0])
+        self.assertEqual(description["cell"], [64.0, 48.0])
+
+    def test_one_half_life_of_motion_reaches_half(self) -> None:
+        heatmap = self._heatmap()
+        heatmap.update(self._mask(True))
+        self._clock.now += self.HALF_LIFE
+        heatmap.update(self._mask(True))
+        # The first frame counts as one frame step, the second as a whole half-life
+        values = self._values(heatmap)
+        self.assertGreater(values[0, 0], 0.5)
+        self.assertLess(values[0, 0], 0.52)
+        self.assertEqual(values[0, 1], 0.0)
+
+    def test_quiet_time_decays_by_half_life(self) -> None:
+        heatmap = self._heatmap()
+        heatmap.update(self._mask(True))
+        for _ in range(20):
+            self._clock.now += self.HALF_LIFE
+            heatmap.update(self._mask(True))
+        self.assertAlmostEqual(self._values(heatmap)[0, 0], 1.0, places=4)
+
+        self._clock.now += 2 * self.HALF_LIFE
+        heatmap.update(self._mask(False))
+        self.assertAlmostEqual(self._values(heatmap)[0, 0], 0.25, places=4)
+
+    def test_decay_does_not_depend_on_update_rate(self) -> None:
+        slow, fast = self._heatmap(), self._heatmap()
+        for heatmap in (slow, fast):
+            heatmap.update(self._mask(True))
+        start = self._clock.now
+        for step in range(1, 11):
+            self._clock.now = start + step
+            fast.update(self._mask(False))
+        slow.update(self._mask(False))
+        np.testing.assert_allclose(self._values(slow), self._values(fast), atol=1e-3)
+
+    def test_snapshot_decays_for_downtime(self) -> None:
+        heatmap = self._heatmap(snapshot_path=self._path)
+        heatmap.update(self._mask(True))
+        self._clock.now += 100 * self.HALF_LIFE
+        heatmap.update(self._mask(True))
+        heatmap.save()
+        saved = self._values(heatmap)
+
+        self._clock.now += self.HALF_LIFE
+        snapshot = ActivityHeatmap.describe_snapshot(self._path)
+        np.testing.assert_allclose(np.array(snapshot["values"]), saved / 2, atol=1e-4)
+        self.assertEqual(snapshot["frames"], 2)
+
+        restored = self._heatmap(snapshot_path=self._path)
+        self.assertTrue(restored.stats["restored"])
+        np.testing.assert_allclose(self._values(restored), saved / 2, atol=1e-4)
+
+    def test_snapshot_of_another_grid_is_ignored(self) -> None:
+        heatmap = self._heatmap(snapshot_path=self._path)
+        heatmap.update(self._mask(True))
+        heatmap.save()
+
+        other = ActivityHeatmap(block_size=2, snapshot_path=self._path)
+        other.begin((8, 8), offset=(0, 0), scale=(1.0, 1.0))
+        self.assertFalse(other.stats["restored"])
+        self.assertEqual(other.to_dict()["max"], 0.0)
+
+    def test_missing_snapshot(self) -> None:
+        self.assertIsNone(ActivityHeatmap.describe_snapshot(self._path))
+        self.assertIsNone(ActivityHeatmap.describe_snapshot(None))
+
+    def test_reset_clears_activity(self) -> None:
+        heatmap = self._heatmap()
+        heatmap.update(self._mask(True))
+        heatmap.reset()
+        self.assertEqual(heatmap.to_dict()["max"], 0.0)
+        self.assertEqual(heatmap.stats["frames"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
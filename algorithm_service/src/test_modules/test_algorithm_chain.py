@@ -0,0 +1,52 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+
+
+class TestAlgorithmChain(unittest.TestCase):
+    SHAPE = (180, 320, 3)
+    CONFIG = {"background_model": "median", "dilate_iterations": 0, "draw_bbox": True}
+
+    def _chain(self):
+        chain = AlgorithmFactory.create_chain([
+            {"algorithm": "motion_detection", "algorithm_config": self.CONFIG},
+            {"algorithm": "motion_detection", "algorithm_config": dict(self.CONFIG, analysis_width=160,
+                                                                       analysis_height=90)},
+        ])
+        self.addCleanup(chain.release)
+        return chain
+
+    def _process(self, algo) -> tuple:
+        # Returns (input frame, output frame) of the first frame with motion
+        for _ in range(3):
+            algo.process(np.zeros(self.SHAPE, dtype=np.uint8))
+        frame = np.zeros(self.SHAPE, dtype=np.uint8)
+        cv2.rectangle(frame, (100, 60), (179, 119), (255, 255, 255), -1)
+        return frame, algo.process(frame)
+
+    def test_writable_frame_is_not_annotated_for_later_members(self) -> None:
+        frame, output = self._process(self._chain())
+        self.assertIsNot(output, frame)
+        # Outline pixels just outside the object are drawn in green on the output only
+        self.assertEqual(output[59, 140].tolist(), [0, 255, 0])
+        self.assertEqual(frame[59, 140].tolist(), [0, 0, 0])
+
+    def test_members_see_the_same_detections(self) -> None:
+        chain = self._chain()
+        self._process(chain)
+        first, second = chain._algorithms
+        self.assertEqual(first.result.boxes[:, :4].tolist(), [[100, 60, 80, 60]])
+        self.assertEqual(second.result.boxes[:, :4].tolist(), [[100, 60, 80, 60]])
+
+    def test_single_algorithm_draws_on_writable_frame_in_place(self) -> None:
+        algo = AlgorithmFactory.create("motion_detection", self.CONFIG)
+        self.addCleanup(algo.release)
+        frame, output = self._process(algo)
+        self.assertIs(output, frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+
+
+class TestBatchedMotionDetection(unittest.TestCase):
+    SHAPE = (Consts.BATCH_ANALYSIS_HEIGHT, Consts.BATCH_ANALYSIS_WIDTH, 3)
+
+    def _engine(self, cameras: int = 2, **config):
+        config = dict({"draw_bbox": False, "min_contour_area": 0}, **config)
+        engine = AlgorithmFactory.create_batched_motion_engine([config] * cameras)
+        self.addCleanup(engine.release)
+        engine.process([self._frame()] * cameras)  # first frames seed the backgrounds
+        return engine
+
+    def _frame(self, rows: slice = slice(0, 0), cols: slice = slice(100, 140)) -> np.ndarray:
+        frame = np.zeros(self.SHAPE, dtype=np.uint8)
+        frame[rows, cols] = 255
+        return frame
+
+    def test_boxes_are_in_each_cameras_coordinates(self) -> None:
+        engine = self._engine()
+        results = engine.process([self._frame(slice(100, 120)), None])
+        self.assertEqual(results[0][:, :4].tolist(), [[98, 98, 44, 24]])
+        self.assertIsNone(results[1])
+
+    def test_motion_on_adjacent_camera_edges_stays_separate(self) -> None:
+        height = self.SHAPE[0]
+        for config in ({}, {"dilate_iterations": 6}, {"erode_iterations": 1, "dilate_iterations": 4}):
+            with self.subTest(**config):
+                engine = self._engine(**config)
+                bottom, top = engine.process([self._frame(slice(height - 20, height)), self._frame(slice(0, 20))])
+                self.assertEqual(len(bottom), 1)
+                self.assertEqual(len(top), 1)
+                # Dilation is clipped at the frame edge instead of running into the gap
+                self.assertEqual(bottom[0, 1] + bottom[0, 3], height)
+                self.assertEqual(top[0, 1], 0)
+                self.assertEqual(bottom[0, 4], top[0, 4])
+
+    def test_draw_reuses_output_buffers_for_read_only_frames(self) -> None:
+        engine = self._engine(cameras=1, draw_bbox=True)
+        frame = self._frame(slice(100, 120))
+        frame.flags.writeable = False
+        outputs = []
+        for _ in range(Consts.MOTION_OUTPUT_BUFFERS + 1):
+            boxes = engine.process([frame])[0]
+            outputs.append(engine.draw(0, frame, boxes))
+
+        self.assertFalse(np.shares_memory(outputs[0], frame))
+        self.assertEqual(len({id(output) for output in outputs}), Consts.MOTION_OUTPUT_BUFFERS)
+        self.assertIs(outputs[0], outputs[-1])
+        self.assertEqual(outputs[-1][98, 98].tolist(), [0, 255, 0])
+        self.assertEqual(frame[98, 98].tolist(), [0, 0, 0])
+
+    def test_min_area_is_per_camera(self) -> None:
+        height = self.SHAPE[0]
+        engine = self._engine(min_contour_area=1000)
+        # Two 968 px regions touching the shared gap must not add up to one detection
+        results = engine.process([self._frame(slice(height - 20, height)), self._frame(slice(0, 20))])
+        self.assertEqual([len(boxes) for boxes in results], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from globals.enums.budget_mode import BudgetMode
+from model.scheduling.frame_budget import FrameBudget
+
+
+class TestFrameBudget(unittest.TestCase):
+    WINDOW = 4
+
+    def _budget(self, **kwargs) -> FrameBudget:
+        return FrameBudget(10.0, window_frames=self.WINDOW, max_skip_level=2, **kwargs)
+
+    def _fill(self, budget: FrameBudget, elapsed_ms: float, timed_out: bool = False) -> bool:
+        # Record one full window; returns whether the last frame changed the level
+        changed = False
+        for _ in range(self.WINDOW):
+            changed = budget.record(elapsed_ms, timed_out)
+        return changed
+
+    def test_disabled_without_budget(self) -> None:
+        self.assertIsNone(FrameBudget.from_config({"frame_budget_ms": 0}))
+        self.assertIsNotNone(FrameBudget.from_config({"frame_budget_ms": 40}))
+
+    def test_stays_normal_within_budget(self) -> None:
+        budget = self._budget()
+        self.assertFalse(self._fill(budget, 5.0))
+        self.assertEqual(budget.mode, BudgetMode.NORMAL)
+        self.assertTrue(all(budget.should_process() for _ in range(8)))
+
+    def test_waits_for_a_full_window(self) -> None:
+        budget = self._budget()
+        for _ in range(self.WINDOW - 1):
+            self.assertFalse(budget.record(50.0))
+        self.assertTrue(budget.record(50.0))
+
+    def test_degrades_through_skip_levels_to_isolated(self) -> None:
+        budget = self._budget()
+        self.assertTrue(self._fill(budget, 50.0))
+        self.assertEqual((budget.mode, budget.level), (BudgetMode.SKIP_FRAMES, 1))
+        self.assertTrue(self._fill(budget, 50.0))
+        self.assertEqual((budget.mode, budget.level), (BudgetMode.SKIP_FRAMES, 2))
+        self.assertTrue(self._fill(budget, 0.0, timed_out=True))
+        self.assertEqual((budget.mode, budget.level), (BudgetMode.ISOLATED, 3))
+        # Isolated is the last level
+        self.assertFalse(self._fill(budget, 50.0))
+        self.assertEqual(budget.level, 3)
+
+    def test_without_isolation_degrading_stops_at_the_last_skip_level(self) -> None:
+        budget = self._budget()
+        for _ in range(3):
+            self._fill(budget, 50.0)
+        self.assertEqual(budget.mode, BudgetMode.ISOLATED)
+
+        budget.disable_isolation()
+        self.assertEqual((budget.mode, budget.level), (BudgetMode.SKIP_FRAMES, 2))
+        self.assertFalse(self._fill(budget, 50.0))
+        self.assertEqual(budget.mode, BudgetMode.SKIP_FRAMES)
+        # Recovery is unaffected
+        self.assertTrue(self._fill(budget, 5.0))
+        self.assertEqual(budget.level, 1)
+
+    def test_skip_levels_analyse_every_power_of_two_frame(self) -> None:
+        budget = self._budget()
+        self._fill(budget, 50.0)
+        self.assertEqual([budget.should_process() for _ in range(4)], [False, True, False, True])
+        self._fill(budget, 50.0)
+        self.assertEqual([budget.should_process() for _ in range(4)], [False, False, False, True])
+        self.assertEqual(budget.snapshot()["skipped"], 5)
+        self._fill(budget, 50.0)
+        # An isolated camera is offered every frame
+        self.assertTrue(all(budget.should_process() for _ in range(4)))
+
+    def test_recovers_one_level_at_a_time(self) -> None:
+        budget = self._budget()
+        for _ in range(3):
+            self._fill(budget, 50.0)
+        self.assertTrue(self._fill(budget, 5.0))
+        self.assertEqual(budget.mode, BudgetMode.SKIP_FRAMES)
+        self.assertTrue(self._fill(budget, 5.0))
+        self.assertTrue(self._fill(budget, 5.0))
+        self.assertEqual(budget.mode, BudgetMode.NORMAL)
+
+    def test_mixed_window_holds_the_level(self) -> None:
+        # Half the frames overrunning is neither above the degrade ratio nor below the recover ratio
+        budget = self._budget()
+        self._fill(budget, 50.0)
+        for elapsed_ms in (50.0, 5.0, 50.0, 5.0):
+            self.assertFalse(budget.record(elapsed_ms))
+        self.assertEqual(budget.level, 1)
+
+    def test_skipped_frames_are_not_overruns(self) -> None:
+        budget = self._budget()
+        for _ in range(self.WINDOW * 3):
+            budget.record_skipped()
+        self.assertEqual(budget.mode, BudgetMode.NORMAL)
+        stats = budget.snapshot()
+        self.assertEqual((stats["skipped"], stats["overruns"], stats["timed_out"]), (self.WINDOW * 3, 0, 0))
+        self.assertEqual(stats["processing_ms"], FrameBudget(10.0).snapshot()["processing_ms"])
+
+    def test_auto_degrade_off_only_measures(self) -> None:
+        budget = self._budget(auto_degrade=False)
+        self.assertFalse(self._fill(budget, 50.0, timed_out=True))
+        self.assertEqual(budget.mode, BudgetMode.NORMAL)
+        stats = budget.snapshot(reset=True)
+        self.assertEqual((stats["overruns"], stats["timed_out"]), (self.WINDOW, self.WINDOW))
+        self.assertEqual(budget.snapshot()["overruns"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
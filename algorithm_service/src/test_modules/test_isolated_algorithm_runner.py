@@ -0,0 +1,56 @@
+import os
+import unittest
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.enums.isolated_outcome import IsolatedOutcome
+from model.scheduling.isolated_algorithm_runner import IsolatedAlgorithmRunner
+
+
+class TestIsolatedAlgorithmRunner(unittest.TestCase):
+    # Starts a real child process; its first reply includes importing OpenCV and building the algorithm
+    STARTUP_SECONDS = 60
+
+    def setUp(self) -> None:
+        self._video = {"video_id": f"test_runner_{os.getpid()}", "algorithm": "motion_detection",
+                       "algorithm_config": {"background_model": "median", "draw_bbox": False}}
+        self._frame = np.zeros((72, 128, 3), dtype=np.uint8)
+        self._runner = IsolatedAlgorithmRunner(self._video, self._frame.shape, self._frame.dtype)
+
+    def tearDown(self) -> None:
+        if self._runner is not None:
+            self._runner.stop()
+
+    def test_frame_done_in_time(self) -> None:
+        processed, outcome = self._runner.process(self._frame, self.STARTUP_SECONDS)
+        self.assertEqual(outcome, IsolatedOutcome.DONE)
+        np.testing.assert_array_equal(processed, self._frame)
+        self.assertFalse(self._runner.busy)
+        self.assertGreaterEqual(self._runner.elapsed_ms, 0.0)
+        self.assertEqual(len(self._runner.result.boxes), 0)
+        self.assertFalse(self._runner.motion_detected)
+
+    def test_frames_are_skipped_while_the_child_restarts(self) -> None:
+        self._runner.process(self._frame, self.STARTUP_SECONDS)
+        self._runner.restart()
+        # Nothing is sent to a dead child, so the frame never counts as timed out
+        processed, outcome = self._runner.process(self._frame, self.STARTUP_SECONDS)
+        self.assertEqual(outcome, IsolatedOutcome.SKIPPED)
+        self.assertIs(processed, self._frame)
+        self.assertFalse(self._runner.busy)
+
+    def test_resolution_change_is_not_accepted(self) -> None:
+        self.assertTrue(self._runner.accepts(self._frame))
+        self.assertFalse(self._runner.accepts(np.zeros((36, 64, 3), dtype=np.uint8)))
+
+    def test_stop_removes_the_frames_file(self) -> None:
+        path = ConstStrings.ISOLATED_FRAMES_PATH.format(camera_id=self._video["video_id"])
+        self.assertTrue(os.path.exists(path))
+        self._runner.stop()
+        self._runner = None
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+
+
+class TestMotionDetectionAllocations(unittest.TestCase):
+    CONFIG = {"background_model": "median", "draw_bbox": False, "report_allocations": True}
+
+    def setUp(self) -> None:
+        self.addCleanup(tracemalloc.stop)
+
+    def _algorithm(self):
+        algo = AlgorithmFactory.create("motion_detection", self.CONFIG)
+        self.addCleanup(algo.release)
+        return algo
+
+    def _run(self, algo, frames: int = 3) -> None:
+        for _ in range(frames):
+            algo.process(np.zeros((36, 64, 3), dtype=np.uint8))
+
+    def test_first_algorithm_reports_allocations(self) -> None:
+        algo = self._algorithm()
+        self._run(algo)
+        # The first frame allocates the buffers and is not counted
+        self.assertIn("allocated_bytes_per_frame", algo.stats)
+        self.assertGreaterEqual(algo.stats["max_allocated_bytes"], 0)
+
+    def test_only_one_algorithm_per_process_reports(self) -> None:
+        first, second = self._algorithm(), self._algorithm()
+        self._run(first)
+        self._run(second)
+        self.assertIn("allocated_bytes_per_frame", first.stats)
+        self.assertNotIn("allocated_bytes_per_frame", second.stats)
+
+    def test_release_hands_reporting_on(self) -> None:
+        first = self._algorithm()
+        first.release()
+        second = self._algorithm()
+        self._run(second)
+        self.assertIn("allocated_bytes_per_frame", second.stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+
+
+class TestMotionDetectionAnalysisSize(unittest.TestCase):
+    # Boxes found on the downscaled analysis image must come back in frame coordinates
+
+    FRAME_SHAPE = (720, 1280, 3)
+    # x, y, w, h on a multiple of the 4x analysis scale, so rescaling is exact
+    OBJECT = (400, 200, 200, 160)
+
+    def _detect(self, config, obj=OBJECT):
+        config = dict({"background_model": "median", "dilate_iterations": 0, "draw_bbox": False}, **config)
+        algo = AlgorithmFactory.create("motion_detection", config)
+        try:
+            background = np.zeros(self.FRAME_SHAPE, dtype=np.uint8)
+            for _ in range(3):
+                algo.process(background.copy())
+            frame = background.copy()
+            x, y, w, h = obj
+            cv2.rectangle(frame, (x, y), (x + w - 1, y + h - 1), (255, 255, 255), -1)
+            algo.process(frame)
+            return algo.result.boxes
+        finally:
+            algo.release()
+
+    def test_full_resolution_by_default(self) -> None:
+        boxes = self._detect({})
+        self.assertEqual(boxes.tolist(), [[400, 200, 200, 160, 32000]])
+
+    def test_downscaled_boxes_are_rescaled_to_frame_pixels(self) -> None:
+        boxes = self._detect({"analysis_width": 320, "analysis_height": 180})
+        self.assertEqual(boxes.tolist(), [[400, 200, 200, 160, 32000]])
+
+    def test_min_area_is_in_frame_pixels(self) -> None:
+        # 32000 frame pixels are 2000 analysis pixels; the threshold must compare frame pixels
+        config = {"analysis_width": 320, "analysis_height": 180}
+        self.assertEqual(len(self._detect(dict(config, min_contour_area=32000))), 1)
+        self.assertEqual(len(self._detect(dict(config, min_contour_area=32001))), 0)
+
+    def test_roi_crop_offset_is_rescaled(self) -> None:
+        config = {"analysis_width": 320, "analysis_height": 180, "mask_rect": [320, 160, 640, 400]}
+        boxes = self._detect(config)
+        self.assertEqual(boxes[:, :4].tolist(), [[400, 200, 200, 160]])
+
+
+if __name__ == "__main__":
+    unittest.main()
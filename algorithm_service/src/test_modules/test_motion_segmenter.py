@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+from globals.enums.segment_event import SegmentEvent
+from model.aggregation.motion_segmenter import MotionSegmenter
+from model.data_classes.detection_result import DetectionResult
+
+FRAME_NS = 100_000_000  # 10 analysed frames per second
+
+
+def motion(*zones, area: int = 100) -> DetectionResult:
+    boxes = np.array([[10 * i, 0, 10, 10, area] for i in range(max(1, len(zones)))], dtype=np.int32)
+    return DetectionResult(boxes, zones=list(zones) if zones else None)
+
+
+def quiet() -> DetectionResult:
+    return DetectionResult(np.empty((0, 5), dtype=np.int32))
+
+
+class TestMotionSegmenter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._segmenter = MotionSegmenter("cam1", on_frames=3, off_seconds=0.5, min_seconds=0.2, update_seconds=0)
+        self._sequence = 0
+
+    def _feed(self, result: DetectionResult, frames: int = 1) -> list:
+        events = []
+        for _ in range(frames):
+            self._sequence += 1
+            events += self._segmenter.update(result, self._sequence, self._sequence * FRAME_NS)
+        return events
+
+    def test_disabled_by_default(self) -> None:
+        self.assertIsNone(MotionSegmenter.from_config("cam1", {}))
+        self.assertIsNotNone(MotionSegmenter.from_config("cam1", {"motion_segments": True}))
+
+    def test_starts_after_on_frames(self) -> None:
+        self.assertEqual(self._feed(motion(), 2), [])
+        events = self._feed(motion())
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["event"], SegmentEvent.START.value)
+        self.assertEqual((events[0]["video_id"], events[0]["zone"], events[0]["segment_id"]), ("cam1", None, 1))
+        self.assertEqual(events[0]["duration_ms"], 200.0)
+
+    def test_min_seconds_delays_the_start(self) -> None:
+        segmenter = MotionSegmenter("cam1", on_frames=1, off_seconds=0.5, min_seconds=0.3, update_seconds=0)
+        starts = [bool(segmenter.update(motion(), i, i * FRAME_NS)) for i in range(1, 6)]
+        self.assertEqual(starts, [False, False, False, True, False])
+
+    def test_quiet_frame_resets_the_on_count(self) -> None:
+        self._feed(motion(), 2)
+        self._feed(quiet())
+        self.assertEqual(self._feed(motion(), 2), [])
+        self.assertEqual(len(self._feed(motion())), 1)
+
+    def test_ends_after_off_seconds(self) -> None:
+        self._feed(motion(area=50))
+        self._feed(motion(area=300), 2)
+        # Last motion at frame 3; the end comes once 0.5 s passed without motion
+        self.assertEqual(self._feed(quiet(), 4), [])
+        events = self._feed(quiet())
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["event"], SegmentEvent.END.value)
+        self.assertEqual((events[0]["peak_area"], events[0]["motion_frames"]), (300, 3))
+        self.assertEqual(self._segmenter.stats, {"open": 0, "started": 1, "ended": 1, "discarded": 0})
+
+    def test_short_motion_is_discarded(self) -> None:
+        self._feed(motion(), 2)
+        self.assertEqual(self._feed(quiet(), 10), [])
+        self.assertEqual(self._segmenter.stats["discarded"], 1)
+        # The next segment gets its own ID
+        events = self._feed(motion(), 3)
+        self.assertEqual(events[0]["segment_id"], 2)
+
+    def test_updates_while_segment_lasts(self) -> None:
+        segmenter = MotionSegmenter("cam1", on_frames=1, off_seconds=0.5, min_seconds=0, update_seconds=0.3)
+        events = [segmenter.update(motion(), i, i * FRAME_NS) for i in range(1, 8)]
+        kinds = [[event["event"] for event in frame_events] for frame_events in events]
+        self.assertEqual(kinds, [["start"], [], [], ["update"], [], [], ["update"]])
+
+    def test_zones_get_their_own_segments(self) -> None:
+        events = self._feed(motion("door", None), 3)
+        self.assertEqual(sorted((event["zone"] or "") for event in events), ["", "door"])
+        # Motion moves out of the door zone; the camera segment keeps going
+        self._feed(motion("window"), 4)
+        ended = [event for event in self._feed(motion("window")) if event["event"] == SegmentEvent.END.value]
+        self.assertEqual([event["zone"] for event in ended], ["door"])
+        self.assertEqual(self._segmenter.stats["open"], 2)
+
+    def test_close_ends_started_segments_only(self) -> None:
+        self._feed(motion("door"), 3)
+        self._feed(motion("door", "window"))
+        events = self._segmenter.close()
+        self.assertEqual(sorted(event["zone"] or "" for event in events), ["", "door"])
+        self.assertTrue(all(event["event"] == SegmentEvent.END.value for event in events))
+        self.assertEqual(self._segmenter.stats["open"], 0)
+        self.assertEqual(self._segmenter.close(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from model.algorithms.object_tracker import ObjectTracker
+
+
+def boxes(*rows) -> np.ndarray:
+    return np.array([list(row) + [row[2] * row[3]] for row in rows], dtype=np.int32).reshape(-1, 5)
+
+
+class TestObjectTracker(unittest.TestCase):
+    def test_tracks_are_tentative_until_min_hits(self) -> None:
+        tracker = ObjectTracker(min_hits=3, max_distance=0)
+        self.assertEqual(tracker.update(boxes((0, 0, 20, 20))).tolist(), [0])
+        self.assertEqual(tracker.update(boxes((2, 0, 20, 20))).tolist(), [0])
+        self.assertEqual(tracker.stats["tentative"], 1)
+
+        self.assertEqual(tracker.update(boxes((4, 0, 20, 20))).tolist(), [1])
+        self.assertEqual(tracker.started, [1])
+        # started is reported once only
+        tracker.update(boxes((6, 0, 20, 20)))
+        self.assertEqual(tracker.started, [])
+        self.assertEqual(tracker.stats["confirmed_total"], 1)
+
+    def test_iou_keeps_ids_of_crossing_objects(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_distance=0)
+        first = tracker.update(boxes((0, 0, 20, 20), (100, 0, 20, 20)))
+        # Detections arrive in the other order; IoU matches them back to their tracks
+        second = tracker.update(boxes((102, 0, 20, 20), (2, 0, 20, 20)))
+        self.assertEqual(second.tolist(), first[::-1].tolist())
+
+    def test_greedy_matching_prefers_best_overlap(self) -> None:
+        tracker = ObjectTracker(iou_threshold=0.1, min_hits=1, max_distance=0)
+        tracker.update(boxes((0, 0, 20, 20)))
+        # Both overlap the track; the closer one takes it and the other starts a new track
+        ids = tracker.update(boxes((10, 0, 20, 20), (1, 0, 20, 20)))
+        self.assertEqual(ids.tolist(), [2, 1])
+
+    def test_centroid_distance_matches_fast_objects(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_distance=50)
+        tracker.update(boxes((0, 0, 10, 10)))
+        # No overlap with the previous box, but the centre moved only 40 px
+        self.assertEqual(tracker.update(boxes((40, 0, 10, 10))).tolist(), [1])
+        self.assertEqual(tracker.update(boxes((200, 0, 10, 10))).tolist(), [2])
+
+    def test_prediction_follows_velocity(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_distance=0, velocity_smoothing=1.0)
+        tracker.update(boxes((0, 0, 40, 10)))
+        tracker.update(boxes((8, 0, 40, 10)))
+        # The box at the last position overlaps the old box best, the one a step further the prediction
+        self.assertEqual(tracker.update(boxes((8, 0, 40, 10), (16, 0, 40, 10))).tolist(), [2, 1])
+        self.assertEqual(tracker.tracks[0]["velocity"], [8.0, 0.0])
+
+    def test_velocity_smoothing_weighs_the_newest_step(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_distance=100, velocity_smoothing=0.5)
+        tracker.update(boxes((0, 0, 10, 10)))
+        tracker.update(boxes((8, 0, 10, 10)))
+        self.assertEqual(tracker.tracks[0]["velocity"], [4.0, 0.0])
+        tracker.update(boxes((16, 0, 10, 10)))
+        self.assertEqual(tracker.tracks[0]["velocity"], [6.0, 0.0])
+
+    def test_missed_frames_spread_the_velocity(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_distance=100, max_missed=3, velocity_smoothing=1.0)
+        tracker.update(boxes((0, 0, 10, 10)))
+        tracker.update(boxes())
+        tracker.update(boxes((20, 0, 10, 10)))
+        self.assertEqual(tracker.tracks[0]["velocity"], [10.0, 0.0])
+
+    def test_tracks_end_after_max_missed(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_missed=2)
+        tracker.update(boxes((0, 0, 20, 20)))
+        tracker.update(boxes())
+        tracker.update(boxes())
+        self.assertEqual(tracker.ended, [])
+        tracker.update(boxes())
+        self.assertEqual(tracker.ended, [1])
+        self.assertEqual(tracker.stats, {"active": 0, "tentative": 0, "confirmed_total": 1, "ended_total": 1})
+
+    def test_tentative_tracks_end_silently(self) -> None:
+        tracker = ObjectTracker(min_hits=2, max_missed=0)
+        tracker.update(boxes((0, 0, 20, 20)))
+        tracker.update(boxes())
+        self.assertEqual(tracker.ended, [])
+        self.assertEqual(tracker.stats["ended_total"], 0)
+
+    def test_dropping_tracks_keeps_matches(self) -> None:
+        tracker = ObjectTracker(min_hits=1, max_missed=0, max_distance=0)
+        tracker.update(boxes((0, 0, 20, 20), (100, 0, 20, 20)))
+        # Track 1 is lost in the same update that matches track 2
+        self.assertEqual(tracker.update(boxes((101, 0, 20, 20))).tolist(), [2])
+        self.assertEqual(tracker.ended, [1])
+        self.assertEqual(tracker.update(boxes((102, 0, 20, 20))).tolist(), [2])
+
+    def test_reset_clears_tracks(self) -> None:
+        tracker = ObjectTracker(min_hits=1)
+        tracker.update(boxes((0, 0, 20, 20)))
+        tracker.reset()
+        self.assertEqual(tracker.tracks, [])
+        # IDs keep increasing so a reset never reuses one
+        self.assertEqual(tracker.update(boxes((0, 0, 20, 20))).tolist(), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
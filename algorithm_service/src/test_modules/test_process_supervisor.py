@@ -0,0 +1,56 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+from globals.consts.consts import Consts
+from infrastructure.processes.process_supervisor import ProcessSupervisor
+
+
+def finish_worker(videos_config, stop_event, stats_queue, worker_index) -> None:
+    # Returns at once, like a worker whose cameras all finished
+    return
+
+
+def crash_worker(videos_config, stop_event, stats_queue, worker_index) -> None:
+    os._exit(3)
+
+
+class TestProcessSupervisor(unittest.TestCase):
+    TIMEOUT_SECONDS = 30
+
+    def _wait_for(self, condition) -> bool:
+        deadline = time.monotonic() + self.TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _supervisor(self, target, groups: int = 1) -> ProcessSupervisor:
+        supervisor = ProcessSupervisor("test", target, [[{"video_id": i}] for i in range(groups)])
+        supervisor.start()
+        self.addCleanup(supervisor.stop)
+        return supervisor
+
+    def test_group_videos(self) -> None:
+        videos = [{"video_id": i} for i in range(5)]
+        groups = ProcessSupervisor.group_videos(videos, 2)
+        self.assertEqual([[video["video_id"] for video in group] for group in groups], [[0, 1], [2, 3], [4]])
+
+    def test_clean_exit_is_not_restarted(self) -> None:
+        supervisor = self._supervisor(finish_worker, groups=2)
+        self.assertTrue(self._wait_for(lambda: supervisor.all_finished))
+        time.sleep(Consts.PROCESS_MONITOR_INTERVAL_SECONDS * 2)
+        self.assertEqual([worker.process for worker in supervisor._workers], [None, None])
+        self.assertEqual([worker.restarts for worker in supervisor._workers], [0, 0])
+
+    @mock.patch.object(Consts, "PROCESS_RESTART_BASE_BACKOFF_SECONDS", 0)
+    def test_crash_is_restarted(self) -> None:
+        supervisor = self._supervisor(crash_worker)
+        self.assertTrue(self._wait_for(lambda: supervisor._workers[0].restarts >= 2))
+        self.assertFalse(supervisor.all_finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from model.algorithms.region_extractor import RegionExtractor
+
+
+class TestRegionExtractor(unittest.TestCase):
+    def _mask(self) -> np.ndarray:
+        mask = np.zeros((40, 60), dtype=np.uint8)
+        mask[2:6, 3:8] = 255     # 5x4 = 20 px at (3, 2)
+        mask[20:30, 30:40] = 255  # 10x10 = 100 px at (30, 20)
+        return mask
+
+    def test_extracts_components_as_boxes(self) -> None:
+        boxes = RegionExtractor.extract(self._mask(), min_area=0)
+        self.assertEqual(boxes.dtype, np.int32)
+        self.assertEqual(sorted(boxes.tolist()), [[3, 2, 5, 4, 20], [30, 20, 10, 10, 100]])
+
+    def test_empty_mask_gives_empty_array(self) -> None:
+        boxes = RegionExtractor.extract(np.zeros((10, 10), dtype=np.uint8), min_area=0)
+        self.assertEqual(boxes.shape, (0, RegionExtractor.BOX_COLUMNS))
+
+    def test_min_area_filters_small_components(self) -> None:
+        boxes = RegionExtractor.extract(self._mask(), min_area=21)
+        self.assertEqual(boxes.tolist(), [[30, 20, 10, 10, 100]])
+
+    def test_offset_then_scale_map_to_frame_coordinates(self) -> None:
+        boxes = RegionExtractor.extract(self._mask(), min_area=0, offset=(10, 5), scale=(2.0, 4.0))
+        self.assertEqual(sorted(boxes.tolist()), [[26, 28, 10, 16, 160], [80, 100, 20, 40, 800]])
+
+    def test_min_area_compares_scaled_area(self) -> None:
+        # 20 mask pixels are 160 frame pixels at 2x4 scale
+        self.assertEqual(len(RegionExtractor.extract(self._mask(), min_area=160, scale=(2.0, 4.0))), 2)
+        self.assertEqual(len(RegionExtractor.extract(self._mask(), min_area=161, scale=(2.0, 4.0))), 1)
+
+    def test_preallocated_labels_are_used(self) -> None:
+        labels = np.zeros((40, 60), dtype=np.int32)
+        boxes = RegionExtractor.extract(self._mask(), min_area=0, labels=labels)
+        self.assertEqual(len(boxes), 2)
+        self.assertEqual(len(np.unique(labels)), 3)
+
+    def test_merge_joins_overlapping_boxes(self) -> None:
+        boxes = np.array([[0, 0, 10, 10, 100], [5, 5, 10, 10, 100], [50, 50, 4, 4, 16]], dtype=np.int32)
+        merged = RegionExtractor.merge(boxes)
+        self.assertEqual(sorted(merged.tolist()), [[0, 0, 15, 15, 200], [50, 50, 4, 4, 16]])
+
+    def test_merge_distance_joins_nearby_boxes(self) -> None:
+        boxes = np.array([[0, 0, 10, 10, 100], [15, 0, 10, 10, 100]], dtype=np.int32)
+        self.assertEqual(len(RegionExtractor.merge(boxes, distance=2)), 2)
+        self.assertEqual(RegionExtractor.merge(boxes, distance=3).tolist(), [[0, 0, 25, 10, 200]])
+
+    def test_merge_repeats_until_union_boxes_are_stable(self) -> None:
+        # a and b merge into a box reaching c, which neither of them reached on its own
+        boxes = np.array([[0, 0, 10, 2, 20], [0, 2, 2, 8, 16], [10, 9, 4, 4, 16]], dtype=np.int32)
+        merged = RegionExtractor.merge(boxes)
+        self.assertEqual(merged.tolist(), [[0, 0, 14, 13, 52]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.enums.shm_transport import ShmTransport
+from infrastructure.shared_memory.frame_ring_buffer import FrameRingBuffer, pyramid_slot_capacity
+from model.handlers.shm_reader_handler import ShmReaderHandler
+
+
+class TestShmReaderHandler(unittest.TestCase):
+    SLOT_COUNT = 4
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        ring_path = os.path.join(directory.name, "cam{camera_id}.ring")
+        patcher = mock.patch.object(ConstStrings, "SHARED_MEMORY_RING_PATH", ring_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._writer = FrameRingBuffer.create(ring_path.format(camera_id=1), pyramid_slot_capacity([(4, 6)]),
+                                              self.SLOT_COUNT)
+        self.addCleanup(self._writer.close)
+        self._reader = ShmReaderHandler(1, transport=ShmTransport.RING)
+        self._reader.start()
+        self.addCleanup(self._reader.release)
+
+    def _write(self, value: int) -> None:
+        self._writer.write(np.full((4, 6, 3), value, dtype=np.uint8), frame_id=value)
+
+    def test_reads_frames_published_after_start(self) -> None:
+        self._write(1)
+        frame = self._reader.read_frame()
+        self.assertEqual(int(frame[0, 0, 0]), 1)
+        self.assertFalse(frame.flags.writeable)
+        self.assertEqual(self._reader.last_frame_trace.frame_id, 1)
+
+    def test_frame_stays_current_until_its_slot_is_reused(self) -> None:
+        self._write(1)
+        frame = self._reader.read_frame()
+        for value in range(2, self.SLOT_COUNT + 1):
+            self._write(value)
+        self.assertTrue(self._reader.frame_is_current)
+        self.assertEqual(int(frame[0, 0, 0]), 1)
+
+        self._write(self.SLOT_COUNT + 1)
+        self.assertFalse(self._reader.frame_is_current)
+        # The view now shows the newer frame
+        self.assertEqual(int(frame[0, 0, 0]), self.SLOT_COUNT + 1)
+
+    def test_finished_after_end_of_stream_is_read(self) -> None:
+        self._write(1)
+        self._writer.mark_end_of_stream()
+        self.assertFalse(self._reader.finished)
+        self.assertIsNotNone(self._reader.read_frame())
+        self.assertTrue(self._reader.finished)
+        self.assertIsNone(self._reader.read_frame())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from model.algorithms.zone_map import ZoneMap
+
+
+class TestZoneMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self._zones = ZoneMap.from_config({"zones": [
+            {"name": "left", "polygon": [[0, 0], [49, 0], [49, 59], [0, 59]]},
+            {"name": "centre", "polygon": [[40, 20], [79, 20], [79, 39], [40, 39]]},
+        ]})
+        self._zones.rasterize((100, 60))
+
+    def test_no_zones_configured(self) -> None:
+        self.assertIsNone(ZoneMap.from_config({}))
+        self.assertIsNone(ZoneMap.from_config({"zones": []}))
+
+    def test_assigns_boxes_by_centre(self) -> None:
+        boxes = np.array([
+            [10, 10, 10, 10, 100],  # centre (15, 15) in left
+            [60, 25, 10, 10, 100],  # centre (65, 30) in centre
+            [85, 45, 10, 10, 100],  # centre (90, 50) outside both
+            [30, 5, 40, 10, 400],   # centre (50, 10) just outside left, box overlaps it
+        ], dtype=np.int32)
+        zone_ids, counts = self._zones.assign(boxes)
+        self.assertEqual(zone_ids.tolist(), [0, 1, ZoneMap.NO_ZONE, ZoneMap.NO_ZONE])
+        self.assertEqual(counts.tolist(), [1, 1])
+
+    def test_later_zone_wins_on_overlap(self) -> None:
+        zone_ids, _ = self._zones.assign(np.array([[40, 25, 6, 6, 36]], dtype=np.int32))
+        self.assertEqual(zone_ids.tolist(), [1])
+
+    def test_centres_outside_frame_are_clipped(self) -> None:
+        zone_ids, _ = self._zones.assign(np.array([[-20, -20, 4, 4, 16]], dtype=np.int32))
+        self.assertEqual(zone_ids.tolist(), [0])
+
+    def test_totals_accumulate(self) -> None:
+        boxes = np.array([[10, 10, 10, 10, 100]], dtype=np.int32)
+        self._zones.assign(boxes)
+        self._zones.assign(boxes)
+        self.assertEqual(self._zones.totals, {"left": 2, "centre": 0})
+
+    def test_empty_boxes(self) -> None:
+        zone_ids, counts = self._zones.assign(np.empty((0, 5), dtype=np.int32))
+        self.assertEqual(len(zone_ids), 0)
+        self.assertEqual(counts.tolist(), [0, 0])
+
+    def test_rasterize_follows_frame_size(self) -> None:
+        box = np.array([[18, 98, 4, 4, 16]], dtype=np.int32)  # centre (20, 100)
+        # Below a 100x60 frame the centre is clipped to its bottom row, inside "left"
+        self.assertEqual(self._zones.assign(box)[0].tolist(), [0])
+        self._zones.rasterize((200, 120))
+        self.assertEqual(self._zones.assign(box)[0].tolist(), [ZoneMap.NO_ZONE])
+
+    def test_unnamed_zones_get_default_names(self) -> None:
+        zones = ZoneMap.from_config({"zones": [{"polygon": [[0, 0], [9, 0], [0, 9]]}]})
+        self.assertEqual(zones.names, ["zone_0"])
+
+    def test_polygon_needs_three_points(self) -> None:
+        with self.assertRaises(ValueError):
+            ZoneMap.from_config({"zones": [{"name": "line", "polygon": [[0, 0], [10, 10]]}]})
+
+    def test_zone_count_is_limited(self) -> None:
+        zones = [{"polygon": [[0, 0], [9, 0], [0, 9]]}] * 256
+        with self.assertRaises(ValueError):
+            ZoneMap.from_config({"zones": zones})
+
+
+if __name__ == "__main__":
+    unittest.main()
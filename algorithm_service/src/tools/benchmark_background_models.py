@@ -0,0 +1,98 @@
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.enums.background_model_type import BackgroundModelType
+from infrastructure.factories.algorithm_factory import AlgorithmFactory
+
+
+# Runs MotionDetectionAlgorithm with each background model over the same video and reports per-frame
+# cost and how well its detections agree with the first (reference) model.
+# Run from the src directory: python -m tools.benchmark_background_models <video> [--models mog2 median ...]
+
+def load_frames(source: str, max_frames: int) -> List[np.ndarray]:
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise ValueError(f"Cannot open video source: {source}")
+    frames = []
+    try:
+        while max_frames <= 0 or len(frames) < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+    finally:
+        cap.release()
+    if not frames:
+        raise ValueError(f"No frames read from video source: {source}")
+    return frames
+
+
+def box_iou(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    # Pairwise IoU of two (x, y, w, h, ...) box arrays
+    x1 = np.maximum(first[:, None, 0], second[None, :, 0])
+    y1 = np.maximum(first[:, None, 1], second[None, :, 1])
+    x2 = np.minimum(first[:, None, 0] + first[:, None, 2], second[None, :, 0] + second[None, :, 2])
+    y2 = np.minimum(first[:, None, 1] + first[:, None, 3], second[None, :, 1] + second[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    union = (first[:, None, 2] * first[:, None, 3] + second[None, :, 2] * second[None, :, 3]) - intersection
+    return intersection / np.maximum(union, 1)
+
+
+def run_model(model: str, frames: Sequence[np.ndarray], config: Dict[str, Any]) -> Dict[str, Any]:
+    algo = AlgorithmFactory.create("motion_detection", dict(config, background_model=model, draw_bbox=False))
+    detections = []
+    started = time.perf_counter()
+    for frame in frames:
+        algo.process(frame)
+        detections.append(algo.detections.copy())
+    elapsed = time.perf_counter() - started
+    algo.release()
+    return {"ms_per_frame": elapsed * 1000 / len(frames), "detections": detections}
+
+
+def agreement(reference: List[np.ndarray], candidate: List[np.ndarray], iou_threshold: float) -> Dict[str, float]:
+    # Frame agreement: both or neither see motion. Box recall: reference boxes matched by a candidate box.
+    same_frames = sum((len(ref) > 0) == (len(cand) > 0) for ref, cand in zip(reference, candidate))
+    matched = total = 0
+    for ref, cand in zip(reference, candidate):
+        total += len(ref)
+        if len(ref) and len(cand):
+            matched += int((box_iou(ref, cand).max(axis=1) >= iou_threshold).sum())
+    return {"frame_agreement": same_frames / len(reference), "box_recall": matched / total if total else 1.0}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare background models on per-frame cost and detection agreement")
+    parser.add_argument("source", help="video file to replay")
+    parser.add_argument("--models", nargs="+", default=[model.value for model in BackgroundModelType],
+                        help="models to compare; the first one is the reference")
+    parser.add_argument("--max-frames", type=int, default=0, help="stop after this many frames (0 = whole video)")
+    parser.add_argument("--min-area", type=int, default=500, help="min_contour_area in frame pixels")
+    parser.add_argument("--analysis-width", type=int, default=Consts.MOTION_ANALYSIS_WIDTH,
+                        help="analysis width (0 = model full frames)")
+    parser.add_argument("--analysis-height", type=int, default=Consts.MOTION_ANALYSIS_HEIGHT,
+                        help="analysis height (0 = model full frames)")
+    parser.add_argument("--iou", type=float, default=0.3, help="IoU for a box to count as matching the reference")
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.max_frames)
+    config = {"min_contour_area": args.min_area, "analysis_width": args.analysis_width,
+              "analysis_height": args.analysis_height}
+    results = {model: run_model(model, frames, config) for model in args.models}
+    reference = results[args.models[0]]
+
+    print(f"{len(frames)} frames of {frames[0].shape[1]}x{frames[0].shape[0]}, reference model: {args.models[0]}")
+    print(f"{'model':<16}{'ms/frame':>10}{'vs ref':>8}{'frames agree':>14}{'box recall':>12}")
+    for model, result in results.items():
+        score = agreement(reference["detections"], result["detections"], args.iou)
+        print(f"{model:<16}{result['ms_per_frame']:>10.2f}{result['ms_per_frame'] / reference['ms_per_frame']:>7.2f}x"
+              f"{score['frame_agreement']:>14.1%}{score['box_recall']:>12.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -60,6 +60,11 @@ class ConstStrings:
     # Shared memory paths and GStreamer pipeline template
     SHARED_MEMORY_CAM_PATH = "/dev/shm/cam{camera_id}"
     SHARED_MEMORY_PATH = "/dev/shm/"
+    SHARED_MEMORY_RING_PATH = "/dev/shm/cam{camera_id}.ring"
+    # ZMQ IPC endpoint on which a ring's writer wakes its readers
+    SHARED_MEMORY_RING_SIGNAL_ENDPOINT = "ipc://{ring_path}.signal"
+    # Video sources of the form replay://<path> replay a recorded FrameClip file
+    REPLAY_SOURCE_PREFIX = "replay://"
     SHARED_MEMORY_PIPELINE = (
         "appsrc is-live=true do-timestamp=true ! "
         "video/x-raw,format=BGR,width={frame_width},height={frame_height},framerate={frame_rate}/1 ! "
@@ -91,3 +96,12 @@ class ConstStrings:
         "shmsink socket-path={shared_memory_path} sync=false wait-for-connection=false "
         "shm-size={shm_size}"
     )
+
+    # Execution mode environment variables
+    EXECUTION_MODE_ENV = "EXECUTION_MODE"
+    CAMERAS_PER_PROCESS_ENV = "CAMERAS_PER_PROCESS"
+
+    # Worker process stats message keys
+    WORKER_INDEX_KEY = "worker_index"
+    WORKER_PID_KEY = "pid"
+    WORKER_CAMERAS_KEY = "cameras"
@@ -10,3 +10,64 @@ class Consts:
     # GStreamer pipeline configuration for RTSP
     GSTREAMER_QUEUE_MAX_BUFFERS = 2
     GSTREAMER_SHM_SIZE = 50000000  # 50MB
+
+    # Shared memory transport ("ring" or "gstreamer"), overridable per video via "transport"
+    SHM_TRANSPORT = "ring"
+    # Native frame ring buffer layout (must match between video manager and algorithm service)
+    SHM_RING_MAGIC = 0x474E5246  # "FRNG"
+    # Readers reject rings of any other version, so the video manager and the algorithm service must be
+    # deployed together whenever it changes. Version 3: frame tracing fields in the slot header, and the
+    # ring header's end-of-stream flags word (former padding)
+    SHM_RING_VERSION = 3
+    SHM_RING_ALIGNMENT = 64
+    SHM_RING_SLOT_COUNT = 8
+    SHM_RING_MAX_LEVELS = 4
+    # Wake ring readers over a ZMQ IPC socket next to the ring instead of having them sleep-poll it;
+    # readers still re-check the ring this often in case a wakeup was missed
+    SHM_RING_SIGNAL = True
+    SHM_RING_SIGNAL_RECHECK_SECONDS = 0.1
+    # Pyramid levels published per frame as scales of the full frame. Every extra level is a resize per
+    # frame, so only the full frame is published unless a video opts in via "pyramid_scales", e.g. [1.0, 0.5]
+    PYRAMID_SCALES = (1.0,)
+
+    # Capture mode ("threaded" or "inline"), overridable per video via "capture_mode"
+    CAPTURE_MODE = "threaded"
+    CAPTURE_READ_TIMEOUT_SECONDS = 1.0
+    CAPTURE_JOIN_TIMEOUT_SECONDS = 2.0
+
+    # Execution mode ("thread" or "process") and camera grouping for process mode
+    EXECUTION_MODE = "thread"
+    CAMERAS_PER_PROCESS = 1
+    PROCESS_START_METHOD = "spawn"
+    PROCESS_MONITOR_INTERVAL_SECONDS = 0.5
+    PROCESS_STATS_INTERVAL_SECONDS = 5
+    PROCESS_JOIN_TIMEOUT_SECONDS = 5
+    PROCESS_STABLE_SECONDS = 60
+    PROCESS_MAX_RESTARTS = 10
+    PROCESS_RESTART_BASE_BACKOFF_SECONDS = 1
+    PROCESS_RESTART_MAX_BACKOFF_SECONDS = 30
+
+    # File source pacing: playback speed (<= 0 is unthrottled) and catch-up policy ("drop", "duplicate", "burst")
+    PACER_PLAYBACK_SPEED = 1.0
+    PACER_CATCH_UP_POLICY = "drop"
+    PACER_MAX_CATCH_UP_FRAMES = 30
+    PACER_LATE_TOLERANCE_SECONDS = 0.005
+    PACER_MAX_NATIVE_FPS = 240
+
+    # RTSP connection: per-attempt timeouts and background reconnect backoff
+    RTSP_OPEN_TIMEOUT_MS = 5000
+    RTSP_READ_TIMEOUT_MS = 5000
+    RTSP_RECONNECT_BASE_SECONDS = 0.5
+    RTSP_RECONNECT_MAX_SECONDS = 30
+    RTSP_RECONNECT_JITTER = 0.2
+    RTSP_STABLE_SECONDS = 10
+
+    # Recorded-clip replay: clip file layout, and whether replay restarts at the end (per video via "loop")
+    CLIP_MAGIC = 0x50494C43  # "CLIP"
+    CLIP_VERSION = 1
+    CLIP_ALIGNMENT = 4096
+    REPLAY_LOOP = False
+
+    # Per-camera idle backoff between reads that returned no frame
+    CAMERA_IDLE_BASE_SECONDS = 0.01
+    CAMERA_IDLE_MAX_SECONDS = 0.25
@@ -16,4 +16,14 @@ class LoggerMessages:
     VIDEO_MANAGER_STOPPED = "Video manager stopped"
     SHM_FILE_REMOVED = "Removed: {}"
     SHM_FILE_REMOVAL_FAILED = "Could not remove {}: {}"
- 
\ No newline at end of file
+    SHM_RING_WRITER_READY = "Shared memory ring writer ready: {} ({} slots, levels {})"
+    CAPTURE_SOURCE_ENDED = "Capture source for video {} ended"
+    WORKER_PROCESS_STARTED = "{} worker {} started (pid {}) for videos {}"
+    WORKER_PROCESS_DIED = "{} worker {} exited with code {}, restarting in {}s"
+    WORKER_PROCESS_FINISHED = "{} worker {} finished"
+    WORKER_PROCESS_GAVE_UP = "{} worker {} restarted {} times, giving up"
+    WORKER_PROCESS_STATS = "{} worker {} (pid {}): {}"
+    PACER_READY = "Video {}: pacing at {} fps x{} (catch-up policy: {})"
+    VIDEO_STATS = "Video stats: {}"
+    RTSP_RECONNECT_SCHEDULED = "Video {}: RTSP reconnect in {}s (attempt {})"
+    CAMERA_STATE_CHANGED = "Video {}: state {} -> {}"
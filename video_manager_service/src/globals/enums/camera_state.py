@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CameraState(str, Enum):
+    ACTIVE = "active"
+    STALLED = "stalled"
+    RECONNECTING = "reconnecting"
+    FINISHED = "finished"
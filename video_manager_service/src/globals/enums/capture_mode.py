@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CaptureMode(str, Enum):
+    INLINE = "inline"
+    THREADED = "threaded"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CatchUpPolicy(str, Enum):
+    DROP = "drop"
+    DUPLICATE = "duplicate"
+    BURST = "burst"
@@ -0,0 +1,7 @@
+from enum import IntEnum
+
+
+class PixelFormat(IntEnum):
+    BGR = 1
+    GRAY = 2
+    I420 = 3
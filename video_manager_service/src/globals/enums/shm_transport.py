@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ShmTransport(str, Enum):
+    GSTREAMER = "gstreamer"
+    RING = "ring"
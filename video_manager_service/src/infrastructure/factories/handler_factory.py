@@ -1,8 +1,22 @@
+from typing import Sequence
+
+from globals.consts.consts import Consts
+from globals.enums.capture_mode import CaptureMode
+from globals.enums.catch_up_policy import CatchUpPolicy
+from globals.enums.shm_transport import ShmTransport
 from infrastructure.interfaces.handlers.ivideo_stream_handler import IVideoStreamHandler
 from model.handlers.video_stream_handler import VideoStreamHandler
 
 
 class HandlerFactory:
     @staticmethod
-    def create_video_stream_handler(video_id: int, video_path: str) -> IVideoStreamHandler:
-        return VideoStreamHandler(video_id, video_path)
\ No newline at end of file
+    def create_video_stream_handler(video_id: int, video_path: str,
+                                    transport: str = Consts.SHM_TRANSPORT,
+                                    capture_mode: str = Consts.CAPTURE_MODE,
+                                    playback_speed: float = Consts.PACER_PLAYBACK_SPEED,
+                                    catch_up_policy: str = Consts.PACER_CATCH_UP_POLICY,
+                                    pyramid_scales: Sequence[float] = Consts.PYRAMID_SCALES,
+                                    loop: bool = Consts.REPLAY_LOOP) -> IVideoStreamHandler:
+        return VideoStreamHandler(video_id, video_path, ShmTransport(transport), CaptureMode(capture_mode),
+                                  float(playback_speed), CatchUpPolicy(catch_up_policy),
+                                  [float(scale) for scale in pyramid_scales], bool(loop))
\ No newline at end of file
@@ -1,3 +1,8 @@
+import os
+
+from globals.consts.consts import Consts
+from globals.consts.const_strings import ConstStrings
+from globals.enums.execution_mode import ExecutionMode
 from infrastructure.interfaces.managers.ivideo_manager import IVideoManager
 from model.managers.video_manager import VideoManager
 
@@ -5,7 +10,9 @@ from model.managers.video_manager import VideoManager
 class ManagerFactory:
     @staticmethod
     def create_video_manager(videos_config: list) -> IVideoManager:
-        return VideoManager(videos_config)
+        execution_mode = ExecutionMode(os.getenv(ConstStrings.EXECUTION_MODE_ENV, Consts.EXECUTION_MODE))
+        cameras_per_process = int(os.getenv(ConstStrings.CAMERAS_PER_PROCESS_ENV, Consts.CAMERAS_PER_PROCESS))
+        return VideoManager(videos_config, execution_mode, cameras_per_process)
     
     @staticmethod
     def create_all() -> None:
@@ -0,0 +1,153 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from queue import Empty
+from typing import Any, Callable, Dict, List
+
+from globals.consts.consts import Consts
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+from infrastructure.factories.logger_factory import LoggerFactory
+from model.data_classes.worker_process_state import WorkerProcessState
+
+
+class ProcessSupervisor:
+    # Runs target(videos_config, stop_event, stats_queue, worker_index) in one process per camera group,
+    # restarts workers that die (with exponential backoff) and collects the stats they report. A worker
+    # that exits with code 0 is done (e.g. all its cameras finished) and is not restarted.
+
+    def __init__(self, name: str, target: Callable, video_groups: List[List[Dict]]) -> None:
+        self._name = name
+        self._target = target
+        self._context = multiprocessing.get_context(Consts.PROCESS_START_METHOD)
+        self._stats_queue = self._context.Queue()
+        self._workers = [WorkerProcessState(index=i, videos_config=group) for i, group in enumerate(video_groups)]
+        self._lock = threading.Lock()
+        self._running = False
+        self._monitor_thread = None
+        self._logger = LoggerFactory.get_logger_manager()
+
+    @staticmethod
+    def group_videos(videos_config: List[Dict], cameras_per_process: int) -> List[List[Dict]]:
+        size = max(1, int(cameras_per_process))
+        return [videos_config[i:i + size] for i in range(0, len(videos_config), size)]
+
+    @staticmethod
+    def report_stats(stats_queue: Any, worker_index: int, cameras: Dict[Any, Dict[str, Any]]) -> None:
+        # Called from inside a worker process
+        stats_queue.put({
+            ConstStrings.WORKER_INDEX_KEY: worker_index,
+            ConstStrings.WORKER_PID_KEY: os.getpid(),
+            ConstStrings.WORKER_CAMERAS_KEY: cameras,
+        })
+
+    def start(self) -> None:
+        self._running = True
+        for worker in self._workers:
+            self._spawn(worker)
+        self._monitor_thread = threading.Thread(target=self._monitor, daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        for worker in self._workers:
+            if worker.stop_event is not None:
+                worker.stop_event.set()
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout=Consts.PROCESS_JOIN_TIMEOUT_SECONDS)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout=Consts.PROCESS_JOIN_TIMEOUT_SECONDS)
+        if self._monitor_thread:
+            self._monitor_thread.join(timeout=Consts.PROCESS_JOIN_TIMEOUT_SECONDS)
+
+    @property
+    def all_finished(self) -> bool:
+        return all(worker.finished for worker in self._workers)
+
+    def get_stats(self) -> Dict[int, Dict[str, Any]]:
+        with self._lock:
+            return {worker.index: dict(worker.stats) for worker in self._workers}
+
+    def log_stats(self) -> None:
+        for index, stats in self.get_stats().items():
+            if stats:
+                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                                 LoggerMessages.WORKER_PROCESS_STATS.format(
+                                     self._name, index, stats.get(ConstStrings.WORKER_PID_KEY),
+                                     stats.get(ConstStrings.WORKER_CAMERAS_KEY)))
+
+    def _spawn(self, worker: WorkerProcessState) -> None:
+        worker.stop_event = self._context.Event()
+        worker.process = self._context.Process(
+            target=self._target,
+            args=(worker.videos_config, worker.stop_event, self._stats_queue, worker.index),
+            name=f"{self._name}-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                         LoggerMessages.WORKER_PROCESS_STARTED.format(
+                             self._name, worker.index, worker.process.pid,
+                             [video.get("video_id") for video in worker.videos_config]))
+
+    def _monitor(self) -> None:
+        while self._running:
+            self._drain_stats()
+            now = time.monotonic()
+            for worker in self._workers:
+                if not self._running:
+                    break
+                if worker.finished:
+                    continue
+                if worker.process is not None and worker.process.is_alive():
+                    # A worker that stayed up long enough earns a clean restart budget
+                    if worker.restarts and now - worker.started_at > Consts.PROCESS_STABLE_SECONDS:
+                        worker.restarts = 0
+                    continue
+                self._handle_dead_worker(worker, now)
+
+    def _handle_dead_worker(self, worker: WorkerProcessState, now: float) -> None:
+        if worker.process is not None:
+            exit_code = worker.process.exitcode
+            worker.process = None
+            if exit_code == 0:
+                worker.finished = True
+                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                                 LoggerMessages.WORKER_PROCESS_FINISHED.format(self._name, worker.index))
+                return
+            if worker.restarts >= Consts.PROCESS_MAX_RESTARTS:
+                self._logger.log(ConstStrings.LOG_NAME_ERROR,
+                                 LoggerMessages.WORKER_PROCESS_GAVE_UP.format(self._name, worker.index, worker.restarts),
+                                 level=logging.ERROR)
+                worker.next_start_at = float("inf")
+                return
+            backoff = min(Consts.PROCESS_RESTART_MAX_BACKOFF_SECONDS,
+                          Consts.PROCESS_RESTART_BASE_BACKOFF_SECONDS * (2 ** worker.restarts))
+            worker.next_start_at = now + backoff
+            self._logger.log(ConstStrings.LOG_NAME_ERROR,
+                             LoggerMessages.WORKER_PROCESS_DIED.format(self._name, worker.index, exit_code, backoff),
+                             level=logging.ERROR)
+        if now >= worker.next_start_at:
+            worker.restarts += 1
+            self._spawn(worker)
+
+    def _drain_stats(self) -> None:
+        try:
+            message = self._stats_queue.get(timeout=Consts.PROCESS_MONITOR_INTERVAL_SECONDS)
+        except Empty:
+            return
+        while True:
+            worker_index = message.get(ConstStrings.WORKER_INDEX_KEY)
+            with self._lock:
+                if worker_index is not None and 0 <= worker_index < len(self._workers):
+                    self._workers[worker_index].stats = message
+            try:
+                message = self._stats_queue.get_nowait()
+            except Empty:
+                return
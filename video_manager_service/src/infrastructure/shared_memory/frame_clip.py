@@ -0,0 +1,155 @@
+import mmap
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from globals.consts.consts import Consts
+
+
+# Layout: [clip header | frame 0 | frame 1 | ... | timestamp table]
+# Frames are raw BGR, each padded to Consts.CLIP_ALIGNMENT bytes so every frame starts on a page.
+# The timestamp table holds one int64 per frame: nanoseconds since the first frame.
+CLIP_HEADER_DTYPE = np.dtype({
+    "names": ["magic", "version", "frame_count", "height", "width", "channels",
+              "frame_stride", "data_offset", "timestamps_offset"],
+    "formats": ["<u4", "<u4", "<u8", "<u4", "<u4", "<u4", "<u8", "<u8", "<u8"],
+    "offsets": [0, 4, 8, 16, 20, 24, 32, 40, 48],
+    "itemsize": 64,
+})
+
+
+def _align(size: int) -> int:
+    alignment = Consts.CLIP_ALIGNMENT
+    return (size + alignment - 1) // alignment * alignment
+
+
+class FrameClip:
+    # Read-only, memory-mapped view of a recorded clip. Every camera replaying the same file maps
+    # the same page cache pages, so N cameras cost no more RAM than one.
+
+    def __init__(self, path: str, mm: mmap.mmap) -> None:
+        self._path = path
+        self._mmap = mm
+        header = np.ndarray((), dtype=CLIP_HEADER_DTYPE, buffer=mm, offset=0)
+        self._frame_count = int(header["frame_count"])
+        self._height = int(header["height"])
+        self._width = int(header["width"])
+        self._channels = int(header["channels"])
+        self._frame_stride = int(header["frame_stride"])
+        self._data_offset = int(header["data_offset"])
+        self._timestamps_ns = np.ndarray((self._frame_count,), dtype="<i8", buffer=mm,
+                                         offset=int(header["timestamps_offset"]))
+
+    @classmethod
+    def open(cls, path: str) -> "FrameClip":
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size < CLIP_HEADER_DTYPE.itemsize:
+                raise ValueError(f"Not a frame clip: {path}")
+            mm = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+
+        header = np.ndarray((), dtype=CLIP_HEADER_DTYPE, buffer=mm, offset=0)
+        if int(header["magic"]) != Consts.CLIP_MAGIC or int(header["version"]) != Consts.CLIP_VERSION:
+            mm.close()
+            raise ValueError(f"Not a frame clip (or unsupported version): {path}")
+        if int(header["frame_count"]) == 0:
+            mm.close()
+            raise ValueError(f"Frame clip has no frames: {path}")
+        return cls(path, mm)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def duration_seconds(self) -> float:
+        # Span of one pass, including the last frame's display time, so looped playback stays evenly spaced
+        return (int(self._timestamps_ns[-1]) / 1e9) + 1.0 / self.fps
+
+    @property
+    def fps(self) -> float:
+        if self._frame_count < 2 or self._timestamps_ns[-1] <= 0:
+            return float(Consts.ALGO_FRAME_RATE)
+        return (self._frame_count - 1) / (int(self._timestamps_ns[-1]) / 1e9)
+
+    def frame(self, index: int) -> np.ndarray:
+        # Zero-copy, read-only view of one frame
+        shape = (self._height, self._width, self._channels) if self._channels > 1 else (self._height, self._width)
+        offset = self._data_offset + index * self._frame_stride
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._mmap, offset=offset)
+
+    def timestamp_seconds(self, index: int) -> float:
+        return int(self._timestamps_ns[index]) / 1e9
+
+    def close(self) -> None:
+        self._timestamps_ns = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out to callers still reference the mapping; let GC unmap it
+            pass
+
+
+class FrameClipWriter:
+    # Streams frames of one fixed size to disk; the header is written last by close(), and the file
+    # only appears under its final name once complete.
+
+    def __init__(self, path: str, height: int, width: int, channels: int = 3) -> None:
+        self._path = path
+        self._tmp_path = f"{path}.tmp"
+        self._height = height
+        self._width = width
+        self._channels = channels
+        self._frame_bytes = height * width * channels
+        self._frame_stride = _align(self._frame_bytes)
+        self._data_offset = _align(CLIP_HEADER_DTYPE.itemsize)
+        self._padding = bytes(self._frame_stride - self._frame_bytes)
+        self._timestamps_ns: List[int] = []
+        self._first_timestamp_ns: Optional[int] = None
+        self._file = open(self._tmp_path, "wb")
+        self._file.seek(self._data_offset)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._timestamps_ns)
+
+    def write(self, frame: np.ndarray, timestamp_ns: int) -> None:
+        if frame.shape[:2] != (self._height, self._width) or frame.size != self._frame_bytes:
+            raise ValueError(f"Frame of shape {frame.shape} does not match clip size "
+                             f"{self._width}x{self._height}x{self._channels}")
+        if self._first_timestamp_ns is None:
+            self._first_timestamp_ns = timestamp_ns
+        self._timestamps_ns.append(timestamp_ns - self._first_timestamp_ns)
+        self._file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        self._file.write(self._padding)
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        timestamps_offset = self._data_offset + self.frame_count * self._frame_stride
+        self._file.seek(timestamps_offset)
+        self._file.write(np.asarray(self._timestamps_ns, dtype="<i8").tobytes())
+
+        header = np.zeros((), dtype=CLIP_HEADER_DTYPE)
+        header["magic"] = Consts.CLIP_MAGIC
+        header["version"] = Consts.CLIP_VERSION
+        header["frame_count"] = self.frame_count
+        header["height"] = self._height
+        header["width"] = self._width
+        header["channels"] = self._channels
+        header["frame_stride"] = self._frame_stride
+        header["data_offset"] = self._data_offset
+        header["timestamps_offset"] = timestamps_offset
+        self._file.seek(0)
+        self._file.write(header.tobytes())
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self._path)
@@ -0,0 +1,285 @@
+import mmap
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.consts.const_strings import ConstStrings
+from globals.enums.pixel_format import PixelFormat
+from model.data_classes.frame_header import FrameHeader
+from infrastructure.shared_memory.frame_ring_signal import FrameRingSignal
+
+
+# Layout: [ring header | slot 0 header | slot 0 payload | slot 1 header | ...]
+# A slot payload holds every pyramid level of one frame back to back (level 0 first).
+# Every block is padded to Consts.SHM_RING_ALIGNMENT bytes.
+RING_HEADER_DTYPE = np.dtype({
+    "names": ["magic", "version", "slot_count", "slot_capacity", "slot_stride", "latest_seq", "flags"],
+    "formats": ["<u4", "<u4", "<u4", "<u8", "<u8", "<u8", "<u4"],
+    "offsets": [0, 4, 8, 16, 24, 32, 40],
+    "itemsize": Consts.SHM_RING_ALIGNMENT,
+})
+# Ring header flags
+RING_FLAG_END_OF_STREAM = 1
+
+SLOT_HEADER_DTYPE = np.dtype({
+    "names": ["seq", "timestamp_ns", "channels", "pixel_format", "nbytes", "level_count",
+              "heights", "widths", "offsets", "frame_id", "publish_ns"],
+    "formats": ["<u8", "<i8", "<u4", "<u4", "<u8", "<u4",
+                ("<u4", Consts.SHM_RING_MAX_LEVELS), ("<u4", Consts.SHM_RING_MAX_LEVELS),
+                ("<u8", Consts.SHM_RING_MAX_LEVELS), "<u8", "<i8"],
+    "offsets": [0, 8, 16, 20, 24, 32, 36, 36 + 4 * Consts.SHM_RING_MAX_LEVELS, 40 + 8 * Consts.SHM_RING_MAX_LEVELS,
+                40 + 16 * Consts.SHM_RING_MAX_LEVELS, 48 + 16 * Consts.SHM_RING_MAX_LEVELS],
+    "itemsize": 2 * Consts.SHM_RING_ALIGNMENT,
+})
+
+
+def _align(size: int) -> int:
+    alignment = Consts.SHM_RING_ALIGNMENT
+    return (size + alignment - 1) // alignment * alignment
+
+
+def pyramid_slot_capacity(shapes: Sequence[Tuple[int, int]], channels: int = 3) -> int:
+    # Payload bytes one slot needs to hold every level in shapes, as laid out by next_frame_buffers
+    return sum(_align(height * width * channels) for height, width in shapes)
+
+
+class FrameRingBuffer:
+    # Single writer, many readers. The writer zeroes a slot's seq while refilling it and
+    # bumps latest_seq only after the slot is complete, so readers can detect being lapped.
+    # Every commit is also announced on a FrameRingSignal, which readers block on in wait(), and a
+    # writer whose source ended sets the end-of-stream flag so readers can tell "done" from "stalled".
+
+    def __init__(self, path: str, mm: mmap.mmap, writable: bool) -> None:
+        self._path = path
+        self._mmap = mm
+        self._writable = writable
+        self._inode = os.stat(path).st_ino
+        self._header = np.ndarray((), dtype=RING_HEADER_DTYPE, buffer=mm, offset=0)
+        self._slot_count = int(self._header["slot_count"])
+        self._slot_capacity = int(self._header["slot_capacity"])
+        self._slot_stride = int(self._header["slot_stride"])
+        self._slot_headers = [
+            np.ndarray((), dtype=SLOT_HEADER_DTYPE, buffer=mm, offset=self._slot_offset(i))
+            for i in range(self._slot_count)
+        ]
+        self._pending_seq = 0
+        self._signal: Optional[FrameRingSignal] = None
+        if Consts.SHM_RING_SIGNAL:
+            endpoint = ConstStrings.SHARED_MEMORY_RING_SIGNAL_ENDPOINT.format(ring_path=path)
+            self._signal = FrameRingSignal.publisher(endpoint) if writable else FrameRingSignal.subscriber(endpoint)
+
+    @classmethod
+    def create(cls, path: str, slot_capacity: int, slot_count: int = Consts.SHM_RING_SLOT_COUNT) -> "FrameRingBuffer":
+        slot_stride = _align(SLOT_HEADER_DTYPE.itemsize) + _align(slot_capacity)
+        total_size = _align(RING_HEADER_DTYPE.itemsize) + slot_stride * slot_count
+
+        # Build the file under a temporary name so readers never attach to a half-initialized ring
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_CREAT | os.O_TRUNC | os.O_RDWR, 0o666)
+        try:
+            os.ftruncate(fd, total_size)
+            mm = mmap.mmap(fd, total_size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+
+        header = np.ndarray((), dtype=RING_HEADER_DTYPE, buffer=mm, offset=0)
+        header["version"] = Consts.SHM_RING_VERSION
+        header["slot_count"] = slot_count
+        header["slot_capacity"] = slot_capacity
+        header["slot_stride"] = slot_stride
+        header["latest_seq"] = 0
+        header["flags"] = 0
+        header["magic"] = Consts.SHM_RING_MAGIC
+        os.replace(tmp_path, path)
+        return cls(path, mm, writable=True)
+
+    @classmethod
+    def attach(cls, path: str) -> "FrameRingBuffer":
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            mm = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+
+        header = np.ndarray((), dtype=RING_HEADER_DTYPE, buffer=mm, offset=0)
+        if int(header["magic"]) != Consts.SHM_RING_MAGIC or int(header["version"]) != Consts.SHM_RING_VERSION:
+            mm.close()
+            raise ValueError(f"Not a frame ring buffer (or unsupported version): {path}")
+        return cls(path, mm, writable=False)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def latest_seq(self) -> int:
+        return int(self._header["latest_seq"])
+
+    @property
+    def end_of_stream(self) -> bool:
+        # Set once the writer's source ended; frames published before it can still be read
+        return bool(int(self._header["flags"]) & RING_FLAG_END_OF_STREAM)
+
+    # ===== Writer =====
+
+    def next_frame_buffer(self, height: int, width: int, channels: int = 3,
+                          pixel_format: PixelFormat = PixelFormat.BGR) -> np.ndarray:
+        # Claim the next slot and return a writable view for the caller to fill in place.
+        return self.next_frame_buffers([(height, width)], channels, pixel_format)[0]
+
+    def next_frame_buffers(self, shapes: Sequence[Tuple[int, int]], channels: int = 3,
+                           pixel_format: PixelFormat = PixelFormat.BGR) -> List[np.ndarray]:
+        # Claim the next slot and return one writable view per pyramid level; all levels are
+        # published together by the next commit, under the same sequence number.
+        if not self._writable:
+            raise PermissionError(f"Frame ring buffer is attached read-only: {self._path}")
+        if not 0 < len(shapes) <= Consts.SHM_RING_MAX_LEVELS:
+            raise ValueError(f"Ring slots hold 1 to {Consts.SHM_RING_MAX_LEVELS} levels, got {len(shapes)}")
+        nbytes = pyramid_slot_capacity(shapes, channels)
+        if nbytes > self._slot_capacity:
+            raise ValueError(f"Frame of {nbytes} bytes exceeds ring slot capacity {self._slot_capacity}")
+
+        seq = self.latest_seq + 1
+        slot_index = seq % self._slot_count
+        slot_header = self._slot_headers[slot_index]
+        slot_header["seq"] = 0
+        slot_header["channels"] = channels
+        slot_header["pixel_format"] = int(pixel_format)
+        slot_header["nbytes"] = nbytes
+        slot_header["level_count"] = len(shapes)
+
+        views = []
+        offset = 0
+        for level, (height, width) in enumerate(shapes):
+            slot_header["heights"][level] = height
+            slot_header["widths"][level] = width
+            slot_header["offsets"][level] = offset
+            views.append(self._payload_view(slot_index, offset, height, width, channels))
+            offset += _align(height * width * channels)
+        self._pending_seq = seq
+        return views
+
+    def commit(self, timestamp_ns: Optional[int] = None, frame_id: int = 0) -> int:
+        # Publish the slot returned by the last next_frame_buffer call. timestamp_ns is the capture
+        # time and frame_id the capture sequence; both travel with the frame for latency tracing.
+        seq = self._pending_seq
+        if seq == 0:
+            raise RuntimeError("commit() called without a pending frame buffer")
+        slot_header = self._slot_headers[seq % self._slot_count]
+        publish_ns = time.time_ns()
+        slot_header["timestamp_ns"] = publish_ns if timestamp_ns is None else timestamp_ns
+        slot_header["frame_id"] = frame_id
+        slot_header["publish_ns"] = publish_ns
+        slot_header["seq"] = seq
+        self._header["latest_seq"] = seq
+        self._pending_seq = 0
+        if self._header["flags"]:
+            # The source resumed (e.g. a file restarted)
+            self._header["flags"] = 0
+        self._notify()
+        return seq
+
+    def mark_end_of_stream(self) -> None:
+        if not self._writable:
+            raise PermissionError(f"Frame ring buffer is attached read-only: {self._path}")
+        self._header["flags"] = int(self._header["flags"]) | RING_FLAG_END_OF_STREAM
+        self._notify()
+
+    def write(self, frame: np.ndarray, timestamp_ns: Optional[int] = None,
+              pixel_format: PixelFormat = PixelFormat.BGR, frame_id: int = 0) -> int:
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        buffer = self.next_frame_buffer(height, width, channels, pixel_format)
+        np.copyto(buffer, frame.reshape(buffer.shape))
+        return self.commit(timestamp_ns, frame_id)
+
+    # ===== Reader =====
+
+    def read_latest(self, last_seq: int = 0, level: int = 0) -> Optional[Tuple[np.ndarray, FrameHeader]]:
+        # Return a zero-copy view of the newest frame at the given pyramid level, or None if
+        # nothing newer than last_seq. Levels the writer does not publish fall back to the smallest.
+        if self._header is None:
+            return None
+        for _ in range(self._slot_count):
+            seq = self.latest_seq
+            if seq == 0 or seq <= last_seq:
+                return None
+            slot_index = seq % self._slot_count
+            slot_header = self._slot_headers[slot_index]
+            slot_level = min(level, max(int(slot_header["level_count"]) - 1, 0))
+            header = FrameHeader(
+                sequence=seq,
+                timestamp_ns=int(slot_header["timestamp_ns"]),
+                height=int(slot_header["heights"][slot_level]),
+                width=int(slot_header["widths"][slot_level]),
+                channels=int(slot_header["channels"]),
+                pixel_format=PixelFormat(int(slot_header["pixel_format"])),
+                level=slot_level,
+                frame_id=int(slot_header["frame_id"]),
+                publish_ns=int(slot_header["publish_ns"]),
+            )
+            offset = int(slot_header["offsets"][slot_level])
+            # The writer may have lapped us while we copied the header; retry with the new latest
+            if int(slot_header["seq"]) != seq:
+                continue
+            view = self._payload_view(slot_index, offset, header.height, header.width, header.channels)
+            return view, header
+        return None
+
+    def wait(self, last_seq: int, timeout: float) -> bool:
+        # Block until a frame newer than last_seq is published or the stream ends (True), or until
+        # timeout seconds pass (False). Woken by the writer's signal; the ring is re-checked at least
+        # every SHM_RING_SIGNAL_RECHECK_SECONDS in case a wakeup was missed.
+        deadline = time.monotonic() + timeout
+        while self._header is not None and self.latest_seq <= last_seq and not self.end_of_stream:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            remaining = min(remaining, Consts.SHM_RING_SIGNAL_RECHECK_SECONDS)
+            if self._signal is not None:
+                self._signal.wait(remaining)
+            else:
+                time.sleep(remaining)
+        return self._header is not None
+
+    def is_current(self, seq: int) -> bool:
+        # True while the slot holding seq has not been reused by the writer.
+        return int(self._slot_headers[seq % self._slot_count]["seq"]) == seq
+
+    def is_replaced(self) -> bool:
+        # True when the writer has recreated the ring file (e.g. after a restart).
+        try:
+            return os.stat(self._path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def close(self) -> None:
+        self._header = None
+        self._slot_headers = []
+        if self._signal is not None:
+            self._signal.close()
+            self._signal = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out to callers still reference the mapping; let GC unmap it
+            pass
+
+    # ===== Internal =====
+
+    def _notify(self) -> None:
+        if self._signal is not None:
+            self._signal.notify()
+
+    def _slot_offset(self, slot_index: int) -> int:
+        return _align(RING_HEADER_DTYPE.itemsize) + slot_index * self._slot_stride
+
+    def _payload_view(self, slot_index: int, level_offset: int, height: int, width: int,
+                      channels: int) -> np.ndarray:
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        offset = self._slot_offset(slot_index) + _align(SLOT_HEADER_DTYPE.itemsize) + level_offset
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._mmap, offset=offset)
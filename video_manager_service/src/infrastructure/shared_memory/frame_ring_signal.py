@@ -0,0 +1,62 @@
+import os
+from typing import Optional
+
+import zmq
+
+
+class FrameRingSignal:
+    # Cross-process wakeup for a FrameRingBuffer. The writer publishes one empty message on a ZMQ
+    # IPC endpoint next to the ring file for every committed frame, and readers block on their
+    # subscription instead of sleep-polling the ring. The ring stays the only source of truth:
+    # subscriptions are conflated and a message can be missed (e.g. right after connecting), so
+    # readers always re-check the ring and only wait for a bounded time.
+
+    def __init__(self, socket: zmq.Socket, bound_path: Optional[str] = None) -> None:
+        self._socket = socket
+        self._bound_path = bound_path
+        self._poller: Optional[zmq.Poller] = None
+
+    @staticmethod
+    def publisher(endpoint: str) -> "FrameRingSignal":
+        socket = zmq.Context.instance().socket(zmq.PUB)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.setsockopt(zmq.SNDHWM, 1)
+        socket.bind(endpoint)
+        return FrameRingSignal(socket, endpoint.split("://", 1)[1])
+
+    @staticmethod
+    def subscriber(endpoint: str) -> "FrameRingSignal":
+        socket = zmq.Context.instance().socket(zmq.SUB)
+        socket.setsockopt(zmq.LINGER, 0)
+        # Only "something changed" matters, so keep just the newest message
+        socket.setsockopt(zmq.CONFLATE, 1)
+        socket.setsockopt(zmq.SUBSCRIBE, b"")
+        # Connecting retries in the background until the writer binds, also after it recreates the ring
+        socket.connect(endpoint)
+        signal = FrameRingSignal(socket)
+        signal._poller = zmq.Poller()
+        signal._poller.register(socket, zmq.POLLIN)
+        return signal
+
+    def notify(self) -> None:
+        # PUB never blocks: without subscribers, or with a full queue, the message is dropped
+        self._socket.send(b"", zmq.NOBLOCK)
+
+    def wait(self, timeout: float) -> bool:
+        # True when woken by the writer, False after timeout seconds
+        if not self._poller.poll(int(timeout * 1000)):
+            return False
+        try:
+            self._socket.recv(zmq.NOBLOCK)
+        except zmq.Again:
+            pass
+        return True
+
+    def close(self) -> None:
+        self._socket.close()
+        if self._bound_path is not None:
+            # The socket file outlives the socket
+            try:
+                os.remove(self._bound_path)
+            except FileNotFoundError:
+                pass
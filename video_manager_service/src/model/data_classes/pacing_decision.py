@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PacingDecision:
+    drop_frames: int = 0
+    duplicate_frames: int = 0
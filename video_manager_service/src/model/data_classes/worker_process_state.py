@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class WorkerProcessState:
+    index: int
+    videos_config: List[Dict]
+    process: Optional[Any] = None
+    stop_event: Optional[Any] = None
+    restarts: int = 0
+    started_at: float = 0.0
+    next_start_at: float = 0.0
+    # Exited cleanly (code 0), e.g. once all its cameras finished; never restarted
+    finished: bool = False
+    stats: Dict[str, Any] = field(default_factory=dict)
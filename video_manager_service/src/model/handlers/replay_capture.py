@@ -0,0 +1,71 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from infrastructure.shared_memory.frame_clip import FrameClip
+
+
+class ReplayCapture:
+    # cv2.VideoCapture look-alike over a memory-mapped FrameClip, so VideoStreamHandler can treat a
+    # replay source like any other capture. Frames come back as read-only views: nothing is decoded.
+
+    def __init__(self, clip_path: str, loop: bool = False) -> None:
+        self._clip: Optional[FrameClip] = FrameClip.open(clip_path)
+        self._loop = loop
+        self._next_index = 0
+        self._passes = 0
+        self._last_index: Optional[int] = None
+        self._last_position = 0.0
+
+    @property
+    def position_seconds(self) -> float:
+        # Recorded time of the last grabbed frame, increasing across loop passes
+        return self._last_position
+
+    def isOpened(self) -> bool:
+        return self._clip is not None
+
+    def grab(self) -> bool:
+        if self._clip is None:
+            return False
+        if self._next_index >= self._clip.frame_count:
+            if not self._loop:
+                return False
+            self._next_index = 0
+            self._passes += 1
+        self._last_index = self._next_index
+        self._last_position = self._passes * self._clip.duration_seconds + self._clip.timestamp_seconds(self._last_index)
+        self._next_index += 1
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._clip is None or self._last_index is None:
+            return False, None
+        return True, self._clip.frame(self._last_index)
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop_id: int) -> float:
+        if self._clip is None:
+            return 0.0
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self._clip.fps
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self._clip.frame_count)
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._next_index)
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            return self._last_position * 1000
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def release(self) -> None:
+        if self._clip is not None:
+            self._clip.close()
+            self._clip = None
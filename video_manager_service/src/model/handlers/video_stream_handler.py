@@ -1,17 +1,32 @@
 import cv2
 import os
 import logging
+import threading
 import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from numpy import ndarray
 from infrastructure.interfaces.handlers.ivideo_stream_handler import IVideoStreamHandler
 from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.shared_memory.frame_ring_buffer import FrameRingBuffer, pyramid_slot_capacity
+from model.handlers.replay_capture import ReplayCapture
+from model.pacing.frame_pacer import FramePacer
+from globals.enums.camera_state import CameraState
+from globals.enums.capture_mode import CaptureMode
+from globals.enums.catch_up_policy import CatchUpPolicy
+from globals.enums.shm_transport import ShmTransport
 from globals.consts.const_strings import ConstStrings
 from globals.consts.consts import Consts
 from globals.consts.logger_messages import LoggerMessages
+from globals.utils.exponential_backoff import ExponentialBackoff
 
 
 class VideoStreamHandler(IVideoStreamHandler):
-    def __init__(self, video_id: int, video_path: str):
+    def __init__(self, video_id: int, video_path: str, transport: ShmTransport = ShmTransport(Consts.SHM_TRANSPORT),
+                 capture_mode: CaptureMode = CaptureMode(Consts.CAPTURE_MODE),
+                 playback_speed: float = Consts.PACER_PLAYBACK_SPEED,
+                 catch_up_policy: CatchUpPolicy = CatchUpPolicy(Consts.PACER_CATCH_UP_POLICY),
+                 pyramid_scales: Sequence[float] = Consts.PYRAMID_SCALES,
+                 loop: bool = Consts.REPLAY_LOOP):
         self._video_id = video_id
         self._video_path = video_path
         self._frame_width = Consts.ALGO_FRAME_WIDTH
@@ -19,66 +34,275 @@ class VideoStreamHandler(IVideoStreamHandler):
         self._frame_rate = Consts.ALGO_FRAME_RATE
         self._cap = None
         self._writer = None
+        self._ring = None
+        self._transport = ShmTransport(transport)
         self._logger = LoggerFactory.get_logger_manager()
         self._is_rtsp = video_path.startswith("rtsp://")
+        # Replay sources are pre-decoded clips (see FrameClip), paced by their recorded timestamps
+        self._is_replay = video_path.startswith(ConstStrings.REPLAY_SOURCE_PREFIX)
+        self._loop = loop
+        self._media_position: Optional[float] = None
+        self._last_capture_ns: Optional[int] = None
+        # Capture sequence of the frame last returned by read_frame; published with it for tracing
+        self._last_frame_id = 0
+
+        # Every ring slot carries the frame at each pyramid level, downscaled once here for all consumers
+        self._pyramid_shapes = self._build_pyramid_shapes(pyramid_scales)
+
+        # File sources are paced against the file's native frame rate (see _init_pacer)
+        self._playback_speed = float(playback_speed)
+        self._catch_up_policy = CatchUpPolicy(catch_up_policy)
+        self._pacer: Optional[FramePacer] = None
+
+        # RTSP reconnects happen in the background with jittered exponential backoff
+        self._reconnect_backoff = ExponentialBackoff(Consts.RTSP_RECONNECT_BASE_SECONDS,
+                                                     Consts.RTSP_RECONNECT_MAX_SECONDS,
+                                                     Consts.RTSP_RECONNECT_JITTER)
+        self._next_reconnect_at = 0.0
+        self._connected_at = 0.0
+
+        # Latest-frame slot shared between the capture thread and the writer stage
+        # Replay has nothing to decode, so a capture thread would only add a hand-off
+        self._capture_mode = CaptureMode.INLINE if self._is_replay else CaptureMode(capture_mode)
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_running = False
+        self._capture_finished = False
+        self._frame_ready = threading.Condition()
+        self._latest_frame: Optional[ndarray] = None
+        self._latest_capture_ns: Optional[int] = None
+        self._latest_seq = 0
+        self._consumed_seq = 0
+        self._dropped_frames = 0
+        self._pending_skips = 0
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def state(self) -> CameraState:
+        # Source-level state; the manager refines ACTIVE into STALLED when no frame arrives
+        if self._capture_finished:
+            return CameraState.FINISHED
+        if self._is_rtsp and (not self._cap or not self._cap.isOpened()):
+            return CameraState.RECONNECTING
+        return CameraState.ACTIVE
+
+    @property
+    def pacing_stats(self) -> Dict[str, Any]:
+        return self._pacer.stats if self._pacer is not None else {}
 
     def read_frame(self) -> ndarray:
-        if not self._cap or not self._cap.isOpened():
-            # Try to reconnect for RTSP streams
-            if self._is_rtsp:
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                                f"RTSP stream disconnected, attempting reconnect: {self._video_path}")
-                try:
-                    self._init_capture()
-                except Exception as e:
-                    self._logger.log(ConstStrings.LOG_NAME_ERROR,
-                                   f"Failed to reconnect RTSP: {e}", level=logging.ERROR)
-                    return None
-            else:
-                return None
-        
-        # For RTSP, flush buffer to get latest frame
-        if self._is_rtsp:
-            # Grab and discard 1 old frame from buffer
-            self._cap.grab()
-            ret, frame = self._cap.retrieve()
+        if self._capture_mode == CaptureMode.THREADED:
+            frame = self._read_latest_frame()
         else:
-            ret, frame = self._cap.read()
-            
-        if not ret and self._is_rtsp:
-            # RTSP connection lost, will retry on next call
-            self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                           f"Lost RTSP connection for video {self._video_id}")
-            if self._cap:
-                self._cap.release()
-            return None
-        return frame if ret else None
+            frame = self._read_from_capture()
+            if frame is not None:
+                self._last_capture_ns = time.time_ns()
+                self._last_frame_id += 1
+                if self._is_replay:
+                    self._media_position = self._cap.position_seconds
+        if frame is None and self._capture_finished and self._ring is not None and not self._ring.end_of_stream:
+            # Lets readers mark the camera finished instead of waiting for it as a stalled one
+            self._ring.mark_end_of_stream()
+        return frame
 
     def write_frame(self, frame: ndarray) -> None:
         if frame is None:
             return
-        
+
+        # Don't pace RTSP to minimize latency
+        decision = self._pacer.wait(self._media_position) if self._pacer is not None else None
+
+        self._publish_frame(frame)
+
+        if decision is not None:
+            for _ in range(decision.duplicate_frames):
+                self._publish_frame(frame)
+            if decision.drop_frames:
+                self._skip_source_frames(decision.drop_frames)
+
+    def _publish_frame(self, frame: ndarray) -> None:
+        if self._ring is not None:
+            self._write_frame_to_ring(frame)
+            return
+
         # Resize to target dimensions
         resized = cv2.resize(frame, (self._frame_width, self._frame_height))
 
         if self._writer and self._writer.isOpened():
             self._writer.write(resized)
-            # Don't sleep for RTSP to minimize latency
-            if not self._is_rtsp:
-                time.sleep(1.0 / max(1.0, float(self._frame_rate)))
         else:
             self._logger.log(ConstStrings.LOG_NAME_ERROR,
                              LoggerMessages.WRITER_NOT_OPENED.format(self._video_id), level=logging.ERROR)
 
     def release(self) -> None:
+        self._stop_capture_thread()
         if self._cap and self._cap.isOpened():
             self._cap.release()
         if self._writer and self._writer.isOpened():
             self._writer.release()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
 
     def start(self) -> None:
-        self._init_capture()
+        if self._is_rtsp:
+            # An unreachable camera must not block startup; the reader keeps retrying in the background
+            self._connect_rtsp()
+        else:
+            self._init_capture()
         self._init_writer()
+        self._init_pacer()
+        if self._capture_mode == CaptureMode.THREADED:
+            self._start_capture_thread()
+
+    def _read_from_capture(self) -> Optional[ndarray]:
+        if not self._cap or not self._cap.isOpened():
+            # Try to reconnect for RTSP streams once the backoff delay has passed
+            if not self._is_rtsp or not self._wait_for_reconnect() or not self._connect_rtsp():
+                return None
+        
+        # For RTSP read inline, flush buffer to get latest frame (the capture thread drains it anyway)
+        if self._is_rtsp and self._capture_mode == CaptureMode.INLINE:
+            # Grab and discard 1 old frame from buffer
+            self._cap.grab()
+            ret, frame = self._cap.retrieve()
+        else:
+            ret, frame = self._cap.read()
+            
+        if not ret and self._is_rtsp:
+            # RTSP connection lost, will retry on next call
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                           f"Lost RTSP connection for video {self._video_id}")
+            if self._cap:
+                self._cap.release()
+            self._schedule_reconnect(after_loss=True)
+            return None
+        if not ret:
+            # End of a file source
+            self._capture_finished = True
+            return None
+        return frame
+
+    def _connect_rtsp(self) -> bool:
+        try:
+            self._init_capture()
+        except ValueError:
+            self._schedule_reconnect(after_loss=False)
+            return False
+        self._connected_at = time.monotonic()
+        return True
+
+    def _schedule_reconnect(self, after_loss: bool) -> None:
+        # A connection that stayed up long enough is retried immediately; a flapping one keeps backing off
+        if after_loss and time.monotonic() - self._connected_at >= Consts.RTSP_STABLE_SECONDS:
+            self._reconnect_backoff.reset()
+            self._next_reconnect_at = 0.0
+            return
+        delay = self._reconnect_backoff.next_delay()
+        self._next_reconnect_at = time.monotonic() + delay
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                         LoggerMessages.RTSP_RECONNECT_SCHEDULED.format(
+                             self._video_id, round(delay, 2), self._reconnect_backoff.attempts))
+
+    def _wait_for_reconnect(self) -> bool:
+        remaining = self._next_reconnect_at - time.monotonic()
+        if remaining <= 0:
+            return True
+        if self._capture_mode == CaptureMode.THREADED:
+            # Sleep on the condition so release() can wake the capture thread straight away
+            with self._frame_ready:
+                self._frame_ready.wait_for(lambda: not self._capture_running, timeout=remaining)
+            return self._capture_running
+        time.sleep(min(remaining, Consts.CAPTURE_READ_TIMEOUT_SECONDS))
+        return time.monotonic() >= self._next_reconnect_at
+
+    def _start_capture_thread(self) -> None:
+        self._capture_running = True
+        self._capture_finished = False
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
+    def _stop_capture_thread(self) -> None:
+        if self._capture_thread is None:
+            return
+        with self._frame_ready:
+            self._capture_running = False
+            self._frame_ready.notify_all()
+        self._capture_thread.join(timeout=Consts.CAPTURE_JOIN_TIMEOUT_SECONDS)
+        self._capture_thread = None
+
+    def _capture_loop(self) -> None:
+        while self._capture_running:
+            if not self._is_rtsp:
+                # Files have no live edge: decode one frame ahead and wait until the writer took it
+                with self._frame_ready:
+                    self._frame_ready.wait_for(
+                        lambda: not self._capture_running or self._consumed_seq >= self._latest_seq)
+                if not self._capture_running:
+                    break
+
+            with self._frame_ready:
+                skips, self._pending_skips = self._pending_skips, 0
+            for _ in range(skips):
+                self._cap.grab()
+
+            frame = self._read_from_capture()
+            if frame is None:
+                if not self._is_rtsp:
+                    self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                                     LoggerMessages.CAPTURE_SOURCE_ENDED.format(self._video_id))
+                    with self._frame_ready:
+                        self._capture_finished = True
+                        self._frame_ready.notify_all()
+                    break
+                # RTSP: the next read waits out the reconnect backoff
+                continue
+
+            with self._frame_ready:
+                self._latest_frame = frame
+                self._latest_capture_ns = time.time_ns()
+                self._latest_seq += 1
+                self._frame_ready.notify_all()
+
+    def _read_latest_frame(self) -> Optional[ndarray]:
+        with self._frame_ready:
+            self._frame_ready.wait_for(
+                lambda: self._latest_seq > self._consumed_seq or self._capture_finished or not self._capture_running,
+                timeout=Consts.CAPTURE_READ_TIMEOUT_SECONDS)
+            if self._latest_seq <= self._consumed_seq:
+                return None
+            # Frames overwritten in the slot before the writer got to them were never queued
+            self._dropped_frames += self._latest_seq - self._consumed_seq - 1
+            self._consumed_seq = self._latest_seq
+            self._last_capture_ns = self._latest_capture_ns
+            self._last_frame_id = self._latest_seq
+            frame = self._latest_frame
+            self._latest_frame = None
+            self._frame_ready.notify_all()
+            return frame
+
+    def _init_pacer(self) -> None:
+        if self._is_rtsp:
+            return
+        native_fps = self._cap.get(cv2.CAP_PROP_FPS) if self._cap else 0
+        if not native_fps or native_fps <= 0 or native_fps > Consts.PACER_MAX_NATIVE_FPS:
+            native_fps = float(self._frame_rate)
+        self._pacer = FramePacer(native_fps, self._playback_speed, self._catch_up_policy)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                         LoggerMessages.PACER_READY.format(self._video_id, native_fps, self._playback_speed,
+                                                           self._catch_up_policy.value))
+
+    def _skip_source_frames(self, count: int) -> None:
+        # grab() demuxes without decoding to BGR, so dropping frames to catch up stays cheap
+        if self._capture_mode == CaptureMode.THREADED:
+            with self._frame_ready:
+                self._pending_skips += count
+            return
+        for _ in range(count):
+            if not self._cap or not self._cap.grab():
+                break
 
     def _init_capture(self) -> None:
         # Release existing capture if any
@@ -88,38 +312,33 @@ class VideoStreamHandler(IVideoStreamHandler):
         self._logger.log(ConstStrings.LOG_NAME_DEBUG,
                         f"Opening video source: {self._video_path}")
         
-        # For RTSP streams, retry with timeout
+        # For RTSP streams, a single attempt bounded by open/read timeouts; retries are scheduled by the caller
         if self._is_rtsp:
-            max_retries = 60  # 60 attempts
-            retry_delay = 5   # 5 seconds between attempts
+            # Set low-latency FFMPEG options BEFORE creating VideoCapture
+            os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = (
+                'rtsp_transport;tcp|'
+                'fflags;nobuffer|'
+                'flags;low_delay'
+            )
             
-            for attempt in range(1, max_retries + 1):
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                               f"Attempt {attempt}/{max_retries} to connect to RTSP camera: {self._video_path}")
-                
-                # Set low-latency FFMPEG options BEFORE creating VideoCapture
-                os.environ['OPENCV_FFMPEG_CAPTURE_OPTIONS'] = (
-                    'rtsp_transport;tcp|'
-                    'fflags;nobuffer|'
-                    'flags;low_delay'
-                )
-                
-                self._cap = cv2.VideoCapture(self._video_path, cv2.CAP_FFMPEG)
-                
-                # Minimize buffer to 2 frames for balance between latency and quality
-                self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 2)
-                
-                if self._cap.isOpened():
-                    self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                                   f"Successfully connected to RTSP camera on attempt {attempt}")
-                    break
-                    
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                               f"Failed to connect. Waiting {retry_delay} seconds before retry...")
-                #time.sleep(retry_delay)
+            self._cap = cv2.VideoCapture(self._video_path, cv2.CAP_FFMPEG, [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, Consts.RTSP_OPEN_TIMEOUT_MS,
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC, Consts.RTSP_READ_TIMEOUT_MS,
+            ])
+            
+            # Minimize buffer to 2 frames for balance between latency and quality
+            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 2)
                 
             if not self._cap.isOpened():
-                error_msg = f"Cannot open RTSP camera after {max_retries} attempts: {self._video_path}"
+                error_msg = f"Cannot open RTSP camera (attempt {self._reconnect_backoff.attempts + 1}): {self._video_path}"
+                self._logger.log(ConstStrings.LOG_NAME_ERROR, error_msg, level=logging.ERROR)
+                raise ValueError(error_msg)
+        elif self._is_replay:
+            clip_path = self._video_path[len(ConstStrings.REPLAY_SOURCE_PREFIX):]
+            try:
+                self._cap = ReplayCapture(clip_path, self._loop)
+            except (OSError, ValueError) as e:
+                error_msg = f"Cannot open replay clip {clip_path}: {e}"
                 self._logger.log(ConstStrings.LOG_NAME_ERROR, error_msg, level=logging.ERROR)
                 raise ValueError(error_msg)
         else:
@@ -133,6 +352,10 @@ class VideoStreamHandler(IVideoStreamHandler):
                          LoggerMessages.VIDEO_OPENED.format(self._video_path))
 
     def _init_writer(self) -> None:
+        if self._transport == ShmTransport.RING:
+            self._init_ring_writer()
+            return
+
         video_writer_pipeline = self._construct_video_writer_pipeline()
 
         # Log pipeline for debugging
@@ -170,6 +393,38 @@ class VideoStreamHandler(IVideoStreamHandler):
         self._logger.log(ConstStrings.LOG_NAME_DEBUG,
                          LoggerMessages.SHM_WRITER_READY.format(self._video_id))
 
+    def _build_pyramid_shapes(self, pyramid_scales: Sequence[float]) -> List[Tuple[int, int]]:
+        # Level 0 is always the full output frame; further levels are kept in descending size order
+        scales = sorted({float(scale) for scale in pyramid_scales if 0 < float(scale) < 1.0}, reverse=True)
+        shapes = [(self._frame_height, self._frame_width)]
+        for scale in scales[:Consts.SHM_RING_MAX_LEVELS - 1]:
+            height = max(int(round(self._frame_height * scale)), 1)
+            width = max(int(round(self._frame_width * scale)), 1)
+            shapes.append((height, width))
+        return shapes
+
+    def _init_ring_writer(self) -> None:
+        ring_path = ConstStrings.SHARED_MEMORY_RING_PATH.format(camera_id=self._video_id)
+        slot_capacity = pyramid_slot_capacity(self._pyramid_shapes)
+        self._ring = FrameRingBuffer.create(ring_path, slot_capacity)
+        levels = ", ".join(f"{width}x{height}" for height, width in self._pyramid_shapes)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG,
+                         LoggerMessages.SHM_RING_WRITER_READY.format(ring_path, Consts.SHM_RING_SLOT_COUNT, levels))
+
+    def _write_frame_to_ring(self, frame: ndarray) -> None:
+        # Resize straight into the shared memory slot, so the frame is never copied twice
+        slots = self._ring.next_frame_buffers(self._pyramid_shapes)
+        full = slots[0]
+        if frame.shape[:2] == (self._frame_height, self._frame_width):
+            full[...] = frame
+        else:
+            cv2.resize(frame, (self._frame_width, self._frame_height), dst=full)
+
+        # Each smaller level is downscaled from the previous one, which is cheaper than from full size
+        for previous, level in zip(slots, slots[1:]):
+            cv2.resize(previous, (level.shape[1], level.shape[0]), dst=level, interpolation=cv2.INTER_AREA)
+        self._ring.commit(self._last_capture_ns, self._last_frame_id)
+
     def _construct_video_writer_pipeline(self) -> str:
         shared_memory_path = ConstStrings.SHARED_MEMORY_CAM_PATH.format(camera_id=self._video_id)
 
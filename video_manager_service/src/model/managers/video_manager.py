@@ -2,37 +2,70 @@ import os
 import threading
 import time
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional
 
 from infrastructure.interfaces.managers.ivideo_manager import IVideoManager
 from infrastructure.factories.handler_factory import HandlerFactory
 from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.processes.process_supervisor import ProcessSupervisor
+from globals.enums.camera_state import CameraState
+from globals.enums.execution_mode import ExecutionMode
+from globals.utils.exponential_backoff import ExponentialBackoff
 from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
 from globals.consts.logger_messages import LoggerMessages
 
 
 class VideoManager(IVideoManager):
-    def __init__(self, videos_config: List[Dict]) -> None:
+    def __init__(self, videos_config: List[Dict],
+                 execution_mode: ExecutionMode = ExecutionMode(Consts.EXECUTION_MODE),
+                 cameras_per_process: int = Consts.CAMERAS_PER_PROCESS,
+                 remove_shared_memory: bool = True) -> None:
         self._videos_config = videos_config
         self._handlers = []
         self._num_videos = len(videos_config)
         self._process_video_threads = []
+        self._frame_counts = [0] * self._num_videos
+        self._camera_states = [CameraState.STALLED] * self._num_videos
         self._running = True
+        # Wakes camera threads idling between reads when the manager stops
+        self._shutdown = threading.Event()
         self._logger = LoggerFactory.get_logger_manager()
+
+        # Process mode: the parent only supervises, every camera group runs in its own process
+        self._execution_mode = ExecutionMode(execution_mode)
+        self._cameras_per_process = cameras_per_process
+        self._supervisor: Optional[ProcessSupervisor] = None
+
+        # Set when this manager runs inside a supervised worker process
+        self._stop_event: Optional[Any] = None
+        self._stats_queue: Optional[Any] = None
+        self._worker_index: Optional[int] = None
+        self._last_stats_time = time.monotonic()
         
         # Clean up shared memory files 
-        self._remove_shared_memory_files()
+        if remove_shared_memory:
+            self._remove_shared_memory_files()
         
         # Initialize video handlers 
-        self._init_video_handlers()
+        if self._execution_mode == ExecutionMode.THREAD:
+            self._init_video_handlers()
+
+    @staticmethod
+    def run_worker(videos_config: List[Dict], stop_event: Any, stats_queue: Any, worker_index: int) -> None:
+        # Entry point of a worker process started by ProcessSupervisor
+        manager = VideoManager(videos_config, ExecutionMode.THREAD, remove_shared_memory=False)
+        manager._stop_event = stop_event
+        manager._stats_queue = stats_queue
+        manager._worker_index = worker_index
+        manager.start()
 
     def start(self) -> None:
-        for i in range(self._num_videos):
-            thread = threading.Thread(
-                target=self._process_frames_for_video, args=(i,)
-            )
-            self._process_video_threads.append(thread)
-            thread.start()
+        if self._execution_mode == ExecutionMode.PROCESS:
+            self._start_worker_processes()
+        else:
+            self._start_worker_threads()
         
         self._logger.log(ConstStrings.LOG_NAME_DEBUG,
                          LoggerMessages.VIDEO_STREAMS_STARTED.format(self._num_videos))
@@ -41,11 +74,16 @@ class VideoManager(IVideoManager):
         try:
             while self._running:
                 time.sleep(1)
+                self._on_main_loop_tick()
         except KeyboardInterrupt:
             self.stop()
 
     def stop(self) -> None:
         self._running = False
+        self._shutdown.set()
+
+        if self._supervisor is not None:
+            self._supervisor.stop()
         
         for handler in self._handlers:
             handler.release()
@@ -56,27 +94,108 @@ class VideoManager(IVideoManager):
         self._logger.log(ConstStrings.LOG_NAME_DEBUG,
                          LoggerMessages.VIDEO_MANAGER_STOPPED)
 
+    def _start_worker_threads(self) -> None:
+        for i in range(self._num_videos):
+            thread = threading.Thread(
+                target=self._process_frames_for_video, args=(i,)
+            )
+            self._process_video_threads.append(thread)
+            thread.start()
+
+    def _start_worker_processes(self) -> None:
+        video_groups = ProcessSupervisor.group_videos(self._videos_config, self._cameras_per_process)
+        self._supervisor = ProcessSupervisor("video_manager", VideoManager.run_worker, video_groups)
+        self._supervisor.start()
+
+    def _on_main_loop_tick(self) -> None:
+        if self._stop_event is not None and self._stop_event.is_set():
+            self.stop()
+            return
+        if self._supervisor is not None and self._supervisor.all_finished:
+            # Every worker exited after its cameras finished
+            self.stop()
+            return
+
+        now = time.monotonic()
+        if now - self._last_stats_time < Consts.PROCESS_STATS_INTERVAL_SECONDS:
+            return
+        elapsed = now - self._last_stats_time
+        self._last_stats_time = now
+
+        if self._supervisor is not None:
+            self._supervisor.log_stats()
+            return
+
+        cameras = self._collect_camera_stats(elapsed)
+        if self._stats_queue is not None:
+            ProcessSupervisor.report_stats(self._stats_queue, self._worker_index, cameras)
+        else:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_STATS.format(cameras))
+
+    def _collect_camera_stats(self, elapsed: float) -> Dict[Any, Dict[str, Any]]:
+        cameras = {}
+        for i, handler in enumerate(self._handlers):
+            frames = self._frame_counts[i]
+            self._frame_counts[i] = 0
+            stats = {"frames": frames, "fps": round(frames / elapsed, 1), "state": self._camera_states[i].value,
+                     "capture_dropped": handler.dropped_frames}
+            stats.update(handler.pacing_stats)
+            cameras[self._videos_config[i].get("video_id")] = stats
+        return cameras
+
     def _init_video_handlers(self) -> None:
         for video in self._videos_config:
             video_id = video.get("video_id")
             video_path = video.get("video_path")
+            transport = video.get("transport", Consts.SHM_TRANSPORT)
+            capture_mode = video.get("capture_mode", Consts.CAPTURE_MODE)
+            playback_speed = video.get("playback_speed", Consts.PACER_PLAYBACK_SPEED)
+            catch_up_policy = video.get("catch_up_policy", Consts.PACER_CATCH_UP_POLICY)
+            pyramid_scales = video.get("pyramid_scales", Consts.PYRAMID_SCALES)
+            loop = video.get("loop", Consts.REPLAY_LOOP)
             
             video_handler = HandlerFactory.create_video_stream_handler(
-                video_id, video_path
+                video_id, video_path, transport, capture_mode, playback_speed, catch_up_policy, pyramid_scales, loop
             )
             self._handlers.append(video_handler)
-            video_handler.start()
+
+        # Open all sources concurrently so one slow camera does not delay the others
+        if not self._handlers:
+            return
+        with ThreadPoolExecutor(max_workers=len(self._handlers)) as executor:
+            futures = [executor.submit(handler.start) for handler in self._handlers]
+        for future in futures:
+            future.result()
 
     def _process_frames_for_video(self, video_index: int) -> None:
         handler = self._handlers[video_index]
+        idle_backoff = ExponentialBackoff(Consts.CAMERA_IDLE_BASE_SECONDS, Consts.CAMERA_IDLE_MAX_SECONDS)
         
         while self._running:
             frame = handler.read_frame()
             if frame is None:
+                state = handler.state
+                if state == CameraState.ACTIVE:
+                    state = CameraState.STALLED
+                self._set_camera_state(video_index, state)
+                if state == CameraState.FINISHED:
+                    break
+                # Threaded capture and RTSP reconnects already block; this keeps inline polling cheap too
+                self._shutdown.wait(idle_backoff.next_delay())
                 continue
-            
 
+            idle_backoff.reset()
+            self._set_camera_state(video_index, CameraState.ACTIVE)
             handler.write_frame(frame)
+            self._frame_counts[video_index] += 1
+
+    def _set_camera_state(self, video_index: int, state: CameraState) -> None:
+        previous = self._camera_states[video_index]
+        if previous == state:
+            return
+        self._camera_states[video_index] = state
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CAMERA_STATE_CHANGED.format(
+            self._videos_config[video_index].get("video_id"), previous.value, state.value))
 
     def _remove_shared_memory_files(self) -> None:
         file_prefixes = ["cam", "shmpipe"]
@@ -0,0 +1,103 @@
+import time
+from typing import Any, Dict, Optional
+
+from globals.consts.consts import Consts
+from globals.enums.catch_up_policy import CatchUpPolicy
+from model.data_classes.pacing_decision import PacingDecision
+
+
+class FramePacer:
+    # Paces output against absolute deadlines (start + n * period), so time spent decoding and
+    # resizing is absorbed by the schedule instead of being added on top of a fixed sleep.
+
+    def __init__(self, fps: float, speed: float = Consts.PACER_PLAYBACK_SPEED,
+                 policy: CatchUpPolicy = CatchUpPolicy(Consts.PACER_CATCH_UP_POLICY),
+                 max_catch_up_frames: int = Consts.PACER_MAX_CATCH_UP_FRAMES) -> None:
+        # speed <= 0 publishes as fast as the source can be decoded (benchmark mode)
+        self._unthrottled = speed <= 0
+        self._fps = fps
+        self._speed = speed
+        self._period = 0.0 if self._unthrottled else 1.0 / (fps * speed)
+        self._policy = CatchUpPolicy(policy)
+        self._max_catch_up_frames = max_catch_up_frames
+        self._next_deadline: Optional[float] = None
+        # Wall-clock time of media position 0 when pacing by recorded timestamps
+        self._origin: Optional[float] = None
+
+        self._frames = 0
+        self._late_frames = 0
+        self._dropped_frames = 0
+        self._duplicated_frames = 0
+        self._rebased = 0
+        self._max_lateness = 0.0
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "native_fps": self._fps,
+            "speed": self._speed,
+            "policy": self._policy.value,
+            "paced_frames": self._frames,
+            "late_frames": self._late_frames,
+            "dropped_frames": self._dropped_frames,
+            "duplicated_frames": self._duplicated_frames,
+            "rebased": self._rebased,
+            "max_lateness_ms": round(self._max_lateness * 1000, 1),
+        }
+
+    def reset(self) -> None:
+        self._next_deadline = None
+        self._origin = None
+
+    def wait(self, media_position: Optional[float] = None) -> PacingDecision:
+        # Block until the next frame's deadline and tell the caller how to catch up if it is late.
+        # Sources with recorded timestamps pass media_position (seconds) to follow them instead of a fixed period.
+        self._frames += 1
+        if self._unthrottled:
+            return PacingDecision()
+
+        now = time.monotonic()
+        if media_position is not None:
+            if self._origin is None:
+                self._origin = now - media_position / self._speed
+            self._next_deadline = self._origin + media_position / self._speed
+        elif self._next_deadline is None:
+            self._next_deadline = now
+
+        lateness = now - self._next_deadline
+        if lateness <= 0:
+            time.sleep(-lateness)
+            self._next_deadline += self._period
+            return PacingDecision()
+
+        self._next_deadline += self._period
+        if lateness > Consts.PACER_LATE_TOLERANCE_SECONDS:
+            self._late_frames += 1
+            self._max_lateness = max(self._max_lateness, lateness)
+
+        missed = int(lateness / self._period)
+        if missed == 0:
+            return PacingDecision()
+
+        if missed > self._max_catch_up_frames:
+            # Too far behind to catch up sensibly (e.g. the process was stalled): start a fresh schedule
+            self._next_deadline = now + self._period
+            if media_position is not None:
+                self._origin = now - media_position / self._speed
+            self._rebased += 1
+            return PacingDecision()
+
+        if self._policy == CatchUpPolicy.BURST:
+            # Keep the schedule and publish back-to-back until we are on time again
+            return PacingDecision()
+
+        self._next_deadline += missed * self._period
+        if self._policy == CatchUpPolicy.DROP:
+            self._dropped_frames += missed
+            return PacingDecision(drop_frames=missed)
+        self._duplicated_frames += missed
+        return PacingDecision(duplicate_frames=missed)
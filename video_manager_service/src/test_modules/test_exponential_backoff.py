@@ -0,0 +1,44 @@
+import unittest
+from unittest import mock
+
+from globals.utils.exponential_backoff import ExponentialBackoff
+
+
+class TestExponentialBackoff(unittest.TestCase):
+    def test_delay_doubles_up_to_max(self) -> None:
+        backoff = ExponentialBackoff(1, 10)
+        self.assertEqual([backoff.next_delay() for _ in range(6)], [1, 2, 4, 8, 10, 10])
+        self.assertEqual(backoff.attempts, 6)
+
+    def test_reset_starts_over(self) -> None:
+        backoff = ExponentialBackoff(0.5, 30)
+        backoff.next_delay()
+        backoff.next_delay()
+        backoff.reset()
+        self.assertEqual(backoff.attempts, 0)
+        self.assertEqual(backoff.next_delay(), 0.5)
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        backoff = ExponentialBackoff(1, 30, jitter=0.2)
+        for attempt in range(6):
+            expected = min(30, 2 ** attempt)
+            delay = backoff.next_delay()
+            self.assertGreaterEqual(delay, expected * 0.8)
+            self.assertLessEqual(delay, expected * 1.2)
+
+    def test_jitter_scales_the_capped_delay(self) -> None:
+        backoff = ExponentialBackoff(1, 4, jitter=0.5)
+        with mock.patch("globals.utils.exponential_backoff.random.uniform", return_value=1.5) as uniform:
+            for _ in range(4):
+                delay = backoff.next_delay()
+        uniform.assert_called_with(0.5, 1.5)
+        self.assertEqual(delay, 6.0)
+
+    def test_no_jitter_is_deterministic(self) -> None:
+        with mock.patch("globals.utils.exponential_backoff.random.uniform") as uniform:
+            ExponentialBackoff(1, 4).next_delay()
+        uniform.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
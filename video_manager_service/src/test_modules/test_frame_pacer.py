@@ -0,0 +1,95 @@
+import unittest
+from unittest import mock
+
+from globals.enums.catch_up_policy import CatchUpPolicy
+from model.data_classes.pacing_decision import PacingDecision
+from model.pacing.frame_pacer import FramePacer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept += seconds
+        self.now += seconds
+
+
+class TestFramePacer(unittest.TestCase):
+    def setUp(self) -> None:
+        self._clock = FakeClock()
+        patcher = mock.patch("model.pacing.frame_pacer.time", self._clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_on_time_frames_sleep_until_their_deadline(self) -> None:
+        pacer = FramePacer(10, policy=CatchUpPolicy.DROP)
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self._clock.now += 0.03  # decoding took 30 ms of the 100 ms period
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertAlmostEqual(self._clock.now, 100.1)
+        self.assertEqual(pacer.stats["late_frames"], 0)
+
+    def test_drop_policy_skips_missed_frames(self) -> None:
+        pacer = FramePacer(10, policy=CatchUpPolicy.DROP)
+        pacer.wait()
+        self._clock.now += 0.35  # deadline was 100.1, so 2 whole periods were missed
+
+        self.assertEqual(pacer.wait(), PacingDecision(drop_frames=2))
+        self.assertEqual(pacer.stats["dropped_frames"], 2)
+        self.assertEqual(pacer.stats["late_frames"], 1)
+        # The schedule moved past the dropped frames: the next deadline is 100.4
+        self._clock.now = 100.38
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertAlmostEqual(self._clock.now, 100.4)
+
+    def test_duplicate_policy_repeats_the_late_frame(self) -> None:
+        pacer = FramePacer(10, policy=CatchUpPolicy.DUPLICATE)
+        pacer.wait()
+        self._clock.now += 0.35
+
+        self.assertEqual(pacer.wait(), PacingDecision(duplicate_frames=2))
+        self.assertEqual(pacer.stats["duplicated_frames"], 2)
+
+    def test_burst_policy_keeps_the_schedule(self) -> None:
+        pacer = FramePacer(10, policy=CatchUpPolicy.BURST)
+        pacer.wait()
+        self._clock.now += 0.35
+
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertEqual(self._clock.slept, 0.0)
+
+    def test_far_behind_rebases_the_schedule(self) -> None:
+        pacer = FramePacer(10, policy=CatchUpPolicy.DROP, max_catch_up_frames=5)
+        pacer.wait()
+        self._clock.now += 3.0  # e.g. the process was suspended
+
+        self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertEqual(pacer.stats["rebased"], 1)
+        self.assertEqual(pacer.stats["dropped_frames"], 0)
+        self.assertEqual(pacer.wait(), PacingDecision())
+        # A fresh schedule starts one period after the late frame
+        self.assertAlmostEqual(self._clock.now, 103.1)
+
+    def test_media_position_follows_recorded_timestamps(self) -> None:
+        pacer = FramePacer(10, speed=2.0)
+        pacer.wait(media_position=0.0)
+        pacer.wait(media_position=0.5)
+        # Half a second of media at double speed
+        self.assertAlmostEqual(self._clock.now, 100.25)
+
+    def test_unthrottled_never_sleeps(self) -> None:
+        pacer = FramePacer(10, speed=0)
+        for _ in range(5):
+            self.assertEqual(pacer.wait(), PacingDecision())
+        self.assertEqual(self._clock.slept, 0.0)
+        self.assertEqual(pacer.stats["paced_frames"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
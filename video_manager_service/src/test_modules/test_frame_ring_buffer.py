@@ -0,0 +1,157 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from infrastructure.shared_memory.frame_ring_buffer import FrameRingBuffer, pyramid_slot_capacity
+
+
+class TestFrameRingBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, "cam1.ring")
+        self._slot_count = 4
+        self._writer = FrameRingBuffer.create(self._path, pyramid_slot_capacity([(4, 6)]), self._slot_count)
+        self._reader = FrameRingBuffer.attach(self._path)
+
+    def tearDown(self) -> None:
+        self._reader.close()
+        self._writer.close()
+        self._dir.cleanup()
+
+    def _frame(self, value: int) -> np.ndarray:
+        return np.full((4, 6, 3), value, dtype=np.uint8)
+
+    def test_empty_ring_has_no_frame(self) -> None:
+        self.assertIsNone(self._reader.read_latest())
+
+    def test_reads_latest_frame_and_metadata(self) -> None:
+        self._writer.write(self._frame(1), timestamp_ns=100, frame_id=7)
+        self._writer.write(self._frame(2), timestamp_ns=200, frame_id=8)
+
+        frame, header = self._reader.read_latest()
+        self.assertEqual(header.sequence, 2)
+        self.assertEqual(header.timestamp_ns, 200)
+        self.assertEqual(header.frame_id, 8)
+        self.assertEqual((header.height, header.width, header.channels), (4, 6, 3))
+        np.testing.assert_array_equal(frame, self._frame(2))
+        self.assertIsNone(self._reader.read_latest(header.sequence))
+
+    def test_wraparound_reuses_slots(self) -> None:
+        frames_written = self._slot_count * 2 + 1
+        for value in range(1, frames_written + 1):
+            self._writer.write(self._frame(value))
+
+        frame, header = self._reader.read_latest()
+        self.assertEqual(header.sequence, frames_written)
+        np.testing.assert_array_equal(frame, self._frame(frames_written))
+        # Only the last slot_count sequences are still held by their slots
+        self.assertTrue(self._reader.is_current(frames_written - self._slot_count + 1))
+        self.assertFalse(self._reader.is_current(frames_written - self._slot_count))
+
+    def test_lapped_reader_detects_overwritten_view(self) -> None:
+        self._writer.write(self._frame(1))
+        view, header = self._reader.read_latest()
+        for value in range(2, self._slot_count + 2):
+            self._writer.write(self._frame(value))
+
+        # The view now shows a newer frame; is_current tells the reader it was lapped
+        self.assertFalse(self._reader.is_current(header.sequence))
+        np.testing.assert_array_equal(view, self._frame(self._slot_count + 1))
+
+    def test_torn_slot_is_not_returned(self) -> None:
+        for value in range(1, self._slot_count + 1):
+            self._writer.write(self._frame(value))
+        # A writer refilling the latest slot zeroes its seq before latest_seq moves on
+        latest = self._reader.latest_seq
+        slot_header = self._writer._slot_headers[latest % self._slot_count]
+        slot_header["seq"] = 0
+        self.assertIsNone(self._reader.read_latest())
+
+        slot_header["seq"] = latest
+        _, header = self._reader.read_latest()
+        self.assertEqual(header.sequence, latest)
+
+    def test_slot_being_filled_is_not_visible_before_commit(self) -> None:
+        self._writer.write(self._frame(1))
+        buffer = self._writer.next_frame_buffer(4, 6)
+        buffer[...] = 9
+
+        _, header = self._reader.read_latest()
+        self.assertEqual(header.sequence, 1)
+        self._writer.commit()
+        frame, header = self._reader.read_latest(1)
+        self.assertEqual(header.sequence, 2)
+        np.testing.assert_array_equal(frame, self._frame(9))
+
+    def test_pyramid_levels_share_one_sequence(self) -> None:
+        shapes = [(8, 12), (4, 6)]
+        path = os.path.join(self._dir.name, "cam2.ring")
+        writer = FrameRingBuffer.create(path, pyramid_slot_capacity(shapes), self._slot_count)
+        reader = FrameRingBuffer.attach(path)
+        try:
+            full, half = writer.next_frame_buffers(shapes)
+            full[...] = 1
+            half[...] = 2
+            writer.commit()
+
+            frame, header = reader.read_latest(level=1)
+            self.assertEqual((header.sequence, header.level, frame.shape), (1, 1, (4, 6, 3)))
+            np.testing.assert_array_equal(frame, np.full((4, 6, 3), 2, dtype=np.uint8))
+            # Levels the writer does not publish fall back to the smallest one
+            _, header = reader.read_latest(level=Consts.SHM_RING_MAX_LEVELS - 1)
+            self.assertEqual(header.level, 1)
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_oversized_frame_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self._writer.next_frame_buffer(40, 60)
+
+    def test_reader_is_read_only(self) -> None:
+        with self.assertRaises(PermissionError):
+            self._reader.next_frame_buffer(4, 6)
+
+    def test_wait_returns_on_new_frame(self) -> None:
+        self.assertFalse(self._reader.wait(0, timeout=0.05))
+        writer_thread = threading.Timer(0.05, self._writer.write, args=(self._frame(1),))
+        writer_thread.start()
+        try:
+            self.assertTrue(self._reader.wait(0, timeout=2.0))
+        finally:
+            writer_thread.join()
+        self.assertEqual(self._reader.latest_seq, 1)
+        # Nothing newer than what was already read
+        self.assertFalse(self._reader.wait(1, timeout=0.05))
+
+    def test_end_of_stream_wakes_readers_until_next_commit(self) -> None:
+        self._writer.write(self._frame(1))
+        self.assertFalse(self._reader.end_of_stream)
+        self._writer.mark_end_of_stream()
+        self.assertTrue(self._reader.end_of_stream)
+        self.assertTrue(self._reader.wait(1, timeout=0.05))
+        self.assertIsNone(self._reader.read_latest(1))
+
+        # A source that resumes clears the flag
+        self._writer.write(self._frame(2))
+        self.assertFalse(self._reader.end_of_stream)
+
+    def test_reader_cannot_mark_end_of_stream(self) -> None:
+        with self.assertRaises(PermissionError):
+            self._reader.mark_end_of_stream()
+
+    def test_recreated_ring_is_detected(self) -> None:
+        self.assertFalse(self._reader.is_replaced())
+        replacement = FrameRingBuffer.create(self._path, pyramid_slot_capacity([(4, 6)]), self._slot_count)
+        try:
+            self.assertTrue(self._reader.is_replaced())
+        finally:
+            replacement.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import argparse
+import time
+
+import cv2
+
+from globals.consts.consts import Consts
+from infrastructure.shared_memory.frame_clip import FrameClipWriter
+
+
+# Records any video source (file or rtsp://) into a FrameClip for replay:// sources.
+# Run from the src directory: python -m tools.capture_clip <source> <output> [--max-frames N]
+
+def capture_clip(source: str, output_path: str, width: int, height: int, max_frames: int = 0) -> int:
+    is_rtsp = source.startswith("rtsp://")
+    cap = cv2.VideoCapture(source, cv2.CAP_FFMPEG) if is_rtsp else cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise ValueError(f"Cannot open video source: {source}")
+
+    writer = None
+    try:
+        while max_frames <= 0 or writer is None or writer.frame_count < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            # Files keep their presentation timestamps; live streams are stamped on arrival
+            timestamp_ns = time.monotonic_ns() if is_rtsp else int(cap.get(cv2.CAP_PROP_POS_MSEC) * 1e6)
+
+            frame_width = width or frame.shape[1]
+            frame_height = height or frame.shape[0]
+            if writer is None:
+                writer = FrameClipWriter(output_path, frame_height, frame_width, frame.shape[2])
+            if frame.shape[:2] != (frame_height, frame_width):
+                frame = cv2.resize(frame, (frame_width, frame_height))
+            writer.write(frame, timestamp_ns)
+    finally:
+        cap.release()
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError(f"No frames read from video source: {source}")
+    return writer.frame_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Capture a video source into a replayable raw frame clip")
+    parser.add_argument("source", help="video file path or rtsp:// URL")
+    parser.add_argument("output", help="clip file to write, then use replay://<output> as video_path")
+    parser.add_argument("--max-frames", type=int, default=0, help="stop after this many frames (0 = until the end)")
+    parser.add_argument("--width", type=int, default=Consts.ALGO_FRAME_WIDTH,
+                        help="stored frame width (0 = source size)")
+    parser.add_argument("--height", type=int, default=Consts.ALGO_FRAME_HEIGHT,
+                        help="stored frame height (0 = source size)")
+    args = parser.parse_args()
+
+    frame_count = capture_clip(args.source, args.output, args.width, args.height, args.max_frames)
+    print(f"Captured {frame_count} frames from {args.source} into {args.output}")
+
+
+if __name__ == "__main__":
+    main()